@@ -6,6 +6,7 @@ from typing import Any
 from wrapt import ObjectProxy
 
 from coredis.typing import (
+    Dict,
     Hashable,
     Iterable,
     List,
@@ -17,6 +18,7 @@ from coredis.typing import (
     Tuple,
     TypeVar,
     Union,
+    ValueT,
 )
 
 T = TypeVar("T")
@@ -192,7 +194,7 @@ def make_hashable(*args: Any) -> Tuple[Hashable, ...]:
 # ++++++++++ cluster utils ++++++++++++++
 
 try:
-    from coredis.speedups import crc16, hash_slot
+    from coredis.speedups import crc16, group_by_slot, hash_slot, hash_slots
 except ImportError:
     x_mode_m_crc16_lookup = [
         0x0000,
@@ -474,9 +476,22 @@ except ImportError:
 
         return crc16(key) % 16384
 
+    def hash_slots(keys: Iterable[ValueT]) -> List[int]:
+        return [hash_slot(b(key)) for key in keys]
+
+    def group_by_slot(keys: Iterable[ValueT]) -> Dict[int, List[ValueT]]:
+        groups: Dict[int, List[ValueT]] = {}
+
+        for key in keys:
+            groups.setdefault(hash_slot(b(key)), []).append(key)
+
+        return groups
+
 
 __all__ = [
+    "group_by_slot",
     "hash_slot",
+    "hash_slots",
     "EncodingInsensitiveDict",
     "CaseAndEncodingInsensitiveEnum",
 ]
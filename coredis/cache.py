@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import dataclasses
 import time
+import warnings
 import weakref
 from abc import ABC, abstractmethod
 from collections import Counter
@@ -13,15 +14,21 @@ from coredis._utils import b, make_hashable
 from coredis.commands import PubSub
 from coredis.connection import BaseConnection
 from coredis.typing import (
+    Awaitable,
+    Callable,
     Dict,
     Generic,
     Hashable,
+    Iterable,
     List,
     Literal,
     Optional,
     OrderedDict,
+    Parameters,
     Protocol,
     ResponseType,
+    Set,
+    StringT,
     Tuple,
     TypeVar,
     Union,
@@ -29,12 +36,6 @@ from coredis.typing import (
     runtime_checkable,
 )
 
-try:
-    from pympler import asizeof
-# Not available in pypy
-except AttributeError:
-    asizeof = None
-
 if TYPE_CHECKING:
     import coredis.client
 
@@ -237,21 +238,161 @@ class SupportsClientTracking(Protocol):
         ...
 
 
+@runtime_checkable
+class SupportsCoalescing(Protocol):
+    """
+    If a cache implements :class:`SupportsCoalescing`, concurrent cache misses for
+    the same command, key and arguments are coalesced into a single request to the
+    server through :meth:`coalesce`.
+    """
+
+    @abstractmethod
+    async def coalesce(
+        self,
+        command: bytes,
+        key: bytes,
+        *args: ValueT,
+        fetch: Callable[[], Awaitable[ResponseType]],
+    ) -> ResponseType:
+        """
+        Returns the response of :paramref:`fetch` after caching it. If a request for
+        the same command, key and arguments is already in flight the response of
+        that request is returned instead of calling :paramref:`fetch`. Responses
+        of requests that were in flight when :paramref:`key` was invalidated are
+        not cached.
+        """
+        ...
+
+
+@runtime_checkable
+class SupportsBroadcastTracking(Protocol):
+    """
+    If a cache implements :class:`SupportsBroadcastTracking` (in addition to
+    :class:`SupportsClientTracking`) and :attr:`tracking_prefixes` is not ``None``
+    the :class:`~coredis.Redis` and :class:`~coredis.RedisCluster` clients will
+    enable client tracking in broadcasting mode (``BCAST``) for keys starting with
+    the prefixes instead of the default mode (in which the server remembers every
+    key read by the client).
+    """
+
+    @property
+    @abstractmethod
+    def tracking_prefixes(self) -> Optional[Tuple[bytes, ...]]:
+        """
+        The key prefixes to receive invalidations for
+        """
+        ...
+
+
+class PrefixTrie:
+    """
+    Index of (non overlapping) key prefixes that checks whether a key starts with
+    any of them in time proportional to the length of the key
+    """
+
+    #: Marks the end of a prefix in a node of the trie
+    _TERMINAL = -1
+
+    def __init__(self, prefixes: Iterable[bytes] = ()) -> None:
+        self.__root: Dict[int, Any] = {}
+        self.__prefixes: List[bytes] = []
+
+        for prefix in prefixes:
+            self.add(prefix)
+
+    @property
+    def prefixes(self) -> Tuple[bytes, ...]:
+        return tuple(self.__prefixes)
+
+    def add(self, prefix: bytes) -> None:
+        """
+        :raises ValueError: if :paramref:`prefix` overlaps with a prefix that
+         was already added (which is not accepted by ``CLIENT TRACKING``)
+        """
+        node = self.__root
+
+        for byte in prefix:
+            if self._TERMINAL in node:
+                raise ValueError(f"Prefix {prefix!r} overlaps with an existing prefix")
+            node = node.setdefault(byte, {})
+
+        if node:
+            raise ValueError(f"Prefix {prefix!r} overlaps with an existing prefix")
+        node[self._TERMINAL] = True
+        self.__prefixes.append(prefix)
+
+    def matches(self, key: bytes) -> bool:
+        """
+        Whether :paramref:`key` starts with any of the prefixes
+        """
+        node = self.__root
+
+        for byte in key:
+            if self._TERMINAL in node:
+                return True
+            child = node.get(byte)
+
+            if child is None:
+                return False
+            node = child
+
+        return self._TERMINAL in node
+
+
 ET = TypeVar("ET")
 
 
+#: Approximate memory (in bytes) used by an object regardless of its contents
+_OBJECT_OVERHEAD = 48
+#: Approximate memory (in bytes) used by a reference to an object in a container
+_REFERENCE_OVERHEAD = 8
+#: Approximate memory (in bytes) used by the bookkeeping of an entry in an LRUCache
+_ENTRY_OVERHEAD = 64
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Cheap approximation of the memory (in bytes) used by a response or a cache
+    key. Unlike a deep traversal with :func:`sys.getsizeof` this only accounts for
+    the length of the data and a fixed overhead per object.
+    """
+    if isinstance(value, (bytes, bytearray, str)):
+        return _OBJECT_OVERHEAD + len(value)
+    if isinstance(value, dict):
+        return _OBJECT_OVERHEAD + sum(
+            estimate_size(k) + estimate_size(v) + 2 * _REFERENCE_OVERHEAD
+            for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return _OBJECT_OVERHEAD + sum(
+            estimate_size(item) + _REFERENCE_OVERHEAD for item in value
+        )
+    return _OBJECT_OVERHEAD
+
+
 class LRUCache(Generic[ET]):
+    """
+    LRU cache that (approximately) tracks the memory used by its entries as they
+    are inserted and removed (See :func:`estimate_size`). Caches nested as
+    values of another cache report changes in their size to the cache they are
+    stored in so that :paramref:`max_bytes` of the outermost cache bounds the
+    size of all of them.
+    """
+
     def __init__(self, max_items: int = -1, max_bytes: int = -1):
         self.max_items = max_items
         self.max_bytes = max_bytes
         self.__cache: OrderedDict[Hashable, ET] = OrderedDict()
+        self.__sizes: Dict[Hashable, int] = {}
+        self.__size = _OBJECT_OVERHEAD
+        self.__parent: Optional[LRUCache[Any]] = None
 
-        if self.max_bytes > 0 and asizeof is not None:
-            self.max_bytes += asizeof.asizeof(self.__cache)
-        elif self.max_bytes > 0:
-            raise RuntimeError(
-                "max_bytes not supported as dependency pympler not available"
-            )
+    @property
+    def size(self) -> int:
+        """
+        Approximate memory (in bytes) used by the cache and its entries
+        """
+        return self.__size
 
     def get(self, key: Hashable) -> ET:
         if key not in self.__cache:
@@ -261,26 +402,45 @@ class LRUCache(Generic[ET]):
         return self.__cache[key]
 
     def insert(self, key: Hashable, value: ET) -> None:
+        self.remove(key)
         self.__check_capacity()
+        size = _ENTRY_OVERHEAD + estimate_size(key)
+
+        if isinstance(value, LRUCache):
+            value.__parent = self
+            self.__sizes[key] = size
+            size += value.size
+        else:
+            size += estimate_size(value)
+            self.__sizes[key] = size
         self.__cache[key] = value
-        self.__cache.move_to_end(key)
+        self.__resize(size)
 
     def setdefault(self, key: Hashable, value: ET) -> ET:
         try:
-            self.__check_capacity()
-
             return self.get(key)
         except KeyError:
             self.insert(key, value)
 
-            return self.get(key)
+            return value
 
     def remove(self, key: Hashable) -> None:
         if key in self.__cache:
-            self.__cache.pop(key)
+            value = self.__cache.pop(key)
+            size = self.__sizes.pop(key)
+
+            if isinstance(value, LRUCache):
+                value.__parent = None
+                size += value.size
+            self.__resize(-size)
 
     def clear(self) -> None:
+        for value in self.__cache.values():
+            if isinstance(value, LRUCache):
+                value.__parent = None
         self.__cache.clear()
+        self.__sizes.clear()
+        self.__resize(_OBJECT_OVERHEAD - self.__size)
 
     def popitem(self) -> bool:
         """
@@ -298,7 +458,7 @@ class LRUCache(Generic[ET]):
         if isinstance(item, LRUCache):
             if item.popitem():
                 return True
-        self.__cache.popitem(last=False)
+        self.remove(oldest)
 
         return True
 
@@ -309,30 +469,225 @@ class LRUCache(Generic[ET]):
         there is nothing left to remove.
         """
 
-        if self.max_bytes > 0 and asizeof is not None:
-            while asizeof.asizeof(self.__cache) > self.max_bytes:
-                if not self.popitem():
-                    # nothing left to remove
+        while 0 < self.max_bytes < self.__size:
+            if not self.popitem():
+                # nothing left to remove
 
-                    return
+                return
 
     def __repr__(self) -> str:
-        if asizeof is not None:
-            return (
-                f"LruCache<max_items={self.max_items}, "
-                f"current_items={len(self.__cache)}, "
-                f"max_bytes={self.max_bytes}, "
-                f"current_size_bytes={asizeof.asizeof(self)}>"
-            )
-        else:
-            return (
-                f"LruCache<max_items={self.max_items}, "
-                f"current_items={len(self.__cache)}, "
-            )
+        return (
+            f"LruCache<max_items={self.max_items}, "
+            f"current_items={len(self.__cache)}, "
+            f"max_bytes={self.max_bytes}, "
+            f"current_size_bytes={self.__size}>"
+        )
+
+    def __resize(self, delta: int) -> None:
+        self.__size += delta
+
+        if self.__parent is not None:
+            self.__parent.__resize(delta)
+
+        if delta > 0 and 0 < self.max_bytes < self.__size:
+            self.shrink()
 
     def __check_capacity(self) -> None:
         if len(self.__cache) == self.max_items:
-            self.__cache.popitem(last=False)
+            self.remove(next(iter(self.__cache)))
+
+
+CacheKey = Tuple[bytes, bytes, Tuple[Hashable, ...]]
+
+
+class ResponseCache:
+    """
+    LRU cache of responses keyed by ``(key, command, arguments)`` with an index of
+    the entries cached for each key so that all responses related to a key can be
+    invalidated without scanning the cache.
+
+    :paramref:`max_keys` bounds the number of distinct keys (evicting all the
+    entries of the least recently used key) and :paramref:`max_bytes` bounds the
+    approximate size of the cached responses (evicting the least recently used
+    entries, See :func:`estimate_size`).
+    """
+
+    def __init__(self, max_keys: int = -1, max_bytes: int = -1):
+        self.max_keys = max_keys
+        self.max_bytes = max_bytes
+        self.__entries: OrderedDict[CacheKey, ResponseType] = OrderedDict()
+        self.__sizes: Dict[CacheKey, int] = {}
+        self.__keys: OrderedDict[bytes, Set[CacheKey]] = OrderedDict()
+        self.__size = 0
+        self.__requests: Dict[CacheKey, asyncio.Task[ResponseType]] = {}
+        self.__request_keys: Dict[bytes, Set[CacheKey]] = {}
+
+    @property
+    def size(self) -> int:
+        """
+        Approximate memory (in bytes) used by the cached responses
+        """
+        return self.__size
+
+    def get(self, key: bytes, command: bytes, args: Tuple[ValueT, ...]) -> ResponseType:
+        entry = self.__entry(key, command, args)
+        value = self.__entries[entry]
+        self.__entries.move_to_end(entry)
+        self.__keys.move_to_end(key)
+
+        return value
+
+    def put(
+        self,
+        key: bytes,
+        command: bytes,
+        args: Tuple[ValueT, ...],
+        value: ResponseType,
+    ) -> None:
+        self.__store(self.__entry(key, command, args), value)
+
+    async def coalesce(
+        self,
+        key: bytes,
+        command: bytes,
+        args: Tuple[ValueT, ...],
+        fetch: Callable[[], Awaitable[ResponseType]],
+    ) -> ResponseType:
+        """
+        Returns the response of :paramref:`fetch` (caching it) or of an identical
+        request that is already in flight (See :meth:`SupportsCoalescing.coalesce`)
+        """
+        entry = self.__entry(key, command, args)
+        request = self.__requests.get(entry)
+
+        if not request:
+            request = asyncio.ensure_future(self.__fetch(entry, fetch))
+            request.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self.__requests[entry] = request
+            self.__request_keys.setdefault(key, set()).add(entry)
+
+        return await asyncio.shield(request)
+
+    def invalidate(self, key: bytes) -> None:
+        """
+        Removes all the cached responses for :paramref:`key` and ensures that
+        the responses of requests for :paramref:`key` that are in flight are
+        not cached
+        """
+        for entry in self.__request_keys.pop(key, ()):
+            self.__requests.pop(entry)
+        self.__evict(key)
+
+    def clear(self) -> None:
+        """
+        Removes all the cached responses and ensures that the responses of
+        requests that are in flight are not cached. The exception is a request
+        whose own task clears the cache (for example when its connection is
+        resubscribed to invalidations) since it hasn't been sent yet.
+        """
+        try:
+            current = asyncio.current_task()
+        except RuntimeError:
+            current = None
+        self.__requests = {
+            entry: request
+            for entry, request in self.__requests.items()
+            if request is current
+        }
+        self.__request_keys = {}
+        for entry in self.__requests:
+            self.__request_keys.setdefault(entry[0], set()).add(entry)
+        self.__entries.clear()
+        self.__sizes.clear()
+        self.__keys.clear()
+        self.__size = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ResponseCache<max_keys={self.max_keys}, "
+            f"current_keys={len(self.__keys)}, "
+            f"current_entries={len(self.__entries)}, "
+            f"max_bytes={self.max_bytes}, "
+            f"current_size_bytes={self.__size}>"
+        )
+
+    def __evict(self, key: bytes) -> None:
+        for entry in self.__keys.pop(key, ()):
+            self.__entries.pop(entry)
+            self.__size -= self.__sizes.pop(entry)
+
+    def __remove(self, entry: CacheKey) -> None:
+        if entry in self.__entries:
+            self.__entries.pop(entry)
+            self.__size -= self.__sizes.pop(entry)
+            entries = self.__keys[entry[0]]
+            entries.discard(entry)
+
+            if not entries:
+                self.__keys.pop(entry[0])
+
+    def __store(self, entry: CacheKey, value: ResponseType) -> None:
+        key = entry[0]
+        self.__remove(entry)
+
+        if key not in self.__keys:
+            if len(self.__keys) == self.max_keys:
+                self.__evict(next(iter(self.__keys)))
+            self.__keys[key] = set()
+        else:
+            self.__keys.move_to_end(key)
+        size = _ENTRY_OVERHEAD + estimate_size(entry) + estimate_size(value)
+        self.__keys[key].add(entry)
+        self.__entries[entry] = value
+        self.__sizes[entry] = size
+        self.__size += size
+
+        while 0 < self.max_bytes < self.__size:
+            self.__remove(next(iter(self.__entries)))
+
+    async def __fetch(
+        self, entry: CacheKey, fetch: Callable[[], Awaitable[ResponseType]]
+    ) -> ResponseType:
+        try:
+            value = await fetch()
+
+            if self.__requests.get(entry) is asyncio.current_task():
+                self.__store(entry, value)
+
+            return value
+        finally:
+            if self.__requests.get(entry) is asyncio.current_task():
+                self.__requests.pop(entry)
+                entries = self.__request_keys[entry[0]]
+                entries.discard(entry)
+
+                if not entries:
+                    self.__request_keys.pop(entry[0])
+
+    @staticmethod
+    def __entry(key: bytes, command: bytes, args: Tuple[ValueT, ...]) -> CacheKey:
+        try:
+            hash(args)
+
+            return key, command, args
+        except TypeError:
+            return key, command, make_hashable(*args)
+
+
+def _response_cache(
+    cache: Optional[Union[ResponseCache, LRUCache[Any]]],
+    max_keys: int,
+    max_size_bytes: int,
+) -> ResponseCache:
+    if isinstance(cache, LRUCache):
+        warnings.warn(
+            "Passing an LRUCache as the response cache is deprecated, "
+            "use a ResponseCache instead",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        return ResponseCache(cache.max_items, cache.max_bytes)
+    return cache if cache is not None else ResponseCache(max_keys, max_size_bytes)
 
 
 class NodeTrackingCache(
@@ -341,6 +696,8 @@ class NodeTrackingCache(
     SupportsStats,
     SupportsSampling,
     SupportsClientTracking,
+    SupportsBroadcastTracking,
+    SupportsCoalescing,
 ):
     """
     An LRU cache that uses server assisted client caching
@@ -355,8 +712,9 @@ class NodeTrackingCache(
         max_idle_seconds: int = 5,
         confidence: float = 100,
         dynamic_confidence: bool = False,
-        cache: Optional[LRUCache[LRUCache[LRUCache[ResponseType]]]] = None,
+        cache: Optional[Union[ResponseCache, LRUCache[Any]]] = None,
         stats: Optional[CacheStats] = None,
+        prefixes: Optional[Parameters[StringT]] = None,
     ) -> None:
         """
         :param max_keys: maximum keys to cache. A negative value represents
@@ -372,6 +730,19 @@ class NodeTrackingCache(
          sampled validations. Tainted values drop the confidence by 0.1% and
          confirmations of correct cached values will increase the confidence by 0.01%
          upto 100.
+        :param prefixes: If provided client tracking is enabled in broadcasting
+         mode (``BCAST``) for keys starting with these prefixes and only responses
+         for such keys are cached. The server then does not need to remember the
+         keys read by each client at the cost of sending invalidations for every
+         modified key under the prefixes.
+        :param cache: the store for the cached responses. The same instance
+         can be shared by multiple caches.
+
+        .. versionchanged:: 4.15.0
+
+           :paramref:`cache` expects a :class:`ResponseCache`. Passing an
+           ``LRUCache`` is deprecated and only its limits are used to
+           create a new :class:`ResponseCache`.
         """
         super().__init__({b"invalidate"}, max(1, max_idle_seconds - 1))
         self.__protocol_version: Optional[Literal[2, 3]] = None
@@ -381,9 +752,12 @@ class NodeTrackingCache(
         self.__confidence = self.__original_confidence = confidence
         self.__dynamic_confidence = dynamic_confidence
         self.__stats = stats or CacheStats()
-        self.__cache: LRUCache[LRUCache[LRUCache[ResponseType]]] = cache or LRUCache(
-            max_keys, max_size_bytes
+        self.__prefixes = (
+            PrefixTrie(b(prefix) for prefix in prefixes)
+            if prefixes is not None
+            else None
         )
+        self.__cache = _response_cache(cache, max_keys, max_size_bytes)
 
     @property
     def healthy(self) -> bool:
@@ -401,9 +775,15 @@ class NodeTrackingCache(
     def stats(self) -> CacheStats:
         return self.__stats
 
+    @property
+    def tracking_prefixes(self) -> Optional[Tuple[bytes, ...]]:
+        return self.__prefixes.prefixes if self.__prefixes else None
+
     def get(self, command: bytes, key: bytes, *args: ValueT) -> ResponseType:
+        if not self.__tracked(key):
+            raise KeyError(key)
         try:
-            cached = self.__cache.get(b(key)).get(command).get(make_hashable(*args))
+            cached = self.__cache.get(b(key), command, args)
             self.__stats.hit(key)
 
             return cached
@@ -414,14 +794,28 @@ class NodeTrackingCache(
     def put(
         self, command: bytes, key: bytes, *args: ValueT, value: ResponseType
     ) -> None:
-        self.__cache.setdefault(b(key), LRUCache()).setdefault(
-            command, LRUCache()
-        ).insert(make_hashable(*args), value)
+        if self.__tracked(key):
+            self.__cache.put(b(key), command, args, value)
+
+    async def coalesce(
+        self,
+        command: bytes,
+        key: bytes,
+        *args: ValueT,
+        fetch: Callable[[], Awaitable[ResponseType]],
+    ) -> ResponseType:
+        if not self.__tracked(key):
+            return await fetch()
+
+        return await self.__cache.coalesce(b(key), command, args, fetch)
+
+    def __tracked(self, key: bytes) -> bool:
+        return self.__prefixes is None or self.__prefixes.matches(b(key))
 
     def invalidate(self, *keys: ValueT) -> None:
         for key in keys:
             self.__stats.invalidate(key)
-            self.__cache.remove(b(key))
+            self.__cache.invalidate(b(key))
 
     def feedback(self, command: bytes, key: bytes, *args: ValueT, match: bool) -> None:
         if not match:
@@ -502,7 +896,6 @@ class NodeTrackingCache(
     async def __compact(self) -> None:
         while True:
             try:
-                self.__cache.shrink()
                 self.__stats.compact()
                 await asyncio.sleep(max(1, self.__max_idle_seconds - 1))
             except asyncio.CancelledError:
@@ -521,7 +914,12 @@ class NodeTrackingCache(
 
 
 class ClusterTrackingCache(
-    AbstractCache, SupportsStats, SupportsSampling, SupportsClientTracking
+    AbstractCache,
+    SupportsStats,
+    SupportsSampling,
+    SupportsClientTracking,
+    SupportsBroadcastTracking,
+    SupportsCoalescing,
 ):
     """
     An LRU cache for redis cluster that uses server assisted client caching
@@ -539,8 +937,9 @@ class ClusterTrackingCache(
         max_idle_seconds: int = 5,
         confidence: float = 100,
         dynamic_confidence: bool = False,
-        cache: Optional[LRUCache[LRUCache[LRUCache[ResponseType]]]] = None,
+        cache: Optional[Union[ResponseCache, LRUCache[Any]]] = None,
         stats: Optional[CacheStats] = None,
+        prefixes: Optional[Parameters[StringT]] = None,
     ) -> None:
         """
         :param max_keys: maximum keys to cache. A negative value represents
@@ -556,17 +955,33 @@ class ClusterTrackingCache(
          sampled validations. Tainted values drop the confidence by 0.1% and
          confirmations of correct cached values will increase the confidence by 0.01%
          upto 100.
+        :param prefixes: If provided client tracking is enabled in broadcasting
+         mode (``BCAST``) for keys starting with these prefixes and only responses
+         for such keys are cached. The server then does not need to remember the
+         keys read by each client at the cost of sending invalidations for every
+         modified key under the prefixes.
+        :param cache: the store for the cached responses. The same instance
+         can be shared by multiple caches.
+
+        .. versionchanged:: 4.15.0
+
+           :paramref:`cache` expects a :class:`ResponseCache`. Passing an
+           ``LRUCache`` is deprecated and only its limits are used to
+           create a new :class:`ResponseCache`.
         """
         self.node_caches: Dict[str, NodeTrackingCache] = {}
         self.__protocol_version: Optional[Literal[2, 3]] = None
-        self.__cache: LRUCache[LRUCache[LRUCache[ResponseType]]] = cache or LRUCache(
-            max_keys, max_size_bytes
-        )
+        self.__cache = _response_cache(cache, max_keys, max_size_bytes)
         self.__nodes: List["coredis.client.Redis[Any]"] = []
         self.__max_idle_seconds = max_idle_seconds
         self.__confidence = self.__original_confidence = confidence
         self.__dynamic_confidence = dynamic_confidence
         self.__stats = stats or CacheStats()
+        self.__prefixes = (
+            PrefixTrie(b(prefix) for prefix in prefixes)
+            if prefixes is not None
+            else None
+        )
         self.__client: Optional[
             weakref.ReferenceType["coredis.client.RedisCluster[Any]"]
         ] = None
@@ -594,6 +1009,7 @@ class ClusterTrackingCache(
                 dynamic_confidence=self.__dynamic_confidence,
                 cache=self.__cache,
                 stats=self.__stats,
+                prefixes=self.tracking_prefixes,
             )
             await node_cache.initialize(node)
             assert node_cache.connection
@@ -625,6 +1041,10 @@ class ClusterTrackingCache(
     def stats(self) -> CacheStats:
         return self.__stats
 
+    @property
+    def tracking_prefixes(self) -> Optional[Tuple[bytes, ...]]:
+        return self.__prefixes.prefixes if self.__prefixes else None
+
     def get_client_id(self, connection: BaseConnection) -> Optional[int]:
         try:
             return self.node_caches[connection.location].get_client_id(connection)
@@ -632,8 +1052,10 @@ class ClusterTrackingCache(
             return None
 
     def get(self, command: bytes, key: bytes, *args: ValueT) -> ResponseType:
+        if not self.__tracked(key):
+            raise KeyError(key)
         try:
-            cached = self.__cache.get(b(key)).get(command).get(make_hashable(*args))
+            cached = self.__cache.get(b(key), command, args)
             self.__stats.hit(key)
 
             return cached
@@ -644,14 +1066,28 @@ class ClusterTrackingCache(
     def put(
         self, command: bytes, key: bytes, *args: ValueT, value: ResponseType
     ) -> None:
-        self.__cache.setdefault(b(key), LRUCache()).setdefault(
-            command, LRUCache()
-        ).insert(make_hashable(*args), value)
+        if self.__tracked(key):
+            self.__cache.put(b(key), command, args, value)
+
+    async def coalesce(
+        self,
+        command: bytes,
+        key: bytes,
+        *args: ValueT,
+        fetch: Callable[[], Awaitable[ResponseType]],
+    ) -> ResponseType:
+        if not self.__tracked(key):
+            return await fetch()
+
+        return await self.__cache.coalesce(b(key), command, args, fetch)
+
+    def __tracked(self, key: bytes) -> bool:
+        return self.__prefixes is None or self.__prefixes.matches(b(key))
 
     def invalidate(self, *keys: ValueT) -> None:
         for key in keys:
             self.__stats.invalidate(key)
-            self.__cache.remove(b(key))
+            self.__cache.invalidate(b(key))
 
     def feedback(self, command: bytes, key: bytes, *args: ValueT, match: bool) -> None:
         if not match:
@@ -681,7 +1117,12 @@ class ClusterTrackingCache(
 
 
 class TrackingCache(
-    AbstractCache, SupportsStats, SupportsSampling, SupportsClientTracking
+    AbstractCache,
+    SupportsStats,
+    SupportsSampling,
+    SupportsClientTracking,
+    SupportsBroadcastTracking,
+    SupportsCoalescing,
 ):
     """
     An LRU cache that uses server assisted client caching to ensure local cache entries
@@ -699,8 +1140,9 @@ class TrackingCache(
         max_idle_seconds: int = 5,
         confidence: float = 100.0,
         dynamic_confidence: bool = False,
-        cache: Optional[LRUCache[LRUCache[LRUCache[ResponseType]]]] = None,
+        cache: Optional[Union[ResponseCache, LRUCache[Any]]] = None,
         stats: Optional[CacheStats] = None,
+        prefixes: Optional[Parameters[StringT]] = None,
     ) -> None:
         """
         :param max_keys: maximum keys to cache. A negative value represents
@@ -716,6 +1158,19 @@ class TrackingCache(
          sampled validations. Tainted values drop the confidence by 0.1% and
          confirmations of correct cached values will increase the confidence by 0.01%
          upto 100.
+        :param prefixes: If provided client tracking is enabled in broadcasting
+         mode (``BCAST``) for keys starting with these prefixes and only responses
+         for such keys are cached. The server then does not need to remember the
+         keys read by each client at the cost of sending invalidations for every
+         modified key under the prefixes.
+        :param cache: the store for the cached responses. The same instance
+         can be shared by multiple caches.
+
+        .. versionchanged:: 4.15.0
+
+           :paramref:`cache` expects a :class:`ResponseCache`. Passing an
+           ``LRUCache`` is deprecated and only its limits are used to
+           create a new :class:`ResponseCache`.
         """
         self.instance: Optional[Union[ClusterTrackingCache, NodeTrackingCache]] = None
         self.__max_keys = max_keys
@@ -723,15 +1178,18 @@ class TrackingCache(
         self.__max_idle_seconds = max_idle_seconds
         self.__confidence = confidence
         self.__dynamic_confidence = dynamic_confidence
-        self.__cache: LRUCache[LRUCache[LRUCache[ResponseType]]] = cache or LRUCache(
-            max_keys, max_size_bytes
-        )
+        self.__cache = _response_cache(cache, max_keys, max_size_bytes)
         self.__client: Optional[
             weakref.ReferenceType[
                 Union["coredis.client.Redis[Any]", "coredis.client.RedisCluster[Any]"],
             ]
         ] = None
         self.__stats = stats or CacheStats()
+        self.__prefixes = (
+            PrefixTrie(b(prefix) for prefix in prefixes)
+            if prefixes is not None
+            else None
+        )
 
     async def initialize(
         self,
@@ -756,6 +1214,7 @@ class TrackingCache(
                     dynamic_confidence=self.__dynamic_confidence,
                     cache=self.__cache,
                     stats=self.__stats,
+                    prefixes=self.tracking_prefixes,
                 )
             else:
                 self.instance = NodeTrackingCache(
@@ -766,6 +1225,7 @@ class TrackingCache(
                     dynamic_confidence=self.__dynamic_confidence,
                     cache=self.__cache,
                     stats=self.__stats,
+                    prefixes=self.tracking_prefixes,
                 )
         await self.instance.initialize(client)
 
@@ -786,6 +1246,10 @@ class TrackingCache(
     def stats(self) -> CacheStats:
         return self.__stats
 
+    @property
+    def tracking_prefixes(self) -> Optional[Tuple[bytes, ...]]:
+        return self.__prefixes.prefixes if self.__prefixes else None
+
     def get_client_id(self, connection: BaseConnection) -> Optional[int]:
         if self.instance:
             return self.instance.get_client_id(connection)
@@ -803,6 +1267,18 @@ class TrackingCache(
         if self.instance:
             self.instance.put(command, key, *args, value=value)
 
+    async def coalesce(
+        self,
+        command: bytes,
+        key: bytes,
+        *args: ValueT,
+        fetch: Callable[[], Awaitable[ResponseType]],
+    ) -> ResponseType:
+        if self.instance:
+            return await self.instance.coalesce(command, key, *args, fetch=fetch)
+
+        return await fetch()
+
     def invalidate(self, *keys: ValueT) -> None:
         if self.instance:
             self.instance.invalidate(*keys)
@@ -840,6 +1316,7 @@ class TrackingCache(
             self.__dynamic_confidence,
             self.__cache,
             self.__stats,
+            self.tracking_prefixes,
         )
 
         return copy
@@ -14,13 +14,18 @@ from packaging import version
 from packaging.version import InvalidVersion, Version
 
 from coredis._utils import EncodingInsensitiveDict, nativestr
-from coredis.cache import AbstractCache, SupportsClientTracking
+from coredis.cache import (
+    AbstractCache,
+    SupportsBroadcastTracking,
+    SupportsClientTracking,
+)
 from coredis.commands._key_spec import KeySpec
+from coredis.commands._utils import prefetch_pages
 from coredis.commands.constants import CommandFlag, CommandName
 from coredis.commands.core import CoreCommands
 from coredis.commands.function import Library
 from coredis.commands.monitor import Monitor
-from coredis.commands.pubsub import PubSub
+from coredis.commands.pubsub import PubSub, SubscriptionHub
 from coredis.commands.script import Script
 from coredis.commands.sentinel import SentinelCommands
 from coredis.config import Config
@@ -343,14 +348,14 @@ class Client(
         """
         Make an iterator using the SCAN command so that the client doesn't
         need to remember the cursor position.
-        """
-        cursor = None
 
-        while cursor != 0:
-            cursor, data = await self.scan(
+        The next page is requested while the current one is being consumed.
+        """
+        async for data in prefetch_pages(
+            lambda cursor: self.scan(
                 cursor=cursor, match=match, count=count, type_=type_
             )
-
+        ):
             for item in data:
                 yield item
 
@@ -363,14 +368,12 @@ class Client(
         """
         Make an iterator using the SSCAN command so that the client doesn't
         need to remember the cursor position.
-        """
-        cursor = None
-
-        while cursor != 0:
-            cursor, data = await self.sscan(
-                key, cursor=cursor, match=match, count=count
-            )
 
+        The next page is requested while the current one is being consumed.
+        """
+        async for data in prefetch_pages(
+            lambda cursor: self.sscan(key, cursor=cursor, match=match, count=count)
+        ):
             for item in data:
                 yield item
 
@@ -383,14 +386,12 @@ class Client(
         """
         Make an iterator using the HSCAN command so that the client doesn't
         need to remember the cursor position.
-        """
-        cursor = None
-
-        while cursor != 0:
-            cursor, data = await self.hscan(
-                key, cursor=cursor, match=match, count=count
-            )
 
+        The next page is requested while the current one is being consumed.
+        """
+        async for data in prefetch_pages(
+            lambda cursor: self.hscan(key, cursor=cursor, match=match, count=count)
+        ):
             for item in data.items():
                 yield item
 
@@ -403,17 +404,12 @@ class Client(
         """
         Make an iterator using the ZSCAN command so that the client doesn't
         need to remember the cursor position.
-        """
-        cursor = None
-
-        while cursor != 0:
-            cursor, data = await self.zscan(
-                key,
-                cursor=cursor,
-                match=match,
-                count=count,
-            )
 
+        The next page is requested while the current one is being consumed.
+        """
+        async for data in prefetch_pages(
+            lambda cursor: self.zscan(key, cursor=cursor, match=match, count=count)
+        ):
             for item in data:
                 yield item
 
@@ -961,7 +957,11 @@ class Redis(Client[AnyStr]):
         ):
             self.cache.reset()
             await connection.update_tracking_client(
-                True, self.cache.get_client_id(connection)
+                True,
+                self.cache.get_client_id(connection),
+                self.cache.tracking_prefixes
+                if isinstance(self.cache, SupportsBroadcastTracking)
+                else None,
             )
         try:
             if self.cache and command not in READONLY_COMMANDS:
@@ -1076,6 +1076,37 @@ class Redis(Client[AnyStr]):
             **kwargs,
         )
 
+    def subscription_hub(
+        self,
+        connections: int = 1,
+        max_buffered_messages: int = 1024,
+        overflow: Literal["drop_oldest", "drop_newest", "raise"] = "drop_oldest",
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> SubscriptionHub[AnyStr]:
+        """
+        Return a :class:`~coredis.commands.pubsub.SubscriptionHub` that shares
+        :paramref:`connections` Pub/Sub connection(s) between any number of local
+        subscribers created with
+        :meth:`~coredis.commands.pubsub.SubscriptionHub.subscriber`.
+
+        :param connections: Number of Pub/Sub connections to spread the
+         subscriptions over
+        :param max_buffered_messages: Default maximum number of messages buffered
+         per subscriber
+        :param overflow: Default policy applied when the buffer of a subscriber is
+         full (See :class:`~coredis.commands.pubsub.SubscriptionHub`)
+        :param retry_policy: An explicit retry policy to use in the Pub/Sub
+         connections.
+
+        .. versionadded:: 4.15.0
+        """
+        return SubscriptionHub[AnyStr](
+            lambda: self.pubsub(retry_policy=retry_policy),
+            connections=connections,
+            max_buffered_messages=max_buffered_messages,
+            overflow=overflow,
+        )
+
     async def pipeline(
         self,
         transaction: Optional[bool] = True,
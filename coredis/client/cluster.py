@@ -3,27 +3,36 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import contextvars
+import dataclasses
 import functools
 import inspect
 import textwrap
+import time
 from abc import ABCMeta
 from ssl import SSLContext
 from typing import TYPE_CHECKING, Any, cast, overload
 
+import async_timeout
 from deprecated.sphinx import versionadded
 
-from coredis._utils import b, hash_slot
-from coredis.cache import AbstractCache, SupportsClientTracking
+from coredis._utils import hash_slots
+from coredis.cache import (
+    AbstractCache,
+    SupportsBroadcastTracking,
+    SupportsClientTracking,
+)
 from coredis.client.basic import Client, Redis
 from coredis.commands._key_spec import KeySpec
+from coredis.commands._utils import prefetch_pages
 from coredis.commands.constants import CommandName, NodeFlag
-from coredis.commands.pubsub import ClusterPubSub, ShardedPubSub
-from coredis.connection import RedisSSLContext
+from coredis.commands.pubsub import ClusterPubSub, ShardedPubSub, SubscriptionHub
+from coredis.connection import ClusterConnection, CommandInvocation, RedisSSLContext
 from coredis.exceptions import (
     AskError,
     BusyLoadingError,
     ClusterDownError,
     ClusterError,
+    ClusterRoutingError,
     ConnectionError,
     MovedError,
     RedisClusterException,
@@ -34,10 +43,24 @@ from coredis.exceptions import (
 from coredis.globals import MODULE_GROUPS, READONLY_COMMANDS
 from coredis.pool import ClusterConnectionPool
 from coredis.pool.nodemanager import ManagedNode
-from coredis.response._callbacks import AsyncPreProcessingCallback, NoopCallback
-from coredis.retry import CompositeRetryPolicy, ConstantRetryPolicy, RetryPolicy
+from coredis.pool.selection import ReplicaSelector
+from coredis.pool.topology import TopologyStore
+from coredis.response._callbacks import (
+    AsyncPreProcessingCallback,
+    ClusterAlignedTuples,
+    ClusterConcatenateTuples,
+    ClusterMergeSets,
+    NoopCallback,
+)
+from coredis.retry import (
+    CircuitBreaker,
+    CompositeRetryPolicy,
+    ConstantRetryPolicy,
+    RetryPolicy,
+)
 from coredis.typing import (
     AnyStr,
+    AsyncGenerator,
     AsyncIterator,
     Awaitable,
     Callable,
@@ -58,6 +81,7 @@ from coredis.typing import (
     Tuple,
     Type,
     TypeVar,
+    Union,
     ValueT,
 )
 
@@ -68,6 +92,39 @@ if TYPE_CHECKING:
     import coredis.pipeline
 
 
+@dataclasses.dataclass
+class FanOut:
+    """
+    Settings for commands that are sent to multiple nodes of the cluster
+    within a :meth:`~coredis.RedisCluster.fan_out` context, along with the
+    nodes that did not respond in time.
+    """
+
+    #: Maximum number of nodes to wait on concurrently (``None`` for no limit)
+    concurrency: Optional[int] = None
+    #: Seconds to wait for each node before excluding its response from the result
+    node_timeout: Optional[float] = None
+    #: Names of the nodes that did not respond within :attr:`node_timeout`
+    timed_out: Set[str] = dataclasses.field(default_factory=set)
+
+
+@dataclasses.dataclass
+class _SlotBatch:
+    slot: int
+    args: Tuple[ValueT, ...]
+    #: Positions of the keys in this batch amongst all the keys of the command
+    positions: List[int]
+
+
+@dataclasses.dataclass
+class _FanOutStream:
+    queue: asyncio.Queue[Optional[Iterable[Any]]] = dataclasses.field(
+        default_factory=asyncio.Queue
+    )
+    unique: bool = False
+    streamed: bool = False
+
+
 class ClusterMeta(ABCMeta):
     ROUTING_FLAGS: Dict[bytes, NodeFlag]
     SPLIT_FLAGS: Dict[bytes, NodeFlag]
@@ -203,6 +260,9 @@ class RedisCluster(
         noevict: bool = ...,
         notouch: bool = ...,
         retry_policy: RetryPolicy = ...,
+        circuit_breaker: Optional[CircuitBreaker] = ...,
+        replica_selector: Optional[ReplicaSelector] = ...,
+        topology_store: Optional[TopologyStore] = ...,
         **kwargs: Any,
     ) -> None:
         ...
@@ -241,6 +301,9 @@ class RedisCluster(
         noevict: bool = ...,
         notouch: bool = ...,
         retry_policy: RetryPolicy = ...,
+        circuit_breaker: Optional[CircuitBreaker] = ...,
+        replica_selector: Optional[ReplicaSelector] = ...,
+        topology_store: Optional[TopologyStore] = ...,
         **kwargs: Any,
     ) -> None:
         ...
@@ -288,11 +351,20 @@ class RedisCluster(
                 0.1,
             ),
         ),
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        replica_selector: Optional[ReplicaSelector] = None,
+        topology_store: Optional[TopologyStore] = None,
         **kwargs: Any,
     ) -> None:
         """
 
         Changes
+          - .. versionadded:: 4.15.0
+
+            - :paramref:`circuit_breaker`
+            - :paramref:`replica_selector`
+            - :paramref:`topology_store`
+
           - .. versionadded:: 4.12.0
 
             - :paramref:`retry_policy`
@@ -420,6 +492,20 @@ class RedisCluster(
         :param notouch: Ensures that commands sent by the client will not alter the LRU/LFU
          of the keys they access.
         :param retry_policy: The retry policy to use when interacting with the cluster
+        :param circuit_breaker: If provided, requests to nodes that have failed repeatedly
+         will fail fast with :exc:`~coredis.exceptions.CircuitOpenError` until the node
+         recovers (See :class:`~coredis.retry.CircuitBreaker`). Ignored if
+         :paramref:`connection_pool` is provided.
+        :param replica_selector: Strategy used to choose which node serving a slot
+         read only commands are routed to when :paramref:`read_from_replicas` is ``True``
+         (See :class:`~coredis.pool.selection.ReplicaSelector`). Ignored if
+         :paramref:`connection_pool` is provided.
+        :param topology_store: If provided, the client routes commands using the
+         last topology saved in the store on startup instead of first querying the
+         startup nodes. The restored topology is verified in the background and every
+         newly discovered topology is saved back to the store
+         (See :class:`~coredis.pool.topology.TopologyStore`). Ignored if
+         :paramref:`connection_pool` is provided.
         """
 
         if "db" in kwargs:  # noqa
@@ -468,6 +554,9 @@ class RedisCluster(
                 notouch=notouch,
                 stream_timeout=stream_timeout,
                 connect_timeout=connect_timeout,
+                circuit_breaker=circuit_breaker,
+                replica_selector=replica_selector,
+                topology_store=topology_store,
                 **kwargs,
             )
 
@@ -500,6 +589,12 @@ class RedisCluster(
         self._encodingcontext: contextvars.ContextVar[
             Optional[str],
         ] = contextvars.ContextVar("decode", default=None)
+        self._fanoutcontext: contextvars.ContextVar[
+            Optional[FanOut]
+        ] = contextvars.ContextVar("fanout", default=None)
+        self._fanoutstream: contextvars.ContextVar[
+            Optional[_FanOutStream]
+        ] = contextvars.ContextVar("fanoutstream", default=None)
 
     @classmethod
     @overload
@@ -698,7 +793,7 @@ class RedisCluster(
         ):
             return set()
 
-        return {hash_slot(b(key)) for key in keys}
+        return set(hash_slots(keys))
 
     def _merge_result(
         self,
@@ -781,28 +876,84 @@ class RedisCluster(
         """
         nodes = self.determine_node(command, **kwargs)
         if nodes and len(nodes) > 1:
-            tasks: Dict[str, Coroutine[Any, Any, R]] = {}
-            node_arg_mapping = self._split_args_over_nodes(nodes, command, *args)
-            node_name_map = {n.name: n for n in nodes}
-            for node_name in node_arg_mapping:
-                for portion, pargs in enumerate(node_arg_mapping[node_name]):
-                    tasks[
-                        f"{node_name}:{portion}"
-                    ] = self._execute_command_on_single_node(
+            tasks: Dict[str, Coroutine[Any, Any, Any]] = {}
+            batches: Dict[str, List[_SlotBatch]] = {}
+            if command in self.split_flags and self.non_atomic_cross_slot:
+                batches = self._split_args_over_nodes(command, *args)
+                for node_name, node_batches in batches.items():
+                    tasks[f"{node_name}:0"] = self._execute_batches_on_node(
                         command,
-                        *pargs,
+                        node_batches,
                         callback=callback,
-                        node=node_name_map[node_name],
+                        node=self.connection_pool.nodes.nodes[node_name],
+                        **kwargs,
+                    )
+            else:
+                # This command is not meant to be split across nodes and each node
+                # should be called with the same arguments
+                for node in nodes:
+                    tasks[f"{node.name}:0"] = self._execute_command_on_single_node(
+                        command,
+                        *args,
+                        callback=callback,
+                        node=node,
                         slots=None,
                         **kwargs,
                     )
 
-            results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+            fan_out = self._fanoutcontext.get()
+            stream = self._fanoutstream.get()
+            if not (fan_out or stream):
+                results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+                if self.noreply:
+                    return None  # type: ignore
+                return cast(
+                    R,
+                    self._merge_result(
+                        command,
+                        self._unbatch_responses(
+                            command, batches, dict(zip(tasks.keys(), results))
+                        ),
+                        **kwargs,
+                    ),
+                )
+            if stream:
+                merge = self.result_callbacks.get(command)
+                if batches or not isinstance(
+                    merge, (ClusterMergeSets, ClusterConcatenateTuples)
+                ):
+                    for request in tasks.values():
+                        request.close()
+                    raise RedisClusterException(
+                        f"Responses of {command.decode('latin-1')} can not be streamed"
+                    )
+                stream.unique = isinstance(merge, ClusterMergeSets)
+                stream.streamed = True
+            responses: Dict[str, Union[R, BaseException]] = {}
+            fanned_out = self._fan_out(tasks, fan_out)
+            try:
+                async for name, response in fanned_out:
+                    if stream:
+                        if isinstance(response, BaseException):
+                            raise response
+                        stream.queue.put_nowait(cast(Iterable[Any], response))
+                    else:
+                        responses[name] = response
+            finally:
+                await fanned_out.aclose()
             if self.noreply:
                 return None  # type: ignore
             return cast(
                 R,
-                self._merge_result(command, dict(zip(tasks.keys(), results)), **kwargs),
+                self._merge_result(
+                    command,
+                    self._unbatch_responses(
+                        command,
+                        batches,
+                        {name: responses[name] for name in tasks if name in responses},
+                    ),
+                    **kwargs,
+                ),
             )
         else:
             node = None
@@ -815,41 +966,241 @@ class RedisCluster(
                 command, *args, callback=callback, node=node, slots=slots, **kwargs
             )
 
+    async def _fan_out(
+        self,
+        tasks: Dict[str, Coroutine[Any, Any, R]],
+        fan_out: Optional[FanOut],
+    ) -> AsyncGenerator[Tuple[str, Union[R, BaseException]], None]:
+        """
+        Runs the per node :paramref:`tasks` within the limits of :paramref:`fan_out`
+        and yields their responses (or errors) in the order they complete.
+        Responses from nodes that exceeded the deadline are skipped and the nodes
+        are recorded in :attr:`FanOut.timed_out`.
+        """
+        limit = (
+            asyncio.Semaphore(fan_out.concurrency)
+            if fan_out and fan_out.concurrency
+            else None
+        )
+        node_timeout = fan_out.node_timeout if fan_out else None
+        pending = [
+            asyncio.ensure_future(
+                self._fan_out_node(name, request, limit, node_timeout)
+            )
+            for name, request in tasks.items()
+        ]
+        try:
+            for next_done in asyncio.as_completed(pending):
+                name, response = await next_done
+                if fan_out and isinstance(response, asyncio.TimeoutError):
+                    fan_out.timed_out.add(name.rsplit(":", 1)[0])
+                    continue
+                yield name, response
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _fan_out_node(
+        self,
+        name: str,
+        request: Coroutine[Any, Any, R],
+        limit: Optional[asyncio.Semaphore],
+        node_timeout: Optional[float],
+    ) -> Tuple[str, Union[R, BaseException]]:
+        try:
+            if limit:
+                await limit.acquire()
+            try:
+                async with async_timeout.timeout(node_timeout):
+                    return name, await request
+            finally:
+                if limit:
+                    limit.release()
+        except asyncio.CancelledError:
+            request.close()
+            raise
+        except Exception as e:
+            return name, e
+
     def _split_args_over_nodes(
         self,
-        nodes: List[ManagedNode],
         command: bytes,
         *args: ValueT,
-    ) -> Dict[str, List[Tuple[ValueT, ...]]]:
-        if command in self.split_flags and self.non_atomic_cross_slot:
-            keys = KeySpec.extract_keys(command, *args)
-            node_arg_mapping: Dict[str, List[Tuple[ValueT, ...]]] = {}
-            if keys:
-                key_start: int = args.index(keys[0])
-                key_end: int = args.index(keys[-1])
-                assert (
-                    args[key_start : 1 + key_end] == keys
-                ), f"Unable to map {command.decode('latin-1')} by keys {keys}"
-
-                for (
-                    node_name,
-                    key_groups,
-                ) in self.connection_pool.nodes.keys_to_nodes_by_slot(*keys).items():
-                    for _, node_keys in key_groups.items():
-                        node_arg_mapping.setdefault(node_name, []).append(
-                            (
-                                *args[:key_start],
-                                *node_keys,  # type: ignore
-                                *args[1 + key_end :],
-                            )
+    ) -> Dict[str, List[_SlotBatch]]:
+        """
+        Groups the keys in :paramref:`args` by slot and the slots by the node
+        serving them, retaining the positions of the keys so that per key
+        responses can be reassembled in the original order.
+        """
+        keys = KeySpec.extract_keys(command, *args)
+        batches: Dict[str, List[_SlotBatch]] = {}
+        if self.cache and command not in READONLY_COMMANDS:
+            self.cache.invalidate(*keys)
+        if not keys:
+            return batches
+        key_start: int = args.index(keys[0])
+        step = (len(args) - key_start) // len(keys)
+        assert step > 0 and len(args) - key_start == step * len(
+            keys
+        ), f"Unable to map {command.decode('latin-1')} by keys {keys}"
+        assert (
+            args[key_start::step] == keys
+        ), f"Unable to map {command.decode('latin-1')} by keys {keys}"
+        positions_by_slot: Dict[int, List[int]] = {}
+        for position, slot in enumerate(hash_slots(keys)):
+            positions_by_slot.setdefault(slot, []).append(position)
+        for slot, positions in positions_by_slot.items():
+            node = self.connection_pool.nodes.node_from_slot(slot)
+            if not node:
+                raise ClusterRoutingError(f"No node is serving slot {slot}")
+            slot_args: List[ValueT] = list(args[:key_start])
+            for position in positions:
+                offset = key_start + position * step
+                slot_args.extend(args[offset : offset + step])
+            batches.setdefault(node.name, []).append(
+                _SlotBatch(slot, tuple(slot_args), positions)
+            )
+        return batches
+
+    def _unbatch_responses(
+        self,
+        command: bytes,
+        batches: Dict[str, List[_SlotBatch]],
+        responses: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Flattens the per node responses of a split command to one response
+        per slot or, for commands that return one value per key, to the
+        values in the order of the keys.
+        """
+        if not batches:
+            return responses
+        aligned: Optional[List[Any]] = None
+        if isinstance(self.result_callbacks.get(command), ClusterAlignedTuples):
+            aligned = [None] * sum(
+                len(batch.positions)
+                for node_batches in batches.values()
+                for batch in node_batches
+            )
+        flattened: Dict[str, Any] = {}
+        for node_name, node_batches in batches.items():
+            name = f"{node_name}:0"
+            if name not in responses:
+                continue
+            if isinstance(responses[name], BaseException):
+                flattened[name] = responses[name]
+                continue
+            for batch, response in zip(node_batches, responses[name]):
+                if aligned is None or isinstance(response, BaseException):
+                    flattened[f"{node_name}:{batch.slot}"] = response
+                else:
+                    for position, value in zip(batch.positions, response):
+                        aligned[position] = value
+        if aligned is not None:
+            flattened["aligned"] = tuple(aligned)
+        return flattened
+
+    async def _execute_batches_on_node(
+        self,
+        command: bytes,
+        batches: List[_SlotBatch],
+        callback: Callable[..., R],
+        node: ManagedNode,
+        **kwargs: Optional[ValueT],
+    ) -> List[Union[R, BaseException]]:
+        """
+        Sends the portions of a split command destined to :paramref:`node`
+        as a single pipelined write on one connection. Portions that are
+        redirected by the server are retried individually.
+        """
+        if self.noreply or len(batches) == 1:
+            return await asyncio.gather(
+                *(
+                    self._execute_command_on_single_node(
+                        command,
+                        *batch.args,
+                        callback=callback,
+                        node=node,
+                        slots=[batch.slot],
+                        **kwargs,
+                    )
+                    for batch in batches
+                ),
+                return_exceptions=True,
+            )
+        connection = await self.connection_pool.get_connection_by_node(node, probe=True)
+        probe = True
+        try:
+            await self._ensure_cache_tracking(connection)
+            requests = await connection.create_requests(
+                [
+                    CommandInvocation(
+                        command,
+                        batch.args,
+                        kwargs.get("decode", self._decodecontext.get()),  # type: ignore
+                        self._encodingcontext.get(),
+                    )
+                    for batch in batches
+                ],
+                raise_exceptions=False,
+            )
+            maybe_wait = [
+                await self._ensure_wait(command, connection),
+                await self._ensure_persistence(command, connection),
+            ]
+            replies = await asyncio.gather(*requests)
+            if self.connection_pool.circuit_breaker:
+                self.connection_pool.circuit_breaker.record_success(node.name)
+            probe = False
+            await asyncio.gather(*maybe_wait)
+        except (ConnectionError, TimeoutError) as e:
+            if self.connection_pool.circuit_breaker:
+                self.connection_pool.circuit_breaker.record_failure(node.name, e)
+            probe = False
+            raise
+        finally:
+            if probe and self.connection_pool.circuit_breaker:
+                self.connection_pool.circuit_breaker.release(node.name)
+            self._ensure_server_version(connection.server_version)
+            self.connection_pool.release(connection)
+        responses: List[Union[R, BaseException]] = []
+        for batch, reply in zip(batches, replies):
+            try:
+                if isinstance(reply, (AskError, TryAgainError)):
+                    responses.append(
+                        await self._execute_command_on_single_node(
+                            command,
+                            *batch.args,
+                            callback=callback,
+                            node=None,
+                            slots=[batch.slot],
+                            **kwargs,
                         )
-            if self.cache and command not in READONLY_COMMANDS:
-                self.cache.invalidate(*keys)
-            return node_arg_mapping
-        else:
-            # This command is not meant to be split across nodes and each node
-            # should be called with the same arguments
-            return {node.name: [args] for node in nodes}
+                    )
+                elif isinstance(reply, BaseException):
+                    responses.append(reply)
+                else:
+                    responses.append(
+                        callback(reply, version=self.protocol_version, **kwargs)
+                    )
+            except Exception as e:
+                responses.append(e)
+        return responses
+
+    async def _ensure_cache_tracking(self, connection: ClusterConnection) -> None:
+        if (
+            isinstance(self.cache, AbstractCache)
+            and isinstance(self.cache, SupportsClientTracking)
+            and connection.tracking_client_id != self.cache.get_client_id(connection)
+        ):
+            self.cache.reset()
+            await connection.update_tracking_client(
+                True,
+                self.cache.get_client_id(connection),
+                self.cache.tracking_prefixes
+                if isinstance(self.cache, SupportsBroadcastTracking)
+                else None,
+            )
 
     async def _execute_command_on_single_node(
         self,
@@ -876,28 +1227,38 @@ class RedisCluster(
             remaining_attempts -= 1
             if self.refresh_table_asap and not slots:
                 await self
+            # whether a circuit breaker probe of the node is outstanding
+            probe = True
             if asking and redirect_addr:
                 node = self.connection_pool.nodes.nodes[redirect_addr]
-                r = await self.connection_pool.get_connection_by_node(node)
+                r = await self.connection_pool.get_connection_by_node(node, probe=True)
             elif try_random_node:
+                probe = False
                 r = await self.connection_pool.get_random_connection(
                     primary=try_random_type == NodeFlag.PRIMARIES
                 )
                 if slots:
                     try_random_node = False
             elif node:
-                r = await self.connection_pool.get_connection_by_node(node)
+                r = await self.connection_pool.get_connection_by_node(node, probe=True)
             elif slots:
                 if self.refresh_table_asap:
                     # MOVED
                     node = self.connection_pool.get_primary_node_by_slots(slots)
                 else:
-                    node = self.connection_pool.get_node_by_slots(slots)
-                r = await self.connection_pool.get_connection_by_node(node)
+                    node = self.connection_pool.get_node_by_slots(slots, command)
+                r = await self.connection_pool.get_connection_by_node(node, probe=True)
             else:
                 continue
             quick_release = self.should_quick_release(command)
             released = False
+            selector = (
+                self.connection_pool.replica_selector
+                if command in READONLY_COMMANDS
+                else None
+            )
+            started_at: Optional[float] = None
+            latency: Optional[float] = None
             try:
                 if asking:
                     request = await r.create_request(
@@ -906,15 +1267,12 @@ class RedisCluster(
                     await request
                     asking = False
 
-                if (
-                    isinstance(self.cache, AbstractCache)
-                    and isinstance(self.cache, SupportsClientTracking)
-                    and r.tracking_client_id != self.cache.get_client_id(r)
-                ):
-                    self.cache.reset()
-                    await r.update_tracking_client(True, self.cache.get_client_id(r))
+                await self._ensure_cache_tracking(r)
                 if self.cache and command not in READONLY_COMMANDS:
                     self.cache.invalidate(*KeySpec.extract_keys(command, *args))
+                if selector:
+                    selector.request_started(r.node)
+                    started_at = time.perf_counter()
                 request = await r.create_request(
                     command,
                     *args,
@@ -927,6 +1285,11 @@ class RedisCluster(
                     self.connection_pool.release(r)
 
                 reply = await request
+                if started_at is not None:
+                    latency = time.perf_counter() - started_at
+                if self.connection_pool.circuit_breaker:
+                    self.connection_pool.circuit_breaker.record_success(r.node.name)
+                probe = False
                 response = None
                 maybe_wait = [
                     await self._ensure_wait(command, r),
@@ -946,6 +1309,11 @@ class RedisCluster(
                 return response  # type: ignore
             except (RedisClusterException, BusyLoadingError, asyncio.CancelledError):
                 raise
+            except (ConnectionError, TimeoutError) as e:
+                if self.connection_pool.circuit_breaker:
+                    self.connection_pool.circuit_breaker.record_failure(r.node.name, e)
+                probe = False
+                raise
             except MovedError as e:
                 # Reinitialize on ever x number of MovedError.
                 # This counter will increase faster when the same client object
@@ -965,6 +1333,10 @@ class RedisCluster(
             except AskError as e:
                 redirect_addr, asking = f"{e.host}:{e.port}", True
             finally:
+                if probe and self.connection_pool.circuit_breaker:
+                    self.connection_pool.circuit_breaker.release(r.node.name)
+                if selector and started_at is not None:
+                    selector.request_finished(r.node, latency)
                 self._ensure_server_version(r.server_version)
                 if not released:
                     self.connection_pool.release(r)
@@ -1018,6 +1390,102 @@ class RedisCluster(
             self._decodecontext.set(prev_decode)
             self._encodingcontext.set(prev_encoding)
 
+    @contextlib.contextmanager
+    def fan_out(
+        self,
+        concurrency: Optional[int] = None,
+        node_timeout: Optional[float] = None,
+    ) -> Iterator[FanOut]:
+        """
+        Context manager to control how commands that are sent to multiple nodes
+        (for example :meth:`keys` or :meth:`dbsize`) are fanned out.
+
+        When :paramref:`node_timeout` is provided, the responses of nodes that don't
+        respond in time are excluded from the merged result instead of failing (or
+        delaying) the whole command and the nodes are added to
+        :attr:`~coredis.client.cluster.FanOut.timed_out` of the object returned by the
+        context manager.
+
+        :param concurrency: Maximum number of nodes to send requests to at the same time
+        :param node_timeout: Seconds to wait for the response from each node
+
+        Example::
+
+            client = coredis.RedisCluster("localhost", 7000)
+            with client.fan_out(concurrency=4, node_timeout=0.5) as fan_out:
+                keys = await client.keys("user:*")
+            if fan_out.timed_out:
+                print(f"Partial result. Missing keys from {fan_out.timed_out}")
+        """
+        fan_out = FanOut(concurrency, node_timeout)
+        previous = self._fanoutcontext.get()
+        self._fanoutcontext.set(fan_out)
+        try:
+            yield fan_out
+        finally:
+            self._fanoutcontext.set(previous)
+
+    async def fan_out_iter(
+        self,
+        command: Callable[P, Awaitable[Iterable[R]]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> AsyncIterator[R]:
+        """
+        Iterate over the merged result of a command that is sent to multiple
+        nodes as the responses arrive from each node instead of waiting for all
+        of them. Only commands whose responses are merged by concatenation or union
+        (for example :meth:`keys` or :meth:`pubsub_channels`) are supported and
+        duplicates are dropped for the latter.
+
+        Any limits set through :meth:`fan_out` apply.
+
+        :param command: The bound client method to call with :paramref:`args`
+         and :paramref:`kwargs`
+
+        Example::
+
+            client = coredis.RedisCluster("localhost", 7000)
+            async for key in client.fan_out_iter(client.keys, "user:*"):
+                print(key)
+        """
+        stream = _FanOutStream()
+        previous = self._fanoutstream.get()
+        self._fanoutstream.set(stream)
+        try:
+            # the task inherits a copy of the current context and therefore the stream
+            task = asyncio.ensure_future(
+                self._stream_command(stream, command(*args, **kwargs))
+            )
+        finally:
+            self._fanoutstream.set(previous)
+        seen: Set[R] = set()
+        try:
+            while True:
+                page = await stream.queue.get()
+                if page is None:
+                    break
+                for item in page:
+                    if stream.unique:
+                        if item in seen:
+                            continue
+                        seen.add(item)
+                    yield item
+            result = await task
+            if not stream.streamed and result:
+                for item in result:
+                    yield item
+        finally:
+            task.cancel()
+
+    async def _stream_command(
+        self, stream: _FanOutStream, request: Awaitable[Iterable[R]]
+    ) -> Iterable[R]:
+        try:
+            return await request
+        finally:
+            stream.queue.put_nowait(None)
+
     def pubsub(
         self,
         ignore_subscribe_messages: bool = False,
@@ -1045,6 +1513,7 @@ class RedisCluster(
         ignore_subscribe_messages: bool = False,
         read_from_replicas: bool = False,
         retry_policy: Optional[RetryPolicy] = None,
+        max_buffered_messages: int = 1024,
         **kwargs: Any,
     ) -> ShardedPubSub[AnyStr]:
         """
@@ -1061,8 +1530,15 @@ class RedisCluster(
          acknowledgement messages
         :param read_from_replicas: Whether to read messages from replica nodes
         :param retry_policy: An explicit retry policy to use in the subscriber.
+        :param max_buffered_messages: Maximum number of messages read from the shards
+         that are buffered before reading is paused until they are consumed.
 
         New in :redis-version:`7.0.0`
+
+        Changes
+          - .. versionadded:: 4.15.0
+
+            - :paramref:`max_buffered_messages`
         """
 
         return ShardedPubSub[AnyStr](
@@ -1070,9 +1546,41 @@ class RedisCluster(
             ignore_subscribe_messages=ignore_subscribe_messages,
             read_from_replicas=read_from_replicas,
             retry_policy=retry_policy,
+            max_buffered_messages=max_buffered_messages,
             **kwargs,
         )
 
+    def subscription_hub(
+        self,
+        connections: int = 1,
+        max_buffered_messages: int = 1024,
+        overflow: Literal["drop_oldest", "drop_newest", "raise"] = "drop_oldest",
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> SubscriptionHub[AnyStr]:
+        """
+        Return a :class:`~coredis.commands.pubsub.SubscriptionHub` that shares
+        :paramref:`connections` Pub/Sub connection(s) between any number of local
+        subscribers created with
+        :meth:`~coredis.commands.pubsub.SubscriptionHub.subscriber`.
+
+        :param connections: Number of Pub/Sub connections to spread the
+         subscriptions over
+        :param max_buffered_messages: Default maximum number of messages buffered
+         per subscriber
+        :param overflow: Default policy applied when the buffer of a subscriber is
+         full (See :class:`~coredis.commands.pubsub.SubscriptionHub`)
+        :param retry_policy: An explicit retry policy to use in the Pub/Sub
+         connections.
+
+        .. versionadded:: 4.15.0
+        """
+        return SubscriptionHub[AnyStr](
+            lambda: self.pubsub(retry_policy=retry_policy),
+            connections=connections,
+            max_buffered_messages=max_buffered_messages,
+            overflow=overflow,
+        )
+
     async def pipeline(
         self,
         transaction: Optional[bool] = None,
@@ -1161,10 +1669,72 @@ class RedisCluster(
         match: Optional[StringT] = None,
         count: Optional[int] = None,
         type_: Optional[StringT] = None,
+        concurrency: int = 1,
     ) -> AsyncIterator[AnyStr]:
-        for node in self.primaries:
-            cursor = None
-            while cursor != 0:
-                cursor, data = await node.scan(cursor or 0, match, count, type_)
-                for item in data:
+        """
+        Make an iterator using the SCAN command on all primaries of the cluster
+        so that the client doesn't need to remember the cursor positions.
+
+        Changes
+          - .. versionadded:: 4.15.0
+
+            - :paramref:`concurrency`
+
+        :param concurrency: Number of primaries to scan at the same time. Pages are
+         yielded in the order they arrive from any node and each node is paused
+         as soon as it has a page that hasn't been consumed yet, so no more than
+         :paramref:`concurrency` pages are buffered regardless of how slowly
+         the caller consumes them.
+        """
+        pages: asyncio.Queue[
+            Tuple[Optional[Tuple[AnyStr, ...]], Optional[BaseException]]
+        ] = asyncio.Queue(max(1, concurrency))
+        limit = asyncio.Semaphore(max(1, concurrency))
+        tasks = [
+            asyncio.ensure_future(
+                self._scan_node(node, pages, limit, match, count, type_)
+            )
+            for node in self.primaries
+        ]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                page, error = await pages.get()
+                if error:
+                    raise error
+                if page is None:
+                    remaining -= 1
+                    continue
+                for item in page:
                     yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _scan_node(
+        self,
+        node: Redis[AnyStr],
+        pages: asyncio.Queue[
+            Tuple[Optional[Tuple[AnyStr, ...]], Optional[BaseException]]
+        ],
+        limit: asyncio.Semaphore,
+        match: Optional[StringT],
+        count: Optional[int],
+        type_: Optional[StringT],
+    ) -> None:
+        """
+        Feeds the pages of a SCAN over :paramref:`node` into :paramref:`pages`
+        followed by an end marker (or the error encountered)
+        """
+        error: Optional[BaseException] = None
+        try:
+            async with limit:
+                async for page in prefetch_pages(
+                    lambda cursor: node.scan(cursor or 0, match, count, type_)
+                ):
+                    await pages.put((page, None))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e
+        await pages.put((None, error))
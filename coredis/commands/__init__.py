@@ -15,7 +15,7 @@ from coredis.typing import AnyStr, Callable, Generic, Optional, R, ValueT
 from .bitfield import BitFieldOperation
 from .function import Function, Library
 from .monitor import Monitor
-from .pubsub import ClusterPubSub, PubSub, ShardedPubSub
+from .pubsub import ClusterPubSub, PubSub, ShardedPubSub, SubscriptionHub
 from .script import Script
 
 
@@ -40,4 +40,5 @@ __all__ = [
     "PubSub",
     "Script",
     "ShardedPubSub",
+    "SubscriptionHub",
 ]
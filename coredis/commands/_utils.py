@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import time
 import warnings
@@ -8,12 +9,23 @@ from typing import TYPE_CHECKING, Any
 from coredis.commands.constants import CommandName
 from coredis.config import Config
 from coredis.exceptions import CommandNotSupportedError, CommandSyntaxError
-from coredis.typing import Dict, Optional, Union
+from coredis.typing import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 if TYPE_CHECKING:
     import coredis.client
     from coredis.commands._wrappers import CommandDetails
 
+T = TypeVar("T")
+
 
 def normalized_seconds(value: Union[int, datetime.timedelta]) -> int:
     if isinstance(value, datetime.timedelta):
@@ -46,6 +58,30 @@ def normalized_time_milliseconds(value: Union[int, datetime.datetime]) -> int:
     return value
 
 
+async def prefetch_pages(
+    fetch: Callable[[Optional[int]], Awaitable[Tuple[int, T]]]
+) -> AsyncGenerator[T, None]:
+    """
+    Iterates over the pages of a cursor based command (for example :rediscommand:`SCAN`)
+    requesting the next page as soon as the cursor for it is known so that it is
+    fetched while the caller is still consuming the current page.
+
+    :param fetch: called with the cursor to request a page for (``None`` for the
+     first page) and should return the next cursor along with the page.
+    """
+    pending: Optional[asyncio.Future[Tuple[int, T]]] = asyncio.ensure_future(
+        fetch(None)
+    )
+    try:
+        while pending:
+            cursor, page = await pending
+            pending = asyncio.ensure_future(fetch(cursor)) if cursor != 0 else None
+            yield page
+    finally:
+        if pending and not pending.done():
+            pending.cancel()
+
+
 async def check_version(
     instance: coredis.client.Client[Any],
     function_name: str,
@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any, cast
 
 from packaging import version
 
-from coredis.cache import AbstractCache, SupportsSampling
+from coredis.cache import AbstractCache, SupportsCoalescing, SupportsSampling
 from coredis.commands._utils import check_version, redis_command_link
 from coredis.commands.constants import CommandFlag, CommandGroup, CommandName, NodeFlag
 from coredis.globals import COMMAND_FLAGS, READONLY_COMMANDS
@@ -132,14 +132,26 @@ class CommandCache:
                     else:
                         yield cached
                 except KeyError:
-                    response = await func(*args, **kwargs)
-                    cache.put(
-                        self.command,
-                        key,
-                        *args[1:],  # type: ignore
-                        *kwargs.items(),  # type: ignore
-                        value=cast(ResponseType, response),
-                    )
+                    if isinstance(cache, SupportsCoalescing):
+                        response = cast(
+                            R,
+                            await cache.coalesce(
+                                self.command,
+                                key,
+                                *args[1:],  # type: ignore
+                                *kwargs.items(),  # type: ignore
+                                fetch=lambda: func(*args, **kwargs),  # type: ignore
+                            ),
+                        )
+                    else:
+                        response = await func(*args, **kwargs)
+                        cache.put(
+                            self.command,
+                            key,
+                            *args[1:],  # type: ignore
+                            *kwargs.items(),  # type: ignore
+                            value=cast(ResponseType, response),
+                        )
                     yield response
 
 
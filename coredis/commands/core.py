@@ -38,6 +38,7 @@ from coredis.response._callbacks import (
     BoolCallback,
     BoolsCallback,
     ClusterAlignedBoolsCombine,
+    ClusterAlignedTuples,
     ClusterBoolCombine,
     ClusterEnsureConsistent,
     ClusterFirstNonException,
@@ -474,6 +475,9 @@ class CoreCommands(CommandMixin[AnyStr]):
         CommandName.MGET,
         group=CommandGroup.STRING,
         flags={CommandFlag.READONLY, CommandFlag.FAST},
+        cluster=ClusterCommandConfig(
+            split=NodeFlag.PRIMARIES, combine=ClusterAlignedTuples()
+        ),
     )
     async def mget(self, keys: Parameters[KeyT]) -> Tuple[Optional[AnyStr], ...]:
         """
@@ -487,6 +491,9 @@ class CoreCommands(CommandMixin[AnyStr]):
     @redis_command(
         CommandName.MSET,
         group=CommandGroup.STRING,
+        cluster=ClusterCommandConfig(
+            split=NodeFlag.PRIMARIES, combine=ClusterBoolCombine()
+        ),
     )
     async def mset(self, key_values: Mapping[KeyT, ValueT]) -> bool:
         """
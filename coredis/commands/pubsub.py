@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import inspect
+import re
 import threading
+import time
 from asyncio import CancelledError
+from collections import deque
 from concurrent.futures import Future
 from contextlib import suppress
 from functools import partial
@@ -24,16 +28,22 @@ from coredis.retry import (
 )
 from coredis.typing import (
     AnyStr,
+    AsyncIterator,
     Awaitable,
     Callable,
+    Deque,
     Dict,
     Generic,
+    Iterator,
     List,
+    Literal,
     MutableMapping,
     Optional,
     ResponsePrimitive,
     ResponseType,
+    Set,
     StringT,
+    Tuple,
     TypeVar,
     Union,
     ValueT,
@@ -68,6 +78,146 @@ class PubSubMessageTypes(CaseAndEncodingInsensitiveEnum):
     SUNSUBSCRIBE = b"sunsubscribe"
 
 
+def _glob_to_regex(pattern: str) -> str:
+    """
+    Translates a glob style pattern with the semantics of :rediscommand:`PSUBSCRIBE`
+    (``*``, ``?``, ``[...]`` character classes with ``^`` negation and ranges
+    and ``\\`` escapes) to a regular expression
+    """
+    translated = []
+    idx, length = 0, len(pattern)
+    while idx < length:
+        char = pattern[idx]
+        idx += 1
+        if char == "*":
+            translated.append(".*")
+        elif char == "?":
+            translated.append(".")
+        elif char == "\\" and idx < length:
+            translated.append(re.escape(pattern[idx]))
+            idx += 1
+        elif char == "[":
+            negate = idx < length and pattern[idx] == "^"
+            if negate:
+                idx += 1
+            members = []
+            while idx < length and pattern[idx] != "]":
+                if pattern[idx] == "\\" and idx + 1 < length:
+                    idx += 1
+                    members.append(re.escape(pattern[idx]))
+                elif idx + 2 < length and pattern[idx + 1] == "-":
+                    start, end = sorted((pattern[idx], pattern[idx + 2]))
+                    members.append(f"{re.escape(start)}-{re.escape(end)}")
+                    idx += 2
+                else:
+                    members.append(re.escape(pattern[idx]))
+                idx += 1
+            idx += 1
+            if members:
+                translated.append(f"[{'^' if negate else ''}{''.join(members)}]")
+            else:
+                translated.append("." if negate else "(?!)")
+        else:
+            translated.append(re.escape(char))
+    return "".join(translated)
+
+
+class _PatternNode(Generic[T]):
+    __slots__ = ("children", "patterns")
+
+    def __init__(self) -> None:
+        self.children: Dict[Any, _PatternNode[T]] = {}
+        self.patterns: Dict[StringT, Tuple[re.Pattern[Any], T]] = {}
+
+
+class PatternIndex(Generic[T]):
+    """
+    Index of glob style patterns (using the same syntax as :rediscommand:`PSUBSCRIBE`)
+    mapped to values, that can efficiently find all the patterns matching a channel.
+
+    Patterns are stored in a trie keyed by their literal prefix (the portion before
+    the first wildcard) so that only the patterns sharing a prefix with the channel
+    are evaluated.
+    """
+
+    def __init__(self) -> None:
+        self._root: _PatternNode[T] = _PatternNode()
+        self._prefixes: Dict[StringT, StringT] = {}
+
+    def __len__(self) -> int:
+        return len(self._prefixes)
+
+    def __contains__(self, pattern: object) -> bool:
+        return pattern in self._prefixes
+
+    def __iter__(self) -> Iterator[StringT]:
+        return iter(self._prefixes)
+
+    def add(self, pattern: StringT, value: T) -> None:
+        """
+        Adds (or replaces) :paramref:`pattern` with the associated :paramref:`value`
+        """
+        if isinstance(pattern, bytes):
+            regex: re.Pattern[Any] = re.compile(
+                _glob_to_regex(pattern.decode("latin-1")).encode("latin-1"),
+                re.DOTALL,
+            )
+        else:
+            regex = re.compile(_glob_to_regex(pattern), re.DOTALL)
+        prefix = pattern[: self._literal_prefix_length(pattern)]
+        node = self._root
+        for element in prefix:
+            node = node.children.setdefault(element, _PatternNode())
+        node.patterns[pattern] = (regex, value)
+        self._prefixes[pattern] = prefix
+
+    def remove(self, pattern: StringT) -> None:
+        """
+        Removes :paramref:`pattern` from the index (if present)
+        """
+        prefix = self._prefixes.pop(pattern, None)
+        if prefix is None:
+            return
+        path = [self._root]
+        for element in prefix:
+            path.append(path[-1].children[element])
+        path[-1].patterns.pop(pattern, None)
+        # prune the nodes that no longer lead to any pattern
+        for depth in range(len(prefix), 0, -1):
+            if path[depth].patterns or path[depth].children:
+                break
+            del path[depth - 1].children[prefix[depth - 1]]
+
+    def clear(self) -> None:
+        self._root = _PatternNode()
+        self._prefixes.clear()
+
+    def match(self, channel: StringT) -> List[Tuple[StringT, T]]:
+        """
+        Returns the patterns (and their values) that match :paramref:`channel`
+        """
+        matches: List[Tuple[StringT, T]] = []
+        node: Optional[_PatternNode[T]] = self._root
+        idx = 0
+        while node:
+            for pattern, (regex, value) in node.patterns.items():
+                if regex.fullmatch(channel):
+                    matches.append((pattern, value))
+            if idx == len(channel):
+                break
+            node = node.children.get(channel[idx])
+            idx += 1
+        return matches
+
+    @staticmethod
+    def _literal_prefix_length(pattern: StringT) -> int:
+        wildcards = b"*?[\\" if isinstance(pattern, bytes) else "*?[\\"
+        for idx, element in enumerate(pattern):
+            if element in wildcards:
+                return idx
+        return len(pattern)
+
+
 class BasePubSub(Generic[AnyStr, PoolT]):
     PUBLISH_MESSAGE_TYPES = {
         PubSubMessageTypes.MESSAGE.value,
@@ -86,6 +236,9 @@ class BasePubSub(Generic[AnyStr, PoolT]):
 
     channels: MutableMapping[StringT, Optional[SubscriptionCallback]]
     patterns: MutableMapping[StringT, Optional[SubscriptionCallback]]
+    #: Handlers for patterns that are matched locally against the channels of
+    #: received messages (See :meth:`add_local_handlers`)
+    local_handlers: PatternIndex[SubscriptionCallback]
 
     def __init__(
         self,
@@ -130,6 +283,7 @@ class BasePubSub(Generic[AnyStr, PoolT]):
             self.connection = None
         self.channels = {}
         self.patterns = {}
+        self.local_handlers = PatternIndex()
 
     def close(self) -> None:
         self.reset()
@@ -313,6 +467,35 @@ class BasePubSub(Generic[AnyStr, PoolT]):
         await self._ensure_encoding()
         await self.execute_command(CommandName.UNSUBSCRIBE, *channels)
 
+    async def add_local_handlers(
+        self, **pattern_handlers: SubscriptionCallback
+    ) -> None:
+        """
+        Registers handlers for glob style patterns (with the same syntax as
+        :meth:`psubscribe`) that are matched locally against the channel of every
+        message received that doesn't have a channel or pattern handler of
+        its own. Every matching handler is invoked for a message.
+
+        This allows consolidating a large number of pattern subscriptions into a
+        single broad subscription (for example ``await pubsub.psubscribe("*")``)
+        to avoid the cost of matching every pattern on the server for each
+        published message, while still routing messages to handlers per pattern.
+        Messages that don't match any local pattern are returned as usual.
+        """
+        await self._ensure_encoding()
+        for pattern, handler in pattern_handlers.items():
+            self.local_handlers.add(self.encode(pattern), handler)
+
+    async def remove_local_handlers(self, *patterns: StringT) -> None:
+        """
+        Removes the local handlers for :paramref:`patterns`. If empty, all
+        local handlers are removed.
+        """
+        if not patterns:
+            self.local_handlers.clear()
+        for pattern in patterns:
+            self.local_handlers.remove(self.encode(pattern))
+
     async def listen(self) -> Optional[PubSubMessage]:
         """
         Listens for messages on channels this client has been subscribed to
@@ -348,6 +531,75 @@ class BasePubSub(Generic[AnyStr, PoolT]):
 
         return None
 
+    async def get_messages(
+        self,
+        max_count: int = 100,
+        timeout: Optional[Union[int, float]] = None,
+        ignore_subscribe_messages: bool = False,
+    ) -> List[PubSubMessage]:
+        """
+        Waits for the next message and returns it along with any other messages
+        that have already been received (without waiting for more to arrive).
+        Messages for channels or patterns subscribed to with a handler are
+        dispatched to the handler and not included in the result.
+
+        :param max_count: Maximum number of messages to retrieve
+        :param ignore_subscribe_messages: Whether to skip subscription
+         acknowledgement messages
+        :param timeout: Number of seconds to wait for the first message to be available
+         on the connection. If the ``None`` the command will block forever.
+        """
+        response = await self._retry_policy.call_with_retries(
+            lambda: self.parse_response(block=False, timeout=timeout),
+            failure_hook=self.reset_connections,
+        )
+        messages: List[PubSubMessage] = []
+        remaining = max_count
+        while response:
+            message, handlers = self._process_message(
+                response, ignore_subscribe_messages
+            )
+            if handlers and message:
+                for handler in handlers:
+                    handler_response = handler(message)
+                    if inspect.isawaitable(handler_response):
+                        await handler_response
+            elif message:
+                messages.append(message)
+            remaining -= 1
+            if remaining <= 0:
+                break
+            response = self._buffered_response()
+        return messages
+
+    async def batches(
+        self,
+        max_count: int = 100,
+        timeout: Optional[Union[int, float]] = None,
+        ignore_subscribe_messages: bool = False,
+    ) -> AsyncIterator[List[PubSubMessage]]:
+        """
+        Iterates over batches of messages (See :meth:`get_messages`) for as long
+        as there are subscriptions to any channels or patterns::
+
+            async for batch in pubsub.batches(max_count=1000):
+                for message in batch:
+                    ...
+        """
+        while self.subscribed:
+            batch = await self.get_messages(
+                max_count, timeout, ignore_subscribe_messages
+            )
+            if batch:
+                yield batch
+
+    def _buffered_response(self) -> Optional[ResponseType]:
+        if not self.connection:
+            return None
+        return self.connection.buffered_push_message(
+            push_message_types=self.SUBUNSUB_MESSAGE_TYPES | self.PUBLISH_MESSAGE_TYPES
+        )
+
     async def handle_message(
         self, response: ResponseType, ignore_subscribe_messages: bool = False
     ) -> Optional[PubSubMessage]:
@@ -358,6 +610,24 @@ class BasePubSub(Generic[AnyStr, PoolT]):
 
         :meta private:
         """
+        message, handlers = self._process_message(response, ignore_subscribe_messages)
+        if handlers and message:
+            for handler in handlers:
+                handler_response = handler(message)
+                if inspect.isawaitable(handler_response):
+                    await handler_response
+            return None
+        return message
+
+    def _process_message(
+        self, response: ResponseType, ignore_subscribe_messages: bool = False
+    ) -> Tuple[Optional[PubSubMessage], List[SubscriptionCallback]]:
+        """
+        Parses a pub/sub message and returns it along with the handler
+        registered for its channel or pattern or, if there is none, the
+        local handlers whose patterns match the channel. The message is ``None``
+        if it should be ignored.
+        """
         r = cast(List[ResponsePrimitive], response)
         message_type = b(r[0])
         message_type_str = nativestr(r[0])
@@ -397,7 +667,7 @@ class BasePubSub(Generic[AnyStr, PoolT]):
                 subscribed_dict = self.patterns
             else:
                 subscribed_dict = self.channels
-            subscribed_dict.pop(message["channel"])
+            subscribed_dict.pop(message["channel"], None)
 
         if message_type in self.PUBLISH_MESSAGE_TYPES:
             handler = None
@@ -407,26 +677,43 @@ class BasePubSub(Generic[AnyStr, PoolT]):
                 handler = self.channels.get(message["channel"], None)
 
             if handler:
-                handler_response = handler(message)
-                if inspect.isawaitable(handler_response):
-                    await handler_response
-                return None
+                return message, [handler]
+            if self.local_handlers:
+                return message, [
+                    local_handler
+                    for _, local_handler in self.local_handlers.match(
+                        message["channel"]
+                    )
+                ]
+            return message, []
         else:
             # this is a subscribe/unsubscribe message. ignore if we don't
             # want them
 
             if ignore_subscribe_messages or self.ignore_subscribe_messages:
-                return None
+                return None, []
 
-        return message
+        return message, []
 
-    def run_in_thread(self, poll_timeout: float = 1.0) -> PubSubWorkerThread:
+    def run_in_thread(self, poll_timeout: Optional[float] = None) -> PubSubWorkerThread:
         """
         Run the listeners in a thread. For each message received on a
         subscribed channel or pattern the registered handlers will be invoked.
 
         To stop listening invoke :meth:`~coredis.commands.pubsub.PubSubWorkerThread.stop`
         on the returned instance
+
+        :param poll_timeout: Maximum number of seconds to wait for a message
+         before checking whether there are still subscriptions. Not required
+         since unsubscribing and stopping the worker take effect immediately.
+
+        Changes
+          - .. versionchanged:: 4.15.0
+
+            - :paramref:`poll_timeout` defaults to ``None``
+
+        .. seealso:: :class:`coredis.runner.BackgroundRunner` to host a client
+           and its subscriptions in a dedicated thread.
         """
         for channel, handler in self.channels.items():
             if handler is None:
@@ -491,6 +778,32 @@ class ClusterPubSub(BasePubSub[AnyStr, "coredis.pool.ClusterConnectionPool"]):
         self.connection.register_connect_callback(self.on_connect)
 
 
+@dataclasses.dataclass
+class ShardMetrics:
+    """
+    Metrics for a single shard subscribed to by a :class:`ShardedPubSub`
+    """
+
+    #: Number of messages read from the shard that have not been consumed yet
+    pending: int
+    #: Seconds the oldest unconsumed message read from the shard has been waiting
+    lag: float
+    #: Total number of messages read from the shard
+    received: int
+
+
+@dataclasses.dataclass
+class ShardedPubSubMetrics:
+    """
+    Metrics for the message buffer of a :class:`ShardedPubSub`
+    """
+
+    #: Number of messages waiting in the buffer
+    queue_depth: int
+    #: Per shard metrics keyed by the node id of the shard
+    shards: Dict[str, ShardMetrics]
+
+
 @versionadded(version="3.6.0")
 class ShardedPubSub(BasePubSub[AnyStr, "coredis.pool.ClusterConnectionPool"]):
     """
@@ -504,6 +817,11 @@ class ShardedPubSub(BasePubSub[AnyStr, "coredis.pool.ClusterConnectionPool"]):
 
     .. warning:: Sharded PubSub only supports subscription by channel and does
        **NOT** support pattern based subscriptions.
+
+    Messages from each shard are read by a dedicated task per shard connection
+    into a single bounded buffer (of size :paramref:`max_buffered_messages`) that
+    :meth:`get_message` and :meth:`listen` consume from. Messages published to the
+    same channel are always delivered in the order they were received.
     """
 
     PUBLISH_MESSAGE_TYPES = {
@@ -522,13 +840,49 @@ class ShardedPubSub(BasePubSub[AnyStr, "coredis.pool.ClusterConnectionPool"]):
         ignore_subscribe_messages: bool = False,
         retry_policy: Optional[RetryPolicy] = None,
         read_from_replicas: bool = False,
+        max_buffered_messages: int = 1024,
     ):
+        """
+        Changes
+          - .. versionadded:: 4.15.0
+
+            - :paramref:`max_buffered_messages`
+
+        :param max_buffered_messages: Maximum number of messages read from the shards
+         that can be buffered before they are consumed. Once the buffer is full reading
+         from the shards is paused until messages are consumed.
+        """
         self.shard_connections: Dict[str, Connection] = {}
         self.channel_connection_mapping: Dict[StringT, Connection] = {}
-        self.pending_tasks: Dict[str, asyncio.Task[ResponseType]] = {}
+        self.max_buffered_messages = max_buffered_messages
+        self._readers: Dict[str, asyncio.Task[None]] = {}
+        self._messages: Optional[
+            asyncio.Queue[Tuple[str, Union[ResponseType, BaseException]]]
+        ] = None
+        self._shard_pending: Dict[str, Deque[float]] = {}
+        self._shard_received: Dict[str, int] = {}
+        self._reader_error: Optional[BaseException] = None
         self.read_from_replicas = read_from_replicas
         super().__init__(connection_pool, ignore_subscribe_messages, retry_policy)
 
+    @property
+    def metrics(self) -> ShardedPubSubMetrics:
+        """
+        Depth of the message buffer and the lag of each shard
+        """
+        now = time.monotonic()
+        return ShardedPubSubMetrics(
+            queue_depth=self._messages.qsize() if self._messages else 0,
+            shards={
+                node_id: ShardMetrics(
+                    pending=len(pending),
+                    lag=now - pending[0] if pending else 0.0,
+                    received=self._shard_received.get(node_id, 0),
+                )
+                for node_id, pending in self._shard_pending.items()
+            },
+        )
+
     async def subscribe(
         self,
         *channels: StringT,
@@ -627,12 +981,7 @@ class ShardedPubSub(BasePubSub[AnyStr, "coredis.pool.ClusterConnectionPool"]):
             connection.clear_connect_callbacks()
             self.connection_pool.release(connection)
         self.shard_connections.clear()
-        for _, task in self.pending_tasks.items():
-            if not task.done():
-                task.cancel()
-                with suppress(CancelledError):
-                    await task
-        self.pending_tasks.clear()
+        await self._stop_readers()
         self.connection_pool.disconnect()
         self.connection_pool.reset()
         self.connection_pool.initialized = False
@@ -660,68 +1009,94 @@ class ShardedPubSub(BasePubSub[AnyStr, "coredis.pool.ClusterConnectionPool"]):
                 "pubsub connection not set: "
                 "did you forget to call subscribe() or psubscribe()?"
             )
-        result = None
-        # Check any stashed results first.
-        if self.pending_tasks:
-            for node_id, task in list(self.pending_tasks.items()):
-                self.pending_tasks.pop(node_id)
-                if task.done():
-                    result = task.result()
-                    break
-                else:
-                    done, pending = await asyncio.wait(
-                        [task],
-                        timeout=0.001,
-                        return_when=asyncio.FIRST_COMPLETED,
-                    )
-                    if done:
-                        result = done.pop().result()
-                        break
-                    else:
-                        task.cancel()
-                        with suppress(CancelledError):
-                            await task
-        # If there were no pending results check the shards
-        if not result:
-            broken_connections = [
-                c for c in self.shard_connections.values() if not c.is_connected
-            ]
-            if broken_connections:
-                for connection in broken_connections:
-                    try:
-                        await connection.connect()
-                    except:  # noqa
-                        raise ConnectionError("Shard connections not stable")
-            tasks: Dict[str, asyncio.Task[ResponseType]] = {
-                node_id: asyncio.create_task(
-                    self._execute(
-                        connection,
-                        partial(
-                            connection.fetch_push_message,
-                            push_message_types=self.SUBUNSUB_MESSAGE_TYPES
-                            | self.PUBLISH_MESSAGE_TYPES,
-                        ),
-                    )
-                )
-                for node_id, connection in self.shard_connections.items()
-                if node_id not in self.pending_tasks
-            }
-            if tasks:
-                done, pending = await asyncio.wait(
-                    tasks.values(),
-                    timeout=timeout if (timeout and timeout > 0) else None,
-                    return_when=asyncio.FIRST_COMPLETED,
+        if self._reader_error:
+            error, self._reader_error = self._reader_error, None
+            raise error
+        for node_id, connection in list(self.shard_connections.items()):
+            if not connection.is_connected:
+                reader = self._readers.pop(node_id, None)
+                if reader:
+                    reader.cancel()
+                    with suppress(CancelledError):
+                        await reader
+                try:
+                    await connection.connect()
+                except:  # noqa
+                    raise ConnectionError("Shard connections not stable")
+        messages = self._ensure_readers()
+        try:
+            entry = await asyncio.wait_for(
+                messages.get(), timeout if (timeout and timeout > 0) else None
+            )
+        except asyncio.TimeoutError:
+            return None
+        return self._consume(*entry)
+
+    def _buffered_response(self) -> Optional[ResponseType]:
+        if not self._messages or self._messages.empty():
+            return None
+        node_id, response = self._messages.get_nowait()
+        if isinstance(response, BaseException):
+            # defer the error to the next read so that messages that were
+            # already processed are not lost
+            self._reader_error = response
+            return None
+        return self._consume(node_id, response)
+
+    def _consume(
+        self, node_id: str, response: Union[ResponseType, BaseException]
+    ) -> ResponseType:
+        if isinstance(response, BaseException):
+            raise response
+        self._shard_pending[node_id].popleft()
+        return response
+
+    def _ensure_readers(
+        self,
+    ) -> asyncio.Queue[Tuple[str, Union[ResponseType, BaseException]]]:
+        if self._messages is None:
+            self._messages = asyncio.Queue(self.max_buffered_messages)
+        for node_id, connection in self.shard_connections.items():
+            reader = self._readers.get(node_id)
+            if not reader or reader.done():
+                self._readers[node_id] = asyncio.create_task(
+                    self._read_shard(node_id, connection, self._messages)
                 )
-                if done:
-                    done_task = done.pop()
-                    result = done_task.result()
+        return self._messages
 
-                # Stash any other tasks for the next iteration
-                for task in list(done) + list(pending):
-                    for node_id, scheduled in tasks.items():
-                        if task == scheduled:
-                            self.pending_tasks[node_id] = task
-        return result
+    async def _read_shard(
+        self,
+        node_id: str,
+        connection: Connection,
+        messages: asyncio.Queue[Tuple[str, Union[ResponseType, BaseException]]],
+    ) -> None:
+        pending = self._shard_pending.setdefault(node_id, deque())
+        while True:
+            try:
+                response = await connection.fetch_push_message(
+                    push_message_types=self.SUBUNSUB_MESSAGE_TYPES
+                    | self.PUBLISH_MESSAGE_TYPES,
+                    block=True,
+                )
+            except CancelledError:
+                raise
+            except Exception as error:
+                await messages.put((node_id, error))
+                return
+            self._shard_received[node_id] = self._shard_received.get(node_id, 0) + 1
+            pending.append(time.monotonic())
+            try:
+                await messages.put((node_id, response))
+            except CancelledError:
+                pending.pop()
+                raise
+
+    async def _stop_readers(self) -> None:
+        for reader in self._readers.values():
+            reader.cancel()
+            with suppress(CancelledError):
+                await reader
+        self._readers.clear()
 
     async def on_connect(self, connection: BaseConnection) -> None:
         """
@@ -744,19 +1119,560 @@ class ShardedPubSub(BasePubSub[AnyStr, "coredis.pool.ClusterConnectionPool"]):
             connection.disconnect()
             connection.clear_connect_callbacks()
             self.connection_pool.release(connection)
-        for _, task in self.pending_tasks.items():
-            task.cancel()
-        self.pending_tasks.clear()
+        for reader in self._readers.values():
+            reader.cancel()
+        self._readers.clear()
+        self._messages = None
+        self._reader_error = None
+        self._shard_pending.clear()
+        self._shard_received.clear()
         self.shard_connections.clear()
         self.channels = {}
         self.patterns = {}
+        self.local_handlers = PatternIndex()
+
+
+class HubSubscriber(Generic[AnyStr]):
+    """
+    A lightweight subscriber attached to a :class:`SubscriptionHub` that
+    exposes the same methods as :class:`PubSub` for subscribing and
+    retrieving messages, but shares the connection(s) of the hub with all
+    other subscribers. Messages for the channels and patterns it is
+    subscribed to are buffered locally until they are retrieved.
+
+    Instances should be created through :meth:`SubscriptionHub.subscriber`
+    """
+
+    channels: Dict[StringT, Optional[SubscriptionCallback]]
+    patterns: Dict[StringT, Optional[SubscriptionCallback]]
+
+    def __init__(
+        self,
+        hub: SubscriptionHub[AnyStr],
+        ignore_subscribe_messages: bool = False,
+        max_buffered_messages: int = 1024,
+        overflow: Literal["drop_oldest", "drop_newest", "raise"] = "drop_oldest",
+    ):
+        self.hub: SubscriptionHub[AnyStr] = hub
+        self.ignore_subscribe_messages = ignore_subscribe_messages
+        self.max_buffered_messages = max_buffered_messages
+        self.overflow = overflow
+        self.channels = {}
+        self.patterns = {}
+        #: Number of messages that were dropped because the buffer was full
+        self.dropped = 0
+        self._buffer: Deque[PubSubMessage] = deque()
+        self._ready: Optional[asyncio.Event] = None
+        self._error: Optional[BaseException] = None
+        self._dropped_error: Optional[BaseException] = None
+
+    @property
+    def subscribed(self) -> bool:
+        """Indicates if there are subscriptions to any channels or patterns"""
+
+        return bool(self.channels or self.patterns)
+
+    async def subscribe(
+        self,
+        *channels: StringT,
+        **channel_handlers: Optional[SubscriptionCallback],
+    ) -> None:
+        """
+        Subscribes to channels. Channels supplied as keyword arguments expect
+        a channel name as the key and a callable as the value. A channel's
+        callable will be invoked when a message for the channel is retrieved
+        rather than the message being returned by :meth:`get_message`.
+        """
+        new_channels = await self._subscriptions(channels, channel_handlers)
+        await self.hub._add(self, new_channels, pattern=False)
+
+    async def unsubscribe(self, *channels: StringT) -> None:
+        """
+        Unsubscribes from the supplied channels. If empty, unsubscribe from
+        all channels
+        """
+        await self.hub._remove(
+            self, await self._subscribed_to(self.channels, channels), pattern=False
+        )
+
+    async def psubscribe(
+        self,
+        *patterns: StringT,
+        **pattern_handlers: Optional[SubscriptionCallback],
+    ) -> None:
+        """
+        Subscribes to channel patterns. Patterns supplied as keyword arguments
+        expect a pattern name as the key and a callable as the value. A
+        pattern's callable will be invoked when a message for the pattern is
+        retrieved rather than the message being returned by :meth:`get_message`.
+        """
+        new_patterns = await self._subscriptions(patterns, pattern_handlers)
+        await self.hub._add(self, new_patterns, pattern=True)
+
+    async def punsubscribe(self, *patterns: StringT) -> None:
+        """
+        Unsubscribes from the supplied patterns. If empty, unsubscribe from
+        all patterns.
+        """
+        await self.hub._remove(
+            self, await self._subscribed_to(self.patterns, patterns), pattern=True
+        )
+
+    async def listen(self) -> Optional[PubSubMessage]:
+        """
+        Listens for messages on channels this subscriber has been subscribed to
+        """
+        if self.subscribed or self._buffer:
+            return await self.get_message()
+        return None
+
+    async def get_message(
+        self,
+        ignore_subscribe_messages: bool = False,
+        timeout: Optional[Union[int, float]] = None,
+    ) -> Optional[PubSubMessage]:
+        """
+        Gets the next message if one is available, otherwise None.
+
+        :param ignore_subscribe_messages: Whether to skip subscription
+         acknowledgement messages
+        :param timeout: Number of seconds to wait for a message to be available.
+         If ``None`` the call will block forever.
+        :raises: :exc:`~coredis.exceptions.PubSubError` if messages were dropped
+         and :paramref:`SubscriptionHub.overflow` is ``raise``, or any error
+         encountered by the hub while reading from its connection. If the hub
+         could not resubscribe after such an error the subscriptions of the
+         subscriber are dropped and the error keeps being raised until it
+         subscribes again.
+        """
+        messages = await self.get_messages(1, timeout, ignore_subscribe_messages)
+        return messages[0] if messages else None
+
+    async def get_messages(
+        self,
+        max_count: int = 100,
+        timeout: Optional[Union[int, float]] = None,
+        ignore_subscribe_messages: bool = False,
+    ) -> List[PubSubMessage]:
+        """
+        Waits for the next message and returns it along with any other messages
+        that are already buffered. Messages for channels or patterns subscribed
+        to with a handler are dispatched to the handler and not included in the
+        result.
+
+        :param max_count: Maximum number of messages to retrieve
+        :param timeout: Number of seconds to wait for the first message to be
+         available. If ``None`` the call will block forever.
+        :param ignore_subscribe_messages: Whether to skip subscription
+         acknowledgement messages
+        """
+        if not self._buffer and not self._error and not self._dropped_error:
+            if self._ready is None:
+                self._ready = asyncio.Event()
+            self._ready.clear()
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._ready.wait(), timeout)
+        if self._error:
+            error, self._error = self._error, None
+            raise error
+        if not self._buffer and self._dropped_error:
+            raise self._dropped_error
+        messages: List[PubSubMessage] = []
+        for _ in range(min(max_count, len(self._buffer))):
+            message = self._buffer.popleft()
+            if message["type"] in ("message", "pmessage"):
+                if message["type"] == "pmessage":
+                    handler = self.patterns.get(cast(StringT, message["pattern"]))
+                else:
+                    handler = self.channels.get(message["channel"])
+                if handler:
+                    handler_response = handler(message)
+                    if inspect.isawaitable(handler_response):
+                        await handler_response
+                    continue
+            elif ignore_subscribe_messages:
+                continue
+            messages.append(message)
+        return messages
+
+    def close(self) -> None:
+        """
+        Removes all subscriptions of this subscriber from the hub and
+        clears any buffered messages
+        """
+        self.hub._release(self)
+        self._buffer.clear()
+
+    async def _subscriptions(
+        self,
+        names: Tuple[StringT, ...],
+        handlers: Dict[str, Optional[SubscriptionCallback]],
+    ) -> Dict[StringT, Optional[SubscriptionCallback]]:
+        await self.hub._ensure_encoding()
+        subscriptions: Dict[StringT, Optional[SubscriptionCallback]] = dict.fromkeys(
+            map(self.hub.encode, names)
+        )
+        for name, handler in handlers.items():
+            subscriptions[self.hub.encode(name)] = handler
+        return subscriptions
+
+    async def _subscribed_to(
+        self,
+        subscriptions: Dict[StringT, Optional[SubscriptionCallback]],
+        names: Tuple[StringT, ...],
+    ) -> List[StringT]:
+        if not names:
+            return list(subscriptions)
+        await self.hub._ensure_encoding()
+        return [name for name in map(self.hub.encode, names) if name in subscriptions]
+
+    def _acknowledge(self, message_type: str, name: StringT) -> None:
+        if not self.ignore_subscribe_messages:
+            self._deliver(
+                PubSubMessage(
+                    type=message_type,
+                    pattern=name if message_type[0] == "p" else None,
+                    channel=name,
+                    data=len(self.channels) + len(self.patterns),
+                )
+            )
+
+    def _deliver(self, message: PubSubMessage) -> None:
+        if len(self._buffer) >= self.max_buffered_messages:
+            self.dropped += 1
+            if self.overflow == "drop_oldest":
+                self._buffer.popleft()
+            else:
+                if self.overflow == "raise" and not self._error:
+                    self._error = PubSubError(
+                        f"Subscriber buffer of {self.max_buffered_messages} messages"
+                        " overflowed, newer messages were dropped"
+                    )
+                    self._notify()
+                return
+        self._buffer.append(message)
+        self._notify()
+
+    def _fail(self, error: BaseException) -> None:
+        self._error = error
+        self._notify()
+
+    def _drop(self, error: BaseException) -> None:
+        self._dropped_error = error
+        self._notify()
+
+    def _notify(self) -> None:
+        if self._ready:
+            self._ready.set()
+
+
+class SubscriptionHub(Generic[AnyStr]):
+    """
+    Multiplexes the subscriptions of many local subscribers (instances of
+    :class:`HubSubscriber`) over a single (or a small number of) pubsub
+    connection(s) returned by :meth:`coredis.Redis.subscription_hub` or
+    :meth:`coredis.RedisCluster.subscription_hub`.
+
+    Subscriptions are reference counted so that ``SUBSCRIBE`` / ``PSUBSCRIBE``
+    is only sent for the first subscriber of a channel or pattern and
+    ``UNSUBSCRIBE`` / ``PUNSUBSCRIBE`` once the last subscriber leaves.
+    Messages are read by one task per connection and fanned out to the
+    bounded buffer of every subscriber of the channel or pattern::
+
+        hub = client.subscription_hub()
+        subscriber = hub.subscriber()
+        await subscriber.subscribe("updates")
+        message = await subscriber.get_message(ignore_subscribe_messages=True)
+
+    When a subscriber's buffer is full the :paramref:`overflow` policy decides
+    what happens to new messages:
+
+    - ``drop_oldest``: The oldest buffered message is discarded
+    - ``drop_newest``: The new message is discarded
+    - ``raise``: The new message is discarded and the next call to retrieve
+      messages from the subscriber raises :exc:`~coredis.exceptions.PubSubError`
+
+    If reading from a connection fails (for example once the retry policy of
+    the pubsub instance gives up) the error is raised once by every subscriber
+    of the channels and patterns on that connection, since messages may have been
+    lost, and the hub resubscribes them on a new connection. If that fails as
+    well the subscriptions are dropped and the subscribers keep raising the error.
+
+    .. versionadded:: 4.15.0
+    """
+
+    def __init__(
+        self,
+        pubsub_factory: Callable[[], BasePubSub[AnyStr, Any]],
+        connections: int = 1,
+        max_buffered_messages: int = 1024,
+        overflow: Literal["drop_oldest", "drop_newest", "raise"] = "drop_oldest",
+    ):
+        """
+        :param pubsub_factory: callable that returns a new pubsub instance for
+         each connection used by the hub
+        :param connections: number of pubsub connections to spread the
+         channels and patterns over
+        :param max_buffered_messages: default maximum number of messages buffered
+         per subscriber
+        :param overflow: default policy applied when the buffer of a subscriber
+         is full
+        """
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+        self.pubsub_factory: Callable[[], BasePubSub[AnyStr, Any]] = pubsub_factory
+        self.max_buffered_messages = max_buffered_messages
+        self.overflow = overflow
+        self.pubsubs: List[Optional[BasePubSub[AnyStr, Any]]] = [None] * connections
+        self._readers: List[Optional[asyncio.Task[None]]] = [None] * connections
+        self._active: List[int] = [0] * connections
+        self._channels: Dict[StringT, Set[HubSubscriber[AnyStr]]] = {}
+        self._patterns: Dict[StringT, Set[HubSubscriber[AnyStr]]] = {}
+        self._unsubscriptions: Set[asyncio.Task[None]] = set()
+
+    @property
+    def channels(self) -> List[StringT]:
+        """Channels subscribed to on the server by the hub"""
+        return list(self._channels)
+
+    @property
+    def patterns(self) -> List[StringT]:
+        """Patterns subscribed to on the server by the hub"""
+        return list(self._patterns)
+
+    def subscriber(
+        self,
+        ignore_subscribe_messages: bool = False,
+        max_buffered_messages: Optional[int] = None,
+        overflow: Optional[Literal["drop_oldest", "drop_newest", "raise"]] = None,
+    ) -> HubSubscriber[AnyStr]:
+        """
+        Creates a new subscriber attached to the hub
+
+        :param ignore_subscribe_messages: Whether to skip subscription
+         acknowledgement messages
+        :param max_buffered_messages: Maximum number of messages to buffer for the
+         subscriber. Defaults to :paramref:`SubscriptionHub.max_buffered_messages`
+        :param overflow: Policy applied when the buffer is full. Defaults to
+         :paramref:`SubscriptionHub.overflow`
+        """
+        return HubSubscriber[AnyStr](
+            self,
+            ignore_subscribe_messages=ignore_subscribe_messages,
+            max_buffered_messages=max_buffered_messages or self.max_buffered_messages,
+            overflow=overflow or self.overflow,
+        )
+
+    def close(self) -> None:
+        """
+        Stops reading messages, closes all connections used by the hub and
+        detaches all subscribers
+        """
+        for reader in self._readers:
+            if reader and not reader.done():
+                reader.cancel()
+        for pubsub in self.pubsubs:
+            if pubsub:
+                pubsub.close()
+        self.pubsubs = [None] * len(self.pubsubs)
+        self._readers = [None] * len(self._readers)
+        self._active = [0] * len(self._active)
+        for subscriptions in (self._channels, self._patterns):
+            for subscribers in subscriptions.values():
+                for subscriber in subscribers:
+                    subscriber.channels.clear()
+                    subscriber.patterns.clear()
+            subscriptions.clear()
+
+    def encode(self, value: StringT) -> StringT:
+        """
+        :meta private:
+        """
+        return self._pubsub(0).encode(value)
+
+    async def _ensure_encoding(self) -> None:
+        await self._pubsub(0)._ensure_encoding()
+
+    def _pubsub(self, index: int) -> BasePubSub[AnyStr, Any]:
+        pubsub = self.pubsubs[index]
+        if pubsub is None:
+            pubsub = self.pubsubs[index] = self.pubsub_factory()
+        return pubsub
+
+    def _index(self, name: StringT) -> int:
+        return hash_slot(b(name)) % len(self.pubsubs)
+
+    async def _add(
+        self,
+        subscriber: HubSubscriber[AnyStr],
+        subscriptions: Dict[StringT, Optional[SubscriptionCallback]],
+        pattern: bool,
+    ) -> None:
+        registry = self._patterns if pattern else self._channels
+        local = subscriber.patterns if pattern else subscriber.channels
+        pending: Dict[int, List[StringT]] = {}
+        subscriber._dropped_error = None
+        for name, handler in subscriptions.items():
+            local[name] = handler
+            if name not in registry:
+                registry[name] = set()
+                index = self._index(name)
+                self._active[index] += 1
+                pending.setdefault(index, []).append(name)
+            registry[name].add(subscriber)
+            subscriber._acknowledge("psubscribe" if pattern else "subscribe", name)
+        for index, names in pending.items():
+            pubsub = self._pubsub(index)
+            if pattern:
+                await pubsub.psubscribe(*names)
+            else:
+                await pubsub.subscribe(*names)
+            self._ensure_reader(index)
+
+    async def _remove(
+        self,
+        subscriber: HubSubscriber[AnyStr],
+        names: List[StringT],
+        pattern: bool,
+    ) -> None:
+        for index, released in self._detach(subscriber, names, pattern).items():
+            pubsub = self._pubsub(index)
+            if pattern:
+                await pubsub.punsubscribe(*released)
+            else:
+                await pubsub.unsubscribe(*released)
+
+    def _release(self, subscriber: HubSubscriber[AnyStr]) -> None:
+        for pattern, names in (
+            (False, list(subscriber.channels)),
+            (True, list(subscriber.patterns)),
+        ):
+            for index, released in self._detach(subscriber, names, pattern).items():
+                pubsub = self._pubsub(index)
+                unsubscription = asyncio.ensure_future(
+                    pubsub.punsubscribe(*released)
+                    if pattern
+                    else pubsub.unsubscribe(*released)
+                )
+                self._unsubscriptions.add(unsubscription)
+                unsubscription.add_done_callback(self._unsubscribed)
+
+    def _unsubscribed(self, unsubscription: asyncio.Task[None]) -> None:
+        self._unsubscriptions.discard(unsubscription)
+        # the connection might have been closed in the meantime, in which
+        # case the server has already dropped the subscriptions
+        if not unsubscription.cancelled():
+            unsubscription.exception()
+
+    def _detach(
+        self,
+        subscriber: HubSubscriber[AnyStr],
+        names: List[StringT],
+        pattern: bool,
+    ) -> Dict[int, List[StringT]]:
+        """
+        Removes the subscriptions of :paramref:`subscriber` to :paramref:`names`
+        and returns the names (grouped by connection) that no longer have any
+        subscribers
+        """
+        registry = self._patterns if pattern else self._channels
+        local = subscriber.patterns if pattern else subscriber.channels
+        released: Dict[int, List[StringT]] = {}
+        for name in names:
+            local.pop(name, None)
+            subscribers = registry.get(name)
+            if subscribers is None or subscriber not in subscribers:
+                continue
+            subscribers.discard(subscriber)
+            if not subscribers:
+                registry.pop(name)
+                index = self._index(name)
+                self._active[index] -= 1
+                released.setdefault(index, []).append(name)
+            subscriber._acknowledge("punsubscribe" if pattern else "unsubscribe", name)
+        return released
+
+    def _ensure_reader(self, index: int) -> None:
+        reader = self._readers[index]
+        if reader is None or reader.done():
+            self._readers[index] = asyncio.create_task(self._read(index))
+
+    async def _read(self, index: int) -> None:
+        while self._active[index]:
+            try:
+                for message in await self._pubsub(index).get_messages(
+                    ignore_subscribe_messages=True
+                ):
+                    self._dispatch(message)
+            except CancelledError:
+                raise
+            except Exception as error:
+                for subscriber in self._subscribers(index):
+                    subscriber._fail(error)
+                try:
+                    await self._resubscribe(index)
+                except CancelledError:
+                    raise
+                except Exception as resubscribe_error:
+                    self._drop(index, resubscribe_error)
+
+    async def _resubscribe(self, index: int) -> None:
+        """
+        Replaces the connection at :paramref:`index` and subscribes to the
+        channels and patterns assigned to it again
+        """
+        pubsub = self.pubsubs[index]
+        if pubsub:
+            pubsub.close()
+        self.pubsubs[index] = None
+        pubsub = self._pubsub(index)
+        channels = [name for name in self._channels if self._index(name) == index]
+        patterns = [name for name in self._patterns if self._index(name) == index]
+        if channels:
+            await pubsub.subscribe(*channels)
+        if patterns:
+            await pubsub.psubscribe(*patterns)
+
+    def _drop(self, index: int, error: BaseException) -> None:
+        """
+        Removes all subscriptions assigned to the connection at :paramref:`index`
+        and closes it
+        """
+        subscribers = self._subscribers(index)
+        for pattern, registry in ((False, self._channels), (True, self._patterns)):
+            for name in [name for name in registry if self._index(name) == index]:
+                for subscriber in list(registry[name]):
+                    self._detach(subscriber, [name], pattern)
+        pubsub = self.pubsubs[index]
+        if pubsub:
+            pubsub.close()
+        self.pubsubs[index] = None
+        for subscriber in subscribers:
+            subscriber._drop(error)
+
+    def _subscribers(self, index: int) -> Set[HubSubscriber[AnyStr]]:
+        return {
+            subscriber
+            for registry in (self._channels, self._patterns)
+            for name, subscribers in registry.items()
+            if self._index(name) == index
+            for subscriber in subscribers
+        }
+
+    def _dispatch(self, message: PubSubMessage) -> None:
+        if message["type"] == "pmessage":
+            subscribers = self._patterns.get(cast(StringT, message["pattern"]), ())
+        else:
+            subscribers = self._channels.get(message["channel"], ())
+        for subscriber in subscribers:
+            subscriber._deliver(message)
 
 
 class PubSubWorkerThread(threading.Thread):
     def __init__(
         self,
         pubsub: BasePubSub[Any, Any],
-        poll_timeout: float = 1.0,
+        poll_timeout: Optional[float] = None,
     ):
         super().__init__()
         self._pubsub = pubsub
@@ -769,7 +1685,7 @@ class PubSubWorkerThread(threading.Thread):
         pubsub = self._pubsub
         try:
             while pubsub.subscribed:
-                await pubsub.get_message(
+                await pubsub.get_messages(
                     ignore_subscribe_messages=True, timeout=self._poll_timeout
                 )
         except CancelledError:
@@ -38,6 +38,7 @@ from coredis.typing import (
     Literal,
     Optional,
     ResponseType,
+    Sequence,
     Set,
     Tuple,
     TypeVar,
@@ -396,11 +397,17 @@ class BaseConnection(asyncio.BaseProtocol):
         raise NotImplementedError
 
     async def update_tracking_client(
-        self, enabled: bool, client_id: Optional[int] = None
+        self,
+        enabled: bool,
+        client_id: Optional[int] = None,
+        prefixes: Optional[Sequence[bytes]] = None,
     ) -> bool:
         """
         Associate this connection to :paramref:`client_id` to
         relay any tracking notifications to.
+
+        :param prefixes: If provided tracking is enabled in broadcasting
+         (``BCAST``) mode for keys starting with any of the prefixes
         """
         try:
             params: List[ValueT] = (
@@ -408,6 +415,17 @@ class BaseConnection(asyncio.BaseProtocol):
                 if (enabled and client_id is not None)
                 else [b"OFF"]
             )
+            if enabled and client_id is not None and prefixes is not None:
+                params.append(b"BCAST")
+                for prefix in prefixes:
+                    params.extend([b"PREFIX", prefix])
+                # the tracking mode & prefixes can't be changed while tracking is on
+                if self.tracking_client_id is not None:
+                    await (
+                        await self.create_request(
+                            b"CLIENT TRACKING", b"OFF", decode=False
+                        )
+                    )
 
             if (
                 await (
@@ -565,6 +583,24 @@ class BaseConnection(asyncio.BaseProtocol):
             )
         return message
 
+    def buffered_push_message(
+        self,
+        decode: Optional[ValueT] = None,
+        push_message_types: Optional[Set[bytes]] = None,
+    ) -> Optional[ResponseType]:
+        """
+        Returns the next push message if it has already been received
+        without waiting for more data to arrive, otherwise ``None``
+        """
+        if not self.is_connected or self._requests:
+            return None
+        message = self._parser.get_response(
+            bool(decode) if decode is not None else self.decode_responses,
+            self.encoding,
+            push_message_types,
+        )
+        return None if isinstance(message, NotEnoughData) else message
+
     async def _send_packed_command(
         self, command: List[bytes], timeout: Optional[float] = None
     ) -> None:
@@ -57,6 +57,18 @@ class ProtocolError(ConnectionError):
     """
 
 
+class CircuitOpenError(RedisError):
+    """
+    Raised when a request is short circuited because the circuit
+    breaker for the node it is routed to is open
+    (See :class:`coredis.retry.CircuitBreaker`)
+    """
+
+    def __init__(self, node: str) -> None:
+        self.node = node
+        super().__init__(f"Circuit breaker for {node} is open")
+
+
 class TimeoutError(RedisError):
     pass
 
@@ -14,7 +14,7 @@ from typing import Any, cast
 
 from wrapt import ObjectProxy  # type: ignore
 
-from coredis._utils import b, hash_slot
+from coredis._utils import hash_slots
 from coredis.client import Client, Redis, RedisCluster
 from coredis.commands._key_spec import KeySpec
 from coredis.commands.constants import CommandName, NodeFlag
@@ -45,7 +45,7 @@ from coredis.response._callbacks import (
     NoopCallback,
     SimpleStringCallback,
 )
-from coredis.retry import ConstantRetryPolicy, retryable
+from coredis.retry import CircuitBreaker, ConstantRetryPolicy, retryable
 from coredis.typing import (
     AnyStr,
     Callable,
@@ -119,6 +119,11 @@ class ClusterPipelineCommand(PipelineCommand):
     asking: bool = False
 
 
+def _consume_exception(future: asyncio.Future[ResponseType]) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
 class NodeCommands:
     def __init__(
         self,
@@ -151,27 +156,56 @@ class NodeCommands:
 
         # build up all commands into a single request to increase network perf
         # send all the commands and catch connection and timeout errors.
+        invocations: List[CommandInvocation] = []
+        for cmd in commands:
+            # commands that were redirected with an ASK error need to
+            # be preceded by an ASKING command to the importing node.
+            if cmd.asking:
+                invocations.append(
+                    CommandInvocation(CommandName.ASKING, (), False, None)
+                )
+            invocations.append(
+                CommandInvocation(
+                    cmd.command,
+                    cmd.args,
+                    bool(cmd.options.get("decode"))
+                    if cmd.options.get("decode")
+                    else None,
+                    None,
+                )
+            )
         try:
-            requests = await connection.create_requests(
-                [
-                    CommandInvocation(
-                        cmd.command,
-                        cmd.args,
-                        bool(cmd.options.get("decode"))
-                        if cmd.options.get("decode")
-                        else None,
-                        None,
-                    )
-                    for cmd in commands
-                ],
-                timeout=self.timeout,
+            requests = iter(
+                await connection.create_requests(invocations, timeout=self.timeout)
             )
-            for i, cmd in enumerate(commands):
-                cmd.request = requests[i]
+            for cmd in commands:
+                if cmd.asking:
+                    # the response of ASKING itself is not interesting and
+                    # any error will be reflected in the response to the command
+                    next(requests).add_done_callback(_consume_exception)
+                cmd.request = next(requests)
         except (ConnectionError, TimeoutError) as e:
             for c in commands:
                 c.result = e
 
+    async def execute(self) -> None:
+        """
+        Writes all the commands to the node and reads their responses
+        """
+        await self.write()
+        await self.read()
+
+    def report(self, circuit_breaker: CircuitBreaker) -> None:
+        """
+        Records the outcome of the commands sent to the node
+        with :paramref:`circuit_breaker`
+        """
+        for c in self.commands:
+            if isinstance(c.result, (ConnectionError, TimeoutError)):
+                circuit_breaker.record_failure(self.connection.node.name, c.result)
+                return
+        circuit_breaker.record_success(self.connection.node.name)
+
     async def read(self) -> None:
         connection = self.connection
         success = True
@@ -738,6 +772,11 @@ class ClusterPipelineImpl(Client[AnyStr], metaclass=ClusterPipelineMeta):
 
     RESULT_CALLBACKS: Dict[str, Callable[..., Any]] = {}
     NODES_FLAGS: Dict[str, NodeFlag] = {}
+    #: Maximum number of times commands that were redirected
+    #: (``MOVED``, ``ASK`` or ``TRYAGAIN``) are re-sent as batches to
+    #: the nodes they were redirected to before falling back to sending them
+    #: individually
+    MAX_REDIRECT_ROUNDS = 3
 
     def __init__(
         self,
@@ -967,84 +1006,57 @@ class ClusterPipelineImpl(Client[AnyStr], metaclass=ClusterPipelineMeta):
         # if we have to run through it again, we only retry the commands that failed.
         attempt = sorted(self.command_stack, key=lambda x: x.position)
 
-        protocol_version: int = 3
-        # build a list of node objects based on node names we need to
-        nodes: Dict[str, NodeCommands] = {}
         # as we move through each command that still needs to be processed,
         # we figure out the slot number that command maps to, then from the slot determine the node.
+        routes: Dict[str, Tuple[ManagedNode, List[ClusterPipelineCommand]]] = {}
         for c in attempt:
             # refer to our internal node -> slot table that tells us where a given
             # command should route to.
             slot = self._determine_slot(c.command, *c.args)
             node = self.connection_pool.get_node_by_slot(slot)
+            routes.setdefault(node.name, (node, []))[1].append(c)
 
-            if node.name not in nodes:
-                nodes[node.name] = NodeCommands(
-                    self.client,
-                    await self.connection_pool.get_connection_by_node(node),
-                    timeout=self.timeout,
-                )
-
-            nodes[node.name].append(c)
-
-        # send the commands in sequence.
-        # we  write to all the open sockets for each node first, before reading anything
-        # this allows us to flush all the requests out across the network essentially in parallel
-        # so that we can read them all in parallel as they come back.
-        # we dont' multiplex on the sockets as they come available, but that shouldn't make
-        # too much difference.
-        node_commands = nodes.values()
-
-        for n in node_commands:
-            await n.write()
+        protocol_version = await self._send_node_commands(routes)
 
-        for n in node_commands:
-            await n.read()
-
-        # release all of the redis connections we allocated earlier back into the connection pool.
-        # we used to do this step as part of a try/finally block, but it is really dangerous to
-        # release connections back into the pool if for some reason the socket has data still left
-        # in it from a previous operation. The write and read operations already have try/catch
-        # around them for all known types of errors including connection and socket level errors.
-        # So if we hit an exception, something really bad happened and putting any of
-        # these connections back into the pool is a very bad idea.
-        # the socket might have unread buffer still sitting in it, and then the
-        # next time we read from it we pass the buffered result back from a previous
-        # command and every single request after to that connection will always get
-        # a mismatched result. (not just theoretical, I saw this happen on production x.x).
-        for n in nodes.values():
-            protocol_version = n.connection.protocol_version
-            self.connection_pool.release(n.connection)
         # if the response isn't an exception it is a valid response from the node
         # we're all done with that command, YAY!
         # if we have more commands to attempt, we've run into problems.
         # collect all the commands we are allowed to retry.
-        # (MOVED, ASK, or connection errors or timeout errors)
-        attempt = sorted(
-            (c for c in attempt if isinstance(c.result, ERRORS_ALLOW_RETRY)),
-            key=lambda x: x.position,
-        )
+        # (MOVED, ASK or TRYAGAIN)
+        attempt = [c for c in attempt if isinstance(c.result, ERRORS_ALLOW_RETRY)]
+        redirects = 0
 
-        if attempt and allow_redirections:
+        while attempt and allow_redirections and redirects < self.MAX_REDIRECT_ROUNDS:
             # RETRY MAGIC HAPPENS HERE!
-            # send these remaing comamnds one at a time using `execute_command`
-            # in the main client. This keeps our retry logic in one place mostly,
-            # and allows us to be more confident in correctness of behavior.
-            # at this point any speed gains from pipelining have been lost
-            # anyway, so we might as well make the best attempt to get the correct
-            # behavior.
-            #
-            # The client command will handle retries for each individual command
-            # sequentially as we pass each one into `execute_command`. Any exceptions
-            # that bubble out should only appear once all retries have been exhausted.
+            # regroup the failed commands by the node they were redirected to
+            # and send them again as pipelines, so that a resharding cluster
+            # doesn't degrade the pipeline into sequential round trips.
             #
             # If a lot of commands have failed, we'll be setting the
             # flag to rebuild the slots table from scratch. So MOVED errors should
-            # correct .commandsthemselves fairly quickly.
+            # correct themselves fairly quickly.
+            redirects += 1
             await self.connection_pool.nodes.increment_reinitialize_counter(
                 len(attempt)
             )
+            routes = {}
+            try_again = False
+            for c in attempt:
+                node = self._redirected_node(c)
+                if isinstance(c.result, TryAgainError):
+                    try_again = True
+                routes.setdefault(node.name, (node, []))[1].append(c)
+            if try_again:
+                await asyncio.sleep(0.05)
+            protocol_version = await self._send_node_commands(routes)
+            attempt = [c for c in attempt if isinstance(c.result, ERRORS_ALLOW_RETRY)]
 
+        if attempt and allow_redirections:
+            # The commands that were still redirected after exhausting the redirect
+            # rounds are sent one at a time using `execute_command` in the main client
+            # which will handle retries for each individual command.
+            # Any exceptions that bubble out should only appear once all retries
+            # have been exhausted.
             for c in attempt:
                 try:
                     # send each command individually like we do in the main client.
@@ -1072,6 +1084,82 @@ class ClusterPipelineImpl(Client[AnyStr], metaclass=ClusterPipelineMeta):
 
         return tuple(response)
 
+    async def _send_node_commands(
+        self, routes: Dict[str, Tuple[ManagedNode, List[ClusterPipelineCommand]]]
+    ) -> int:
+        """
+        Sends the commands grouped by node in :paramref:`routes` as one pipeline
+        per node and returns the protocol version of the connections used
+        """
+        protocol_version: int = 3
+        # acquire the connections for all the nodes concurrently so that
+        # establishing a connection to one node doesn't hold up the others.
+        nodes: Dict[str, NodeCommands] = {}
+        connections = await asyncio.gather(
+            *(
+                self.connection_pool.get_connection_by_node(node)
+                for node, _ in routes.values()
+            ),
+            return_exceptions=True,
+        )
+        for name, connection in zip(routes, connections):
+            if isinstance(connection, BaseException):
+                for other in connections:
+                    if isinstance(other, ClusterConnection):
+                        self.connection_pool.release(other)
+                raise connection
+            nodes[name] = NodeCommands(self.client, connection, timeout=self.timeout)
+            nodes[name].extend(routes[name][1])
+
+        # write & read from each node independently so that the total
+        # time spent is bound by the slowest node instead of the sum of
+        # the time spent on each node.
+        await asyncio.gather(*(n.execute() for n in nodes.values()))
+
+        # release all of the redis connections we allocated earlier back into the connection pool.
+        # we used to do this step as part of a try/finally block, but it is really dangerous to
+        # release connections back into the pool if for some reason the socket has data still left
+        # in it from a previous operation. The write and read operations already have try/catch
+        # around them for all known types of errors including connection and socket level errors.
+        # So if we hit an exception, something really bad happened and putting any of
+        # these connections back into the pool is a very bad idea.
+        # the socket might have unread buffer still sitting in it, and then the
+        # next time we read from it we pass the buffered result back from a previous
+        # command and every single request after to that connection will always get
+        # a mismatched result. (not just theoretical, I saw this happen on production x.x).
+        for n in nodes.values():
+            protocol_version = n.connection.protocol_version
+            if self.connection_pool.circuit_breaker:
+                n.report(self.connection_pool.circuit_breaker)
+            self.connection_pool.release(n.connection)
+        return protocol_version
+
+    def _redirected_node(self, command: ClusterPipelineCommand) -> ManagedNode:
+        """
+        Determines the node that :paramref:`command` should be retried on based on
+        the redirection error it encountered and updates the slot cache for ``MOVED``
+        errors.
+        """
+        error = command.result
+        command.asking = False
+        if isinstance(error, MovedError):
+            self.client.refresh_table_asap = True
+            node = self.connection_pool.nodes.set_node(
+                error.host, error.port, server_type="primary"
+            )
+            self.connection_pool.nodes.slots[error.slot_id][0] = node
+            return node
+        elif isinstance(error, AskError):
+            command.asking = True
+            return self.connection_pool.nodes.nodes.get(
+                f"{error.host}:{error.port}"
+            ) or self.connection_pool.nodes.set_node(
+                error.host, error.port, server_type="primary"
+            )
+        return self.connection_pool.get_node_by_slot(
+            self._determine_slot(command.command, *command.args)
+        )
+
     def _determine_slot(self, command: bytes, *args: ValueT, **options: ValueT) -> int:
         """Figure out what slot based on command and args"""
 
@@ -1083,7 +1171,7 @@ class ClusterPipelineImpl(Client[AnyStr], metaclass=ClusterPipelineMeta):
             raise RedisClusterException(
                 f"No way to dispatch {command} to Redis Cluster. Missing key"
             )
-        slots = {hash_slot(b(key)) for key in keys}
+        slots = set(hash_slots(keys))
 
         if len(slots) != 1:
             raise ClusterCrossSlotError(command=command, keys=keys)
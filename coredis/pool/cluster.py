@@ -16,6 +16,9 @@ from coredis.exceptions import ConnectionError, RedisClusterException
 from coredis.globals import READONLY_COMMANDS
 from coredis.pool.basic import ConnectionPool
 from coredis.pool.nodemanager import ManagedNode, NodeManager
+from coredis.pool.selection import ReplicaSelector
+from coredis.pool.topology import TopologyStore
+from coredis.retry import CircuitBreaker
 from coredis.typing import (
     Callable,
     ClassVar,
@@ -71,11 +74,20 @@ class ClusterConnectionPool(ConnectionPool):
         idle_check_interval: int = 1,
         blocking: bool = False,
         timeout: int = 20,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        replica_selector: Optional[ReplicaSelector] = None,
+        topology_store: Optional[TopologyStore] = None,
         **connection_kwargs: Optional[Any],
     ):
         """
 
         Changes
+          - .. versionadded:: 4.15.0
+
+            - :paramref:`circuit_breaker`
+            - :paramref:`replica_selector`
+            - :paramref:`topology_store`
+
           - .. versionchanged:: 4.4.0
 
             - :paramref:`nodemanager_follow_cluster` now defaults to ``True``
@@ -102,6 +114,16 @@ class ClusterConnectionPool(ConnectionPool):
             it was operating on. This will allow the client to drift along side the cluster
             if the cluster nodes move around alot.
         :param read_from_replicas: If ``True`` the client will route readonly commands to replicas
+        :param circuit_breaker: If provided, connections will not be handed out for nodes
+         whose circuit is open and :exc:`~coredis.exceptions.CircuitOpenError` will be
+         raised instead (See :class:`~coredis.retry.CircuitBreaker`)
+        :param replica_selector: Strategy used to pick amongst the nodes serving a slot
+         when :paramref:`read_from_replicas` is ``True``. If not provided a node is
+         picked at random (See :class:`~coredis.pool.selection.ReplicaSelector`)
+        :param topology_store: If provided, the last known topology of the cluster is
+         loaded from the store on startup so that commands can be routed immediately
+         while the topology is verified in the background, and every newly discovered
+         topology is saved to it (See :class:`~coredis.pool.topology.TopologyStore`)
         """
         super().__init__(
             connection_class=connection_class, max_connections=max_connections
@@ -126,6 +148,7 @@ class ClusterConnectionPool(ConnectionPool):
             skip_full_coverage_check=skip_full_coverage_check,
             max_connections=self.max_connections,
             nodemanager_follow_cluster=nodemanager_follow_cluster,
+            topology_store=topology_store,
             **connection_kwargs,  # type: ignore
         )
         self.connection_kwargs = connection_kwargs
@@ -133,6 +156,8 @@ class ClusterConnectionPool(ConnectionPool):
         self.read_from_replicas = read_from_replicas or readonly
         self.max_idle_time = max_idle_time
         self.idle_check_interval = idle_check_interval
+        self.circuit_breaker = circuit_breaker
+        self.replica_selector = replica_selector
         self.reset()
 
         if "stream_timeout" not in self.connection_kwargs:
@@ -342,6 +367,7 @@ class ClusterConnectionPool(ConnectionPool):
 
     def disconnect(self) -> None:
         """Closes all connections in the pool"""
+        self.nodes.cancel_verification()
         for node_connections in self._cluster_in_use_connections.values():
             for connection in node_connections:
                 connection.disconnect()
@@ -395,10 +421,22 @@ class ClusterConnectionPool(ConnectionPool):
         except KeyError:
             return await self.get_random_connection()
 
-    async def get_connection_by_node(self, node: ManagedNode) -> ClusterConnection:
-        """Gets a connection by node"""
+    async def get_connection_by_node(
+        self, node: ManagedNode, probe: bool = False
+    ) -> ClusterConnection:
+        """
+        Gets a connection by node
+
+        :param probe: Whether the request made with the connection counts as a
+         probe of the node if its circuit is half open. The caller must then
+         report the outcome to :paramref:`ClusterConnectionPool.circuit_breaker`
+         (See :meth:`~coredis.retry.CircuitBreaker.acquire`)
+        """
         self.checkpid()
 
+        if self.circuit_breaker:
+            self.circuit_breaker.acquire(node.name, probe=probe)
+
         if not self.blocking:
             try:
                 connection = self.__node_pool(node.name).get_nowait()
@@ -437,15 +475,16 @@ class ClusterConnectionPool(ConnectionPool):
         if len(nodes) == 1:
             slot = slots[0]
             if replica_only:
-                return random.choice(
-                    [
-                        node
-                        for node in self.nodes.slots[slot]
-                        if node.server_type != "primary"
-                    ]
-                )
+                candidates = [
+                    node
+                    for node in self.nodes.slots[slot]
+                    if node.server_type != "primary"
+                ]
             else:
-                return random.choice(self.nodes.slots[slot])
+                candidates = self.nodes.slots[slot]
+            if self.replica_selector:
+                return self.replica_selector.select(candidates)
+            return random.choice(candidates)
         else:
             raise RedisClusterException(f"Unable to map slots {slots} to a single node")
 
@@ -489,11 +528,20 @@ class BlockingClusterConnectionPool(ClusterConnectionPool):
         max_idle_time: int = 0,
         idle_check_interval: int = 1,
         timeout: int = 20,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        replica_selector: Optional[ReplicaSelector] = None,
+        topology_store: Optional[TopologyStore] = None,
         **connection_kwargs: Optional[Any],
     ):
         """
 
         Changes
+          - .. versionadded:: 4.15.0
+
+            - :paramref:`circuit_breaker`
+            - :paramref:`replica_selector`
+            - :paramref:`topology_store`
+
           - .. versionchanged:: 4.4.0
 
             - :paramref:`nodemanager_follow_cluster` now defaults to ``True``
@@ -509,6 +557,13 @@ class BlockingClusterConnectionPool(ClusterConnectionPool):
          a maximum size of :paramref:`max_connections` divided by the number of nodes in the
          cluster.
         :param timeout: Number of seconds to block when trying to obtain a connection.
+        :param circuit_breaker: If provided, connections will not be handed out for nodes
+         whose circuit is open (See :class:`~coredis.retry.CircuitBreaker`)
+        :param replica_selector: Strategy used to pick amongst the nodes serving a slot
+         when :paramref:`read_from_replicas` is ``True``
+         (See :class:`~coredis.pool.selection.ReplicaSelector`)
+        :param topology_store: Store used to persist and restore the topology of
+         the cluster (See :class:`~coredis.pool.topology.TopologyStore`)
         :param skip_full_coverage_check:
             Skips the check of cluster-require-full-coverage config, useful for clusters
             without the CONFIG command (like aws)
@@ -532,5 +587,8 @@ class BlockingClusterConnectionPool(ClusterConnectionPool):
             idle_check_interval=idle_check_interval,
             timeout=timeout,
             blocking=True,
+            circuit_breaker=circuit_breaker,
+            replica_selector=replica_selector,
+            topology_store=topology_store,
             **connection_kwargs,
         )
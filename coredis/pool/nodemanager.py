@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import random
 import warnings
 from typing import TYPE_CHECKING, Any
 
-from coredis._utils import b, hash_slot, nativestr
+from coredis._utils import group_by_slot, nativestr
 from coredis.exceptions import (
     ConnectionError,
     RedisClusterException,
     RedisError,
     ResponseError,
 )
+from coredis.pool.topology import TopologyStore
 from coredis.typing import (
     Dict,
     Iterable,
@@ -60,6 +62,7 @@ class NodeManager:
         skip_full_coverage_check: bool = False,
         nodemanager_follow_cluster: bool = True,
         decode_responses: bool = False,
+        topology_store: Optional[TopologyStore] = None,
         **connection_kwargs: Optional[Any],
     ) -> None:
         """
@@ -70,6 +73,10 @@ class NodeManager:
             The node manager will during initialization try the last set of nodes that
             it was operating on. This will allow the client to drift along side the cluster
             if the cluster nodes move around a slot.
+        :topology_store:
+            If provided the topology is restored from the last snapshot in the store
+            on the first initialization (and verified in the background) and a new
+            snapshot is saved whenever the topology is discovered.
         """
         self.connection_kwargs = connection_kwargs
         self.connection_kwargs.update(decode_responses=decode_responses)
@@ -88,17 +95,17 @@ class NodeManager:
         self._skip_full_coverage_check = skip_full_coverage_check
         self.nodemanager_follow_cluster = nodemanager_follow_cluster
         self.replicas_per_shard = 0
+        self.topology_store = topology_store
+        self._verification: Optional[asyncio.Task[None]] = None
 
     def keys_to_nodes_by_slot(
         self, *keys: ValueT
     ) -> Dict[str, Dict[int, List[ValueT]]]:
         mapping: Dict[str, Dict[int, List[ValueT]]] = {}
-        for k in keys:
-            node = self.node_from_slot(hash_slot(b(k)))
+        for slot, slot_keys in group_by_slot(keys).items():
+            node = self.node_from_slot(slot)
             if node:
-                mapping.setdefault(node.name, {}).setdefault(
-                    hash_slot(b(k)), []
-                ).append(k)
+                mapping.setdefault(node.name, {})[slot] = slot_keys
         return mapping
 
     def node_from_slot(self, slot: int) -> Optional[ManagedNode]:
@@ -167,6 +174,16 @@ class NodeManager:
         Maybe it should stop to try after it have correctly covered all slots or when one node is
         reached and it could execute CLUSTER SLOTS command.
         """
+        if self.topology_store and not self.nodes and not self._verification:
+            try:
+                snapshot = await self.topology_store.load()
+            except Exception as err:
+                warnings.warn(f"Unable to load cluster topology snapshot: {err}")
+                snapshot = None
+            if snapshot and self.restore(snapshot):
+                self._verification = asyncio.ensure_future(self._verify_snapshot())
+                return
+
         nodes_cache: Dict[str, ManagedNode] = {}
         tmp_slots: Dict[int, List[ManagedNode]] = {}
 
@@ -288,6 +305,86 @@ class NodeManager:
         )
         self.reinitialize_counter = 0
         self.populate_startup_nodes()
+        if self.topology_store:
+            try:
+                await self.topology_store.save(self.snapshot())
+            except Exception as err:
+                warnings.warn(f"Unable to save cluster topology snapshot: {err}")
+
+    def cancel_verification(self) -> None:
+        """
+        Cancels the background verification of a restored topology snapshot
+        if it is still in progress
+        """
+        if self._verification and not self._verification.done():
+            self._verification.cancel()
+
+    async def _verify_snapshot(self) -> None:
+        try:
+            await self.initialize()
+        except (RedisError, RedisClusterException) as err:
+            # Stale entries in the restored topology will still be corrected
+            # by ``MOVED`` redirections and connection errors
+            warnings.warn(f"Unable to verify restored cluster topology: {err}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a json serializable representation of the current topology
+        that can be restored with :meth:`restore`
+        """
+        ranges: List[List[Any]] = []
+        for slot in range(HASH_SLOTS):
+            names = [node.name for node in self.slots.get(slot, [])]
+            if ranges and ranges[-1][1] == slot - 1 and ranges[-1][2] == names:
+                ranges[-1][1] = slot
+            elif names:
+                ranges.append([slot, slot, names])
+        return {
+            "nodes": [dataclasses.asdict(node) for node in self.nodes.values()],
+            "slots": ranges,
+        }
+
+    def restore(self, snapshot: Dict[str, Any]) -> bool:
+        """
+        Replaces the current topology with :paramref:`snapshot` (as returned
+        by :meth:`snapshot`).
+
+        :return: ``False`` if the snapshot was malformed or doesn't cover all
+         slots (unless full coverage checks are skipped) in which case the current
+         topology is left untouched.
+        """
+        try:
+            nodes = {
+                node.name: node
+                for node in (ManagedNode(**entry) for entry in snapshot["nodes"])
+            }
+            slots: Dict[int, List[ManagedNode]] = {}
+            for start, end, names in snapshot["slots"]:
+                slot_nodes = [nodes[name] for name in names]
+                for slot in range(start, end + 1):
+                    slots[slot] = list(slot_nodes)
+        except (KeyError, TypeError, ValueError):
+            return False
+        if not slots or (
+            not self._skip_full_coverage_check and set(slots) != HASH_SLOTS_SET
+        ):
+            return False
+        replicas = [node for node in nodes.values() if node.server_type == "replica"]
+        self.slots = slots
+        self.nodes = nodes
+        self.replicas_per_shard = int(
+            (len(nodes) / len(replicas)) - 1 if replicas else 0
+        )
+        # Verify against the nodes of the snapshot first so that the load of
+        # discovery is spread across the cluster instead of the startup nodes
+        primaries = [node for node in nodes.values() if node.server_type == "primary"]
+        random.shuffle(primaries)
+        self.startup_nodes[:] = primaries + [
+            node
+            for node in self.startup_nodes
+            if node.name not in {primary.name for primary in primaries}
+        ]
+        return True
 
     async def increment_reinitialize_counter(self, ct: int = 1) -> None:
         for _ in range(min(ct, self.reinitialize_steps)):
@@ -348,4 +445,5 @@ class NodeManager:
             self.startup_nodes.append(n)
 
     async def reset(self) -> None:
+        self.cancel_verification()
         await self.initialize()
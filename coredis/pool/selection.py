@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import random
+from abc import ABC, abstractmethod
+
+from coredis.pool.nodemanager import ManagedNode
+from coredis.typing import Callable, Dict, List, Optional, Union
+
+
+class ReplicaSelector(ABC):
+    """
+    Abstract strategy used by :class:`~coredis.pool.ClusterConnectionPool`
+    to pick which node serving a slot a read only command should be routed to
+    when :paramref:`~coredis.pool.ClusterConnectionPool.read_from_replicas`
+    is ``True``.
+
+    The cluster client reports the start and completion of every request
+    it issues through :meth:`request_started` and :meth:`request_finished`
+    so that implementations can base their decision on observed behavior.
+    """
+
+    @abstractmethod
+    def select(self, nodes: List[ManagedNode]) -> ManagedNode:
+        """
+        Pick one of :paramref:`nodes` (all of which serve the slot(s) that
+        the command is being routed for)
+        """
+
+    def request_started(self, node: ManagedNode) -> None:
+        """
+        Called when a request has been sent to :paramref:`node`
+        """
+
+    def request_finished(self, node: ManagedNode, latency: Optional[float]) -> None:
+        """
+        Called when a request to :paramref:`node` completes
+
+        :param latency: seconds taken for the response to arrive or ``None`` if the
+         request failed
+        """
+
+
+class RandomSelector(ReplicaSelector):
+    """
+    Picks a node uniformly at random (This is the default behavior
+    when no selector is provided)
+    """
+
+    def select(self, nodes: List[ManagedNode]) -> ManagedNode:
+        return random.choice(nodes)
+
+
+class LowestLatencySelector(ReplicaSelector):
+    """
+    Picks the node with the lowest exponentially weighted moving
+    average (EWMA) of response latency.
+
+    Nodes that have not been sampled yet are always preferred so that
+    every node gets an initial estimate, and a small fraction of
+    selections are made at random so that the estimates of nodes that are
+    not currently favored stay up to date.
+    """
+
+    def __init__(self, alpha: float = 0.3, exploration: float = 0.05) -> None:
+        """
+        :param alpha: weight given to the most recent sample when updating the
+         moving average (between ``0`` and ``1``)
+        :param exploration: probability of picking a random node instead of the
+         fastest one
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in the range (0, 1]")
+        self.alpha = alpha
+        self.exploration = exploration
+        self._latencies: Dict[str, float] = {}
+
+    def latency(self, node: ManagedNode) -> Optional[float]:
+        """
+        The current latency estimate (in seconds) for :paramref:`node`
+        or ``None`` if no samples have been recorded for it
+        """
+        return self._latencies.get(node.name)
+
+    def select(self, nodes: List[ManagedNode]) -> ManagedNode:
+        if len(nodes) == 1:
+            return nodes[0]
+        unsampled = [node for node in nodes if node.name not in self._latencies]
+        if unsampled:
+            return random.choice(unsampled)
+        if random.random() < self.exploration:
+            return random.choice(nodes)
+        return min(nodes, key=lambda node: self._latencies[node.name])
+
+    def request_finished(self, node: ManagedNode, latency: Optional[float]) -> None:
+        if latency is None:
+            return
+        current = self._latencies.get(node.name)
+        if current is None:
+            self._latencies[node.name] = latency
+        else:
+            self._latencies[node.name] = current + self.alpha * (latency - current)
+
+
+class LeastPendingSelector(ReplicaSelector):
+    """
+    Power of two choices: picks two nodes at random and routes to the
+    one with fewer requests in flight.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, int] = {}
+
+    def pending(self, node: ManagedNode) -> int:
+        """
+        Number of requests currently in flight to :paramref:`node`
+        """
+        return self._pending.get(node.name, 0)
+
+    def select(self, nodes: List[ManagedNode]) -> ManagedNode:
+        if len(nodes) == 1:
+            return nodes[0]
+        first, second = random.sample(nodes, 2)
+        return second if self.pending(second) < self.pending(first) else first
+
+    def request_started(self, node: ManagedNode) -> None:
+        self._pending[node.name] = self._pending.get(node.name, 0) + 1
+
+    def request_finished(self, node: ManagedNode, latency: Optional[float]) -> None:
+        pending = self._pending.get(node.name, 0)
+        if pending > 1:
+            self._pending[node.name] = pending - 1
+        else:
+            self._pending.pop(node.name, None)
+
+
+class ZoneAffinitySelector(ReplicaSelector):
+    """
+    Prefers nodes in the same zone (for example cloud availability zone)
+    as the client and falls back to any node serving the slot when none
+    are available in the zone.
+    """
+
+    def __init__(
+        self,
+        zone: str,
+        zones: Union[Dict[str, str], Callable[[ManagedNode], Optional[str]]],
+        fallback: Optional[ReplicaSelector] = None,
+    ) -> None:
+        """
+        :param zone: the zone the client is running in
+        :param zones: either a mapping of node host (or ``host:port``) to the
+         zone it is running in, or a callable that returns the zone of a node
+        :param fallback: the selector used to pick amongst the preferred nodes.
+         Defaults to :class:`RandomSelector`
+        """
+        self.zone = zone
+        self.zones = zones
+        self.fallback = fallback or RandomSelector()
+
+    def zone_of(self, node: ManagedNode) -> Optional[str]:
+        """
+        The zone :paramref:`node` is running in (if known)
+        """
+        if callable(self.zones):
+            return self.zones(node)
+        return self.zones.get(node.name, self.zones.get(node.host))
+
+    def select(self, nodes: List[ManagedNode]) -> ManagedNode:
+        local = [node for node in nodes if self.zone_of(node) == self.zone]
+        return self.fallback.select(local or nodes)
+
+    def request_started(self, node: ManagedNode) -> None:
+        self.fallback.request_started(node)
+
+    def request_finished(self, node: ManagedNode, latency: Optional[float]) -> None:
+        self.fallback.request_finished(node, latency)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+from coredis.typing import Dict, Optional, Union
+
+
+class TopologyStore(ABC):
+    """
+    Abstract storage for snapshots of the cluster topology (nodes and slot
+    assignments) discovered by :class:`~coredis.pool.nodemanager.NodeManager`.
+
+    When a store is provided to :class:`~coredis.RedisCluster` the last
+    snapshot is used to route commands immediately on startup instead of
+    querying the startup nodes. The snapshot is then verified in the background
+    and any stale entries are corrected through the regular ``MOVED`` handling.
+
+    The snapshot is a json serializable mapping and implementations are not
+    expected to inspect it.
+    """
+
+    @abstractmethod
+    async def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the last saved snapshot or ``None`` if none is available
+        """
+
+    @abstractmethod
+    async def save(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Persists :paramref:`snapshot` replacing any previous one
+        """
+
+
+class FileTopologyStore(TopologyStore):
+    """
+    Stores the topology snapshot as json in a local file
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        :param path: the file to store the snapshot in. The file is replaced
+         atomically whenever a new snapshot is saved.
+        """
+        self.path = Path(path)
+
+    async def load(self) -> Optional[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        try:
+            snapshot = json.loads(await loop.run_in_executor(None, self.path.read_text))
+        except (OSError, ValueError):
+            return None
+        return snapshot if isinstance(snapshot, dict) else None
+
+    async def save(self, snapshot: Dict[str, Any]) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._write, snapshot)
+
+    def _write(self, snapshot: Dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}."
+        )
+        try:
+            with os.fdopen(fd, "w") as temp_file:
+                json.dump(snapshot, temp_file)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
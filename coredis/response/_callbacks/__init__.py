@@ -268,6 +268,18 @@ class ClusterConcatenateTuples(ClusterMultiNodeCallback[Tuple[R, ...]]):
         return "the concatenations of the results"
 
 
+class ClusterAlignedTuples(ClusterConcatenateTuples[R]):
+    """
+    Used for commands whose keys are split across nodes and that return one
+    value per key. The client reassembles the per node responses in the order
+    of the keys before they are combined.
+    """
+
+    @property
+    def response_policy(self) -> str:
+        return "the results in the same order as the keys"
+
+
 class SimpleStringCallback(
     ResponseCallback[Optional[StringT], Optional[StringT], bool]
 ):
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import enum
 import logging
+import time
 from abc import ABC, abstractmethod
 from functools import wraps
 from typing import Any
 
+from coredis.exceptions import CircuitOpenError, ConnectionError, TimeoutError
 from coredis.typing import Callable, Coroutine, Dict, Optional, P, R, Tuple, Type, Union
 
 logger = logging.getLogger(__name__)
@@ -240,3 +244,208 @@ def retryable(
         return _inner
 
     return inner
+
+
+class CircuitState(enum.Enum):
+    """
+    States of a circuit tracked by :class:`CircuitBreaker`
+    """
+
+    #: Requests are allowed through
+    CLOSED = "closed"
+    #: Requests are rejected without contacting the node
+    OPEN = "open"
+    #: A limited number of probe requests are allowed through
+    #: to detect if the node has recovered
+    HALF_OPEN = "half-open"
+
+
+@dataclasses.dataclass
+class _Circuit:
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    changed_at: float = 0.0
+    probes: int = 0
+
+
+class CircuitBreaker:
+    """
+    Per node circuit breaker that fails requests fast once a node has
+    encountered :paramref:`failure_threshold` consecutive failures.
+
+    While a circuit is open any attempt to acquire a connection for the node
+    raises :exc:`~coredis.exceptions.CircuitOpenError` without paying the
+    connect timeout of the unreachable node. The error is not a
+    :exc:`~coredis.exceptions.ConnectionError` so it is neither retried by
+    retry policies that retry on connection errors nor treated as a failure
+    of the connection pool.
+
+    After :paramref:`recovery_timeout` seconds the circuit is moved to
+    :attr:`CircuitState.HALF_OPEN` and up to :paramref:`half_open_max_calls`
+    probe requests are allowed through. A successful probe closes the circuit
+    and a failed one opens it again.
+
+    Example::
+
+        breaker = coredis.retry.CircuitBreaker(
+            failure_threshold=3,
+            recovery_timeout=5,
+            on_state_change=lambda node, old, new: print(node, old, new),
+        )
+        client = coredis.RedisCluster("localhost", 7000, circuit_breaker=breaker)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 10,
+        half_open_max_calls: int = 1,
+        tracked_exceptions: Tuple[Type[BaseException], ...] = (
+            ConnectionError,
+            TimeoutError,
+        ),
+        on_state_change: Optional[
+            Callable[[str, CircuitState, CircuitState], None]
+        ] = None,
+    ) -> None:
+        """
+        :param failure_threshold: Number of consecutive failures after which
+         the circuit for a node is opened
+        :param recovery_timeout: Seconds to wait after opening a circuit before
+         allowing probe requests through
+        :param half_open_max_calls: Number of concurrent probe requests to allow
+         when the circuit is half open
+        :param tracked_exceptions: The exceptions that count as a failure of the node
+        :param on_state_change: If provided will be called with the node name,
+         the previous state and the new state every time the state of a circuit changes
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.tracked_exceptions = tracked_exceptions
+        self.on_state_change = on_state_change
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}<"
+            f"failure_threshold={self.failure_threshold}, "
+            f"recovery_timeout={self.recovery_timeout}"
+            ">"
+        )
+
+    def state(self, node: str) -> CircuitState:
+        """
+        Current state of the circuit for :paramref:`node`
+        """
+        circuit = self._circuits.get(node)
+        if not circuit:
+            return CircuitState.CLOSED
+        if (
+            circuit.state == CircuitState.OPEN
+            and time.monotonic() - circuit.changed_at >= self.recovery_timeout
+        ):
+            return CircuitState.HALF_OPEN
+        return circuit.state
+
+    def acquire(self, node: str, probe: bool = True) -> None:
+        """
+        Ensures a request can be sent to :paramref:`node`
+
+        :param probe: Whether the request counts as a probe while the circuit
+         is half open. Only requests whose outcome is reported back with
+         :meth:`record_success`, :meth:`record_failure` or :meth:`release`
+         should be counted as probes.
+        :raises: :exc:`~coredis.exceptions.CircuitOpenError` if the circuit
+         for the node is open or all probes are in flight while half open.
+        """
+        circuit = self._circuits.get(node)
+        if not circuit or circuit.state == CircuitState.CLOSED:
+            return
+        now = time.monotonic()
+        if now - circuit.changed_at < self.recovery_timeout:
+            if (
+                circuit.state == CircuitState.OPEN
+                or circuit.probes >= self.half_open_max_calls
+            ):
+                raise CircuitOpenError(node)
+        elif not probe:
+            return
+        else:
+            # either the circuit was open long enough or the in flight probes
+            # never reported back, in both cases start a new probing window.
+            self._transition(node, circuit, CircuitState.HALF_OPEN, now)
+        if probe:
+            circuit.probes += 1
+
+    def release(self, node: str) -> None:
+        """
+        Releases a probe acquired for :paramref:`node` whose request completed
+        without recording a success or a failure
+        """
+        circuit = self._circuits.get(node)
+        if circuit and circuit.probes:
+            circuit.probes -= 1
+
+    def record_success(self, node: str) -> None:
+        """
+        Records a successful request to :paramref:`node`
+        """
+        circuit = self._circuits.get(node)
+        if circuit:
+            circuit.failures = 0
+            if circuit.state != CircuitState.CLOSED:
+                self._transition(node, circuit, CircuitState.CLOSED)
+
+    def record_failure(self, node: str, exc: BaseException) -> None:
+        """
+        Records a failed request to :paramref:`node`. Exceptions that
+        are not one of :paramref:`CircuitBreaker.tracked_exceptions`
+        are ignored.
+        """
+        if not isinstance(exc, self.tracked_exceptions) or isinstance(
+            exc, CircuitOpenError
+        ):
+            return
+        circuit = self._circuits.setdefault(node, _Circuit())
+        circuit.failures += 1
+        if circuit.state == CircuitState.HALF_OPEN or (
+            circuit.state == CircuitState.CLOSED
+            and circuit.failures >= self.failure_threshold
+        ):
+            self._transition(node, circuit, CircuitState.OPEN)
+
+    def reset(self, node: Optional[str] = None) -> None:
+        """
+        Closes the circuit for :paramref:`node` or for all nodes
+        if no node is provided
+        """
+        for name in [node] if node else list(self._circuits):
+            circuit = self._circuits.get(name)
+            if circuit and circuit.state != CircuitState.CLOSED:
+                self._transition(name, circuit, CircuitState.CLOSED)
+            self._circuits.pop(name, None)
+
+    def _transition(
+        self,
+        node: str,
+        circuit: _Circuit,
+        state: CircuitState,
+        now: Optional[float] = None,
+    ) -> None:
+        previous = circuit.state
+        circuit.state = state
+        circuit.changed_at = now or time.monotonic()
+        circuit.probes = 0
+        if state == CircuitState.CLOSED:
+            circuit.failures = 0
+        if previous == state:
+            return
+        logger.info(
+            f"Circuit for {node} changed from {previous.value} to {state.value}"
+        )
+        if self.on_state_change:
+            try:
+                self.on_state_change(node, previous, state)
+            except Exception:  # noqa
+                logger.exception("Error in circuit breaker state change callback")
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any
+
+from coredis.client import Redis, RedisCluster
+from coredis.commands.monitor import Monitor
+from coredis.commands.pubsub import BasePubSub
+from coredis.response.types import MonitorResult, PubSubMessage
+from coredis.typing import (
+    Awaitable,
+    Callable,
+    Coroutine,
+    Generic,
+    List,
+    Optional,
+    P,
+    R,
+    StringT,
+    TypeVar,
+    Union,
+)
+
+ClientT = TypeVar("ClientT", bound=Union[Redis[Any], RedisCluster[Any]])
+
+
+class RunnerTask:
+    """
+    Handle to a long running task (for example a subscription started with
+    :meth:`BackgroundRunner.subscribe`) running in the event loop of a
+    :class:`BackgroundRunner`
+    """
+
+    def __init__(self, runner: BackgroundRunner[Any], task: asyncio.Task[None]):
+        self.runner = runner
+        self.task = task
+
+    @property
+    def running(self) -> bool:
+        """Whether the task is still running"""
+        return not self.task.done()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the task and waits (up to :paramref:`timeout` seconds) for it to
+        clean up (for example unsubscribing from all channels)
+        """
+        if self.runner.running:
+            self.runner.submit(self.runner._cancel, self.task).result(timeout)
+
+
+class BackgroundRunner(Generic[ClientT]):
+    """
+    Hosts a coredis client in an event loop running in a dedicated thread so
+    that it can be used from synchronous, multi threaded code (for example
+    threaded WSGI applications)::
+
+        runner = BackgroundRunner(lambda: coredis.Redis(decode_responses=True))
+        runner.start()
+        future = runner.submit(runner.client.get, "key")  # from any thread
+        value = future.result()
+        value = runner.run(runner.client.get, "key")  # same, blocking
+        runner.stop()
+
+    Pub/Sub messages and ``MONITOR`` output are pushed to thread side callbacks
+    as soon as they are read from the connection (See :meth:`subscribe` and
+    :meth:`monitor`). Stopping a subscription or the runner takes effect
+    immediately instead of waiting for a poll timeout.
+
+    .. versionadded:: 4.15.0
+    """
+
+    def __init__(
+        self,
+        client: Union[ClientT, Callable[[], ClientT]],
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        :param client: the client to host or a callable that returns one. A
+         callable is invoked in the runner thread which is required for
+         python versions older than 3.10 as some of the synchronization
+         primitives used by clients are bound to the event loop that is
+         current when they are created.
+        :param executor: executor used to invoke the callbacks of
+         :meth:`subscribe` and :meth:`monitor`. If not provided the callbacks are
+         invoked in the runner thread and should therefore not block.
+        """
+        self._client = client
+        self.executor = executor
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._tasks: List[asyncio.Task[None]] = []
+
+    @property
+    def client(self) -> ClientT:
+        """
+        The hosted client. Commands should only be issued through
+        :meth:`submit` or :meth:`run`.
+        """
+        assert not callable(self._client), "Runner has not been started"
+        return self._client
+
+    @property
+    def running(self) -> bool:
+        """Whether the runner thread is running"""
+        return bool(self._thread and self._thread.is_alive())
+
+    def start(self) -> BackgroundRunner[ClientT]:
+        """
+        Starts the runner thread (if not already running) and waits for the
+        client to be created
+        """
+        if self.running:
+            return self
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run, args=(started,), name="coredis-runner", daemon=True
+        )
+        self._thread.start()
+        started.wait()
+        if callable(self._client):
+            self._client = self.run(self._create_client, self._client)
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops all subscriptions, closes the event loop and waits (up to
+        :paramref:`timeout` seconds) for the runner thread to exit
+        """
+        if not self._loop or not self._thread:
+            return
+        if self._thread.is_alive():
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+        self._thread.join(timeout)
+
+    def submit(
+        self, func: Callable[P, Awaitable[R]], *args: P.args, **kwargs: P.kwargs
+    ) -> Future[R]:
+        """
+        Schedules ``func(*args, **kwargs)`` in the runner's event loop. This
+        method is thread safe.
+
+        :param func: a coroutine function (for example a client command method
+         such as ``runner.client.get``)
+        :return: a future that resolves with the result of :paramref:`func`
+        """
+        assert self._loop, "Runner has not been started"
+        return asyncio.run_coroutine_threadsafe(
+            self._call(func, *args, **kwargs), self._loop
+        )
+
+    def run(
+        self, func: Callable[P, Awaitable[R]], *args: P.args, **kwargs: P.kwargs
+    ) -> R:
+        """
+        Same as :meth:`submit` but waits for and returns the result
+        """
+        return self.submit(func, *args, **kwargs).result()
+
+    def subscribe(
+        self,
+        callback: Callable[[PubSubMessage], Any],
+        *channels: StringT,
+        patterns: Optional[List[StringT]] = None,
+        pubsub: Optional[Callable[[ClientT], BasePubSub[Any, Any]]] = None,
+        max_count: int = 100,
+    ) -> RunnerTask:
+        """
+        Subscribes to :paramref:`channels` and :paramref:`patterns` and invokes
+        :paramref:`callback` for every message received (subscription
+        acknowledgements are not delivered). Messages are delivered in batches
+        of up to :paramref:`max_count` (See
+        :meth:`~coredis.commands.PubSub.get_messages`) as soon as they are read.
+
+        :param pubsub: callable that returns the pubsub instance to use. Defaults
+         to the client's ``pubsub()`` method (use for example
+         ``lambda client: client.sharded_pubsub()`` for sharded pubsub).
+        :return: a handle that can be used to stop the subscription
+        """
+        return RunnerTask(
+            self,
+            self.run(
+                self._subscribe,
+                callback,
+                list(channels),
+                patterns or [],
+                pubsub or (lambda client: client.pubsub()),
+                max_count,
+            ),
+        )
+
+    def monitor(self, callback: Callable[[MonitorResult], Any]) -> RunnerTask:
+        """
+        Starts a ``MONITOR`` session and invokes :paramref:`callback` for every
+        command received by the server
+
+        :return: a handle that can be used to stop monitoring
+        """
+        return RunnerTask(self, self.run(self._monitor, callback))
+
+    def __enter__(self) -> BackgroundRunner[ClientT]:
+        return self.start()
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    def _run(self, started: threading.Event) -> None:
+        assert self._loop
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(started.set)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+
+    async def _shutdown(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        asyncio.get_running_loop().stop()
+
+    @staticmethod
+    async def _create_client(factory: Callable[[], ClientT]) -> ClientT:
+        return factory()
+
+    async def _call(
+        self, func: Callable[P, Awaitable[R]], *args: P.args, **kwargs: P.kwargs
+    ) -> R:
+        return await func(*args, **kwargs)
+
+    def _track(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        task = asyncio.ensure_future(coro)
+        self._tasks.append(task)
+        task.add_done_callback(self._tasks.remove)
+        return task
+
+    @staticmethod
+    async def _cancel(task: asyncio.Task[None]) -> None:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def _dispatch(self, callback: Callable[[R], Any], item: R) -> None:
+        if self.executor:
+            await asyncio.get_running_loop().run_in_executor(
+                self.executor, callback, item
+            )
+        else:
+            callback(item)
+
+    async def _subscribe(
+        self,
+        callback: Callable[[PubSubMessage], Any],
+        channels: List[StringT],
+        patterns: List[StringT],
+        factory: Callable[[ClientT], BasePubSub[Any, Any]],
+        max_count: int,
+    ) -> asyncio.Task[None]:
+        pubsub = factory(self.client)
+        if channels:
+            await pubsub.subscribe(*channels)
+        if patterns:
+            await pubsub.psubscribe(*patterns)
+        return self._track(self._consume(pubsub, callback, max_count))
+
+    async def _consume(
+        self,
+        pubsub: BasePubSub[Any, Any],
+        callback: Callable[[PubSubMessage], Any],
+        max_count: int,
+    ) -> None:
+        try:
+            async for batch in pubsub.batches(
+                max_count=max_count, ignore_subscribe_messages=True
+            ):
+                for message in batch:
+                    await self._dispatch(callback, message)
+        finally:
+            pubsub.close()
+
+    async def _monitor(
+        self, callback: Callable[[MonitorResult], Any]
+    ) -> asyncio.Task[None]:
+        monitor = Monitor[Any](self.client)
+        await monitor
+
+        async def consume() -> None:
+            try:
+                async for command in monitor:
+                    await self._dispatch(callback, command)
+            finally:
+                await monitor.stop()
+
+        return self._track(consume())
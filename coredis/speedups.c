@@ -123,10 +123,122 @@ static PyObject* hash_slot(PyObject* self, PyObject* args) {
 }
 
 
+/* Resolve the slot of a single key, encoding it the same way
+ * coredis._utils.b does (bytes as is, str as utf-8 and anything
+ * else through its str representation). Returns -1 on error. */
+static int _key_slot(PyObject *key) {
+    const char *buf;
+    Py_ssize_t len;
+    PyObject *repr = NULL;
+    int slot;
+
+    if (PyBytes_Check(key)) {
+        buf = PyBytes_AS_STRING(key);
+        len = PyBytes_GET_SIZE(key);
+    } else {
+        if (PyUnicode_Check(key)) {
+            buf = PyUnicode_AsUTF8AndSize(key, &len);
+        } else {
+            repr = PyObject_Str(key);
+            if (!repr) {
+                return -1;
+            }
+            buf = PyUnicode_AsUTF8AndSize(repr, &len);
+        }
+        if (!buf) {
+            Py_XDECREF(repr);
+            return -1;
+        }
+    }
+    slot = (int)_hash_slot((char *)buf, (int)len);
+    Py_XDECREF(repr);
+    return slot;
+}
+
+
+static PyObject* hash_slots(PyObject* self, PyObject* keys) {
+    PyObject *seq, *result, *item;
+    Py_ssize_t i, count;
+    int slot;
+
+    seq = PySequence_Fast(keys, "keys must be iterable");
+    if (!seq) {
+        return NULL;
+    }
+    count = PySequence_Fast_GET_SIZE(seq);
+    result = PyList_New(count);
+    if (!result) {
+        Py_DECREF(seq);
+        return NULL;
+    }
+    for (i = 0; i < count; i++) {
+        slot = _key_slot(PySequence_Fast_GET_ITEM(seq, i));
+        if (slot < 0 || !(item = PyLong_FromLong(slot))) {
+            Py_DECREF(result);
+            Py_DECREF(seq);
+            return NULL;
+        }
+        PyList_SET_ITEM(result, i, item);
+    }
+    Py_DECREF(seq);
+    return result;
+}
+
+
+static PyObject* group_by_slot(PyObject* self, PyObject* keys) {
+    PyObject *seq, *result, *key, *slot_key, *group;
+    Py_ssize_t i, count;
+    int slot;
+
+    seq = PySequence_Fast(keys, "keys must be iterable");
+    if (!seq) {
+        return NULL;
+    }
+    result = PyDict_New();
+    if (!result) {
+        Py_DECREF(seq);
+        return NULL;
+    }
+    count = PySequence_Fast_GET_SIZE(seq);
+    for (i = 0; i < count; i++) {
+        key = PySequence_Fast_GET_ITEM(seq, i);
+        slot = _key_slot(key);
+        if (slot < 0 || !(slot_key = PyLong_FromLong(slot))) {
+            goto error;
+        }
+        group = PyDict_GetItemWithError(result, slot_key);
+        if (!group) {
+            if (PyErr_Occurred() || !(group = PyList_New(0))) {
+                Py_DECREF(slot_key);
+                goto error;
+            }
+            if (PyDict_SetItem(result, slot_key, group) < 0) {
+                Py_DECREF(group);
+                Py_DECREF(slot_key);
+                goto error;
+            }
+            Py_DECREF(group);
+        }
+        Py_DECREF(slot_key);
+        if (PyList_Append(group, key) < 0) {
+            goto error;
+        }
+    }
+    Py_DECREF(seq);
+    return result;
+
+error:
+    Py_DECREF(result);
+    Py_DECREF(seq);
+    return NULL;
+}
+
 
 static PyMethodDef methods[] = {
     {"crc16", crc16, METH_VARARGS, "crc16 used to hash key to slot"},
     {"hash_slot", hash_slot, METH_VARARGS, "hash key to a redis cluster slot"},
+    {"hash_slots", hash_slots, METH_O, "hash each of the keys to a redis cluster slot"},
+    {"group_by_slot", group_by_slot, METH_O, "group keys by the redis cluster slot they hash to"},
     {NULL, NULL, 0, NULL}
 };
 
@@ -1,4 +1,8 @@
 from __future__ import annotations
 
+from coredis.typing import Dict, Iterable, List, ValueT
+
 def crc16(data: bytes) -> int: ...
 def hash_slot(key: bytes) -> int: ...
+def hash_slots(keys: Iterable[ValueT]) -> List[int]: ...
+def group_by_slot(keys: Iterable[ValueT]) -> Dict[int, List[ValueT]]: ...
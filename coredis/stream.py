@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import base64
+import dataclasses
+import datetime
+import inspect
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import IO, Any, cast
 
 from deprecated.sphinx import versionadded
 
-from coredis._utils import EncodingInsensitiveDict, nativestr
-from coredis.client import Client
+from coredis._json import json
+from coredis._utils import EncodingInsensitiveDict, b, hash_slot, nativestr
+from coredis.client import Client, Redis, RedisCluster
 from coredis.exceptions import (
     ResponseError,
     StreamConsumerInitializationError,
@@ -15,18 +25,24 @@ from coredis.response.types import StreamEntry
 from coredis.tokens import PureToken
 from coredis.typing import (
     AnyStr,
+    AsyncIterator,
+    Callable,
     ClassVar,
+    Deque,
     Dict,
     Generator,
     Generic,
     KeyT,
     List,
+    Literal,
+    Mapping,
     Optional,
     Parameters,
     Set,
     StringT,
     Tuple,
     TypedDict,
+    Union,
     ValueT,
 )
 
@@ -79,31 +95,31 @@ class Consumer(Generic[AnyStr]):
         self.state: Dict[StringT, State] = EncodingInsensitiveDict(
             {stream: stream_parameters.get(nativestr(stream), {}) for stream in streams}
         )
-        self.buffer: Dict[AnyStr, List[StreamEntry]] = EncodingInsensitiveDict({})
+        self.buffer: Dict[AnyStr, Deque[StreamEntry]] = EncodingInsensitiveDict({})
         self.buffer_size = buffer_size
         self.timeout = timeout
         self._initialized = False
         self._initialized_streams: Dict[StringT, bool] = {}
+        self._reads: Dict[
+            int, asyncio.Task[Optional[Dict[AnyStr, Tuple[StreamEntry, ...]]]]
+        ] = {}
 
     def chunk_streams(self) -> List[Dict[ValueT, StringT]]:
-        import coredis.client
+        return list(self._stream_chunks().values())
 
-        if isinstance(self.client, coredis.client.RedisCluster):
-            return [
-                {
-                    stream: self.state[stream].get("identifier", None)
-                    or self.DEFAULT_START_ID
-                }
-                for stream in self.streams
-            ]
-        else:
-            return [
-                {
-                    stream: self.state[stream].get("identifier", None)
-                    or self.DEFAULT_START_ID
-                    for stream in self.streams
-                }
-            ]
+    def _stream_chunks(self) -> Dict[int, Dict[ValueT, StringT]]:
+        """
+        Groups the streams (along with the identifiers to read from) that can
+        be read with a single command. When using a cluster client streams are
+        grouped by hash slot, so streams sharing a hash tag are read together.
+        """
+        chunks: Dict[int, Dict[ValueT, StringT]] = {}
+        clustered = isinstance(self.client, RedisCluster)
+        for stream in self.streams:
+            chunks.setdefault(hash_slot(b(stream)) if clustered else 0, {})[stream] = (
+                self.state[stream].get("identifier", None) or self.DEFAULT_START_ID
+            )
+        return chunks
 
     async def initialize(self, partial: bool = False) -> "Consumer[AnyStr]":
         if self._initialized and not partial:
@@ -168,38 +184,283 @@ class Consumer(Generic[AnyStr]):
         previously fetched and buffered, they will be returned before
         making a new request to the server.
         """
+        entries = await self.get_entries(1)
+        return entries[0] if entries else (None, None)
+
+    async def get_entries(
+        self, max_count: Optional[int] = None
+    ) -> List[Tuple[AnyStr, StreamEntry]]:
+        """
+        Fetches up to :paramref:`max_count` of the entries available from the
+        streams specified in :paramref:`Consumer.streams`. If there were any
+        entries previously fetched and buffered, they are returned before
+        making a new request to the server.
+
+        :param max_count: Maximum number of entries to return. If not provided
+         all the entries fetched by a single request (i.e. up to
+         :paramref:`Consumer.buffer_size` + 1 per stream) are returned.
+        :return: a list of (stream, entry) tuples which is empty if no entries
+         were available
+
+        .. versionadded:: 4.15.0
+        """
         await self.initialize()
-        cur = None
-        cur_stream = None
-        for stream, buffer_entries in list(self.buffer.items()):
-            if buffer_entries:
-                cur_stream, cur = stream, self.buffer[stream].pop(0)
-                break
+        if not any(self.buffer.values()):
+            await self._fetch()
+        return self._take(max_count)
+
+    async def batches(
+        self, max_count: Optional[int] = None
+    ) -> AsyncIterator[List[Tuple[AnyStr, StreamEntry]]]:
+        """
+        Iterates over batches of entries returned by :meth:`get_entries`
+        until no more entries are available::
+
+            async for batch in consumer.batches():
+                for stream, entry in batch:
+                    ...
+
+        .. versionadded:: 4.15.0
+        """
+        while True:
+            batch = await self.get_entries(max_count)
+            if not batch:
+                return
+            yield batch
+
+    async def close(self) -> None:
+        """
+        Cancels any reads that are still waiting for entries
+
+        .. versionadded:: 4.15.0
+        """
+        for read in self._reads.values():
+            read.cancel()
+        self._reads.clear()
+
+    async def _read(
+        self, streams: Dict[ValueT, StringT]
+    ) -> Optional[Dict[AnyStr, Tuple[StreamEntry, ...]]]:
+        return await self.client.xread(
+            streams,
+            count=self.buffer_size + 1,
+            block=self.timeout if (self.timeout and self.timeout > 0) else None,
+        )
+
+    async def _fetch(self) -> None:
+        consumed_entries: Dict[AnyStr, Tuple[StreamEntry, ...]] = {}
+        chunks = self._stream_chunks()
+        if len(chunks) == 1 and not self._reads:
+            [chunk] = chunks.values()
+            consumed_entries.update(await self._read(chunk) or {})
         else:
-            consumed_entries: Dict[AnyStr, Tuple[StreamEntry, ...]] = {}
-            for chunk in self.chunk_streams():
-                consumed_entries.update(
-                    await self.client.xread(
-                        chunk,
-                        count=self.buffer_size + 1,
-                        block=self.timeout
-                        if (self.timeout and self.timeout > 0)
-                        else None,
-                    )
-                    or {}
+            # Read from all groups of streams concurrently and return as soon
+            # as any of them has entries. Reads that are still in flight are
+            # picked up by subsequent fetches instead of being reissued (unless
+            # they already completed without entries, as entries may have been
+            # added since).
+            for slot, read in list(self._reads.items()):
+                if read.done() and not read.exception() and not read.result():
+                    self._reads.pop(slot)
+            for slot, chunk in chunks.items():
+                if slot not in self._reads:
+                    self._reads[slot] = asyncio.ensure_future(self._read(chunk))
+            pending = set(self._reads.values())
+            while pending and not any(consumed_entries.values()):
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-            for stream, entries in consumed_entries.items():
-                if entries:
-                    if not cur:
-                        cur = entries[0]
-                        cur_stream = stream
-                        if entries[1:]:
-                            self.buffer.setdefault(stream, []).extend(entries[1:])
-                    else:
-                        self.buffer.setdefault(stream, []).extend(entries)
-        if cur and cur_stream:
-            self.state[cur_stream]["identifier"] = cur.identifier
-        return cur_stream, cur
+                for slot, read in list(self._reads.items()):
+                    if read in done:
+                        self._reads.pop(slot)
+                        consumed_entries.update(read.result() or {})
+        for stream, entries in consumed_entries.items():
+            if entries:
+                self.buffer.setdefault(stream, deque()).extend(entries)
+        if self._refetch(consumed_entries) and not any(self.buffer.values()):
+            await self._fetch()
+
+    def _refetch(self, consumed_entries: Dict[AnyStr, Tuple[StreamEntry, ...]]) -> bool:
+        """
+        Whether another request should be made if no entries were
+        returned by the last one
+        """
+        return False
+
+    def _take(self, max_count: Optional[int]) -> List[Tuple[AnyStr, StreamEntry]]:
+        taken: List[Tuple[AnyStr, StreamEntry]] = []
+        for stream, buffer_entries in self.buffer.items():
+            if max_count is not None and len(taken) >= max_count:
+                break
+            if not buffer_entries:
+                continue
+            if max_count is None or len(buffer_entries) <= max_count - len(taken):
+                taken.extend((stream, entry) for entry in buffer_entries)
+                buffer_entries.clear()
+            else:
+                taken.extend(
+                    (stream, buffer_entries.popleft())
+                    for _ in range(max_count - len(taken))
+                )
+            self._advance(stream, taken[-1][1])
+        return taken
+
+    def _advance(self, stream: AnyStr, entry: StreamEntry) -> None:
+        self.state[stream]["identifier"] = entry.identifier
+
+
+@dataclasses.dataclass
+class AcknowledgementMetrics:
+    """
+    Metrics for the acknowledgements flushed by an :class:`AcknowledgementBatcher`
+    """
+
+    #: Number of identifiers waiting to be acknowledged
+    pending: int
+    #: Number of flushes performed
+    flushes: int
+    #: Total number of identifiers acknowledged by the server
+    acknowledged: int
+    #: Seconds taken by the most recent flush
+    last_flush_latency: float
+    #: Seconds taken by the slowest flush
+    max_flush_latency: float
+
+
+class AcknowledgementBatcher(Generic[AnyStr]):
+    """
+    Collects identifiers of stream entries that have been processed by the
+    members of a consumer group and acknowledges them with a single ``XACK``
+    per stream (pipelined across streams) once :paramref:`max_pending` identifiers
+    have been collected or :paramref:`flush_interval` seconds have passed since
+    the first one was added (whichever comes first).
+
+    Identifiers that could not be acknowledged (for example due to a connection
+    error) are retained and retried on the next flush. Any identifiers not yet
+    acknowledged when the process exits remain in the :term:`PEL` of the group.
+    """
+
+    def __init__(
+        self,
+        client: Client[AnyStr],
+        group: StringT,
+        max_pending: int = 100,
+        flush_interval: Optional[float] = 0.1,
+    ):
+        """
+        :param client: The redis client to use
+        :param group: The name of the group the entries were delivered to
+        :param max_pending: Number of identifiers that triggers a flush
+        :param flush_interval: Maximum number of seconds an identifier waits
+         before it is flushed. If ``None`` identifiers are only flushed once
+         :paramref:`max_pending` is reached or :meth:`flush` is called.
+        """
+        self.client: Client[AnyStr] = client
+        self.group = group
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self._pending: Dict[KeyT, List[ValueT]] = {}
+        self._pending_count = 0
+        self._pending_entries: Set[Tuple[bytes, bytes]] = set()
+        self._timer: Optional[asyncio.Task[None]] = None
+        self._error: Optional[BaseException] = None
+        self._flushes = 0
+        self._acknowledged = 0
+        self._last_latency = 0.0
+        self._max_latency = 0.0
+
+    @property
+    def metrics(self) -> AcknowledgementMetrics:
+        """
+        Number of pending identifiers and the latency of flushes
+        """
+        return AcknowledgementMetrics(
+            pending=self._pending_count,
+            flushes=self._flushes,
+            acknowledged=self._acknowledged,
+            last_flush_latency=self._last_latency,
+            max_flush_latency=self._max_latency,
+        )
+
+    async def add(self, stream: KeyT, identifier: StringT) -> None:
+        """
+        Queues :paramref:`identifier` to be acknowledged
+
+        :raises: any error encountered by a flush triggered by
+         :paramref:`flush_interval` since the last call
+        """
+        if self._error:
+            error, self._error = self._error, None
+            raise error
+        self._pending.setdefault(stream, []).append(identifier)
+        self._pending_count += 1
+        self._pending_entries.add((b(stream), b(identifier)))
+        if self._pending_count >= self.max_pending:
+            await self.flush()
+        elif self.flush_interval is not None and not self._timer:
+            self._timer = asyncio.ensure_future(self._flush_later(self.flush_interval))
+
+    def is_pending(self, stream: KeyT, identifier: StringT) -> bool:
+        """
+        Whether :paramref:`identifier` from :paramref:`stream` is waiting to
+        be acknowledged
+        """
+        return (b(stream), b(identifier)) in self._pending_entries
+
+    async def flush(self) -> int:
+        """
+        Acknowledges all pending identifiers
+
+        :return: the number of identifiers acknowledged by the server
+        """
+        if self._timer and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+        if not self._pending:
+            return 0
+        pending, self._pending, self._pending_count = self._pending, {}, 0
+        start = time.perf_counter()
+        try:
+            if len(pending) == 1:
+                [(stream, identifiers)] = pending.items()
+                acknowledged = await self.client.xack(stream, self.group, identifiers)
+            else:
+                assert isinstance(self.client, (Redis, RedisCluster))
+                pipeline = await self.client.pipeline(transaction=False)
+                for stream, identifiers in pending.items():
+                    await pipeline.xack(stream, self.group, identifiers)
+                acknowledged = sum(cast(List[int], await pipeline.execute()))
+        except BaseException:
+            for stream, identifiers in pending.items():
+                self._pending.setdefault(stream, [])[:0] = identifiers
+                self._pending_count += len(identifiers)
+            raise
+        self._pending_entries.difference_update(
+            (b(stream), b(identifier))
+            for stream, identifiers in pending.items()
+            for identifier in identifiers
+        )
+        self._last_latency = time.perf_counter() - start
+        self._max_latency = max(self._max_latency, self._last_latency)
+        self._flushes += 1
+        self._acknowledged += acknowledged
+        return acknowledged
+
+    async def close(self) -> None:
+        """
+        Flushes any pending identifiers
+        """
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        await self.flush()
+
+    async def _flush_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        try:
+            await self.flush()
+        except Exception as error:
+            self._error = error
 
 
 class GroupConsumer(Consumer[AnyStr]):
@@ -216,6 +477,11 @@ class GroupConsumer(Consumer[AnyStr]):
         auto_acknowledge: bool = False,
         start_from_backlog: bool = False,
         timeout: Optional[int] = None,
+        ack_batch_size: int = 100,
+        ack_interval: Optional[float] = 0.1,
+        reclaim_min_idle: Optional[Union[int, datetime.timedelta]] = None,
+        reclaim_interval: float = 1.0,
+        reclaim_count: int = 100,
         **stream_parameters: StreamParameters,
     ):
         """
@@ -239,9 +505,35 @@ class GroupConsumer(Consumer[AnyStr]):
          on each request to redis.
         :param timeout: Maximum amount of time to block for new
          entries to appear on the streams the consumer is reading from.
+        :param ack_batch_size: Number of entries acknowledged with :meth:`ack`
+         that are collected before they are flushed to redis.
+        :param ack_interval: Maximum number of seconds an entry acknowledged with
+         :meth:`ack` waits before being flushed to redis.
+        :param reclaim_min_idle: If provided, a background task periodically
+         claims entries (with ``XAUTOCLAIM``) that have been pending for other
+         consumers in the group (for example consumers that crashed) for at
+         least this many milliseconds. Reclaimed entries are returned
+         by the consumer alongside new entries. Entries fetched (or reclaimed)
+         by this consumer are not reclaimed again by it until they are
+         acknowledged with :meth:`ack`, however other consumers in the group
+         may claim them so this should be comfortably larger than the time
+         taken to process (and acknowledge) an entry.
+        :param reclaim_interval: Number of seconds to wait between reclaim passes
+        :param reclaim_count: Maximum number of entries claimed per ``XAUTOCLAIM``
+         request. This also bounds the number of reclaimed entries waiting to be
+         consumed and the number of reclaimed entries returned in place of each
+         request for new entries so that a large backlog doesn't starve new entries.
         :param stream_parameters: Mapping of optional parameters to use
          by stream for the streams provided in :paramref:`streams`.
 
+        Changes
+          - .. versionadded:: 4.15.0
+
+            - :paramref:`ack_batch_size`
+            - :paramref:`ack_interval`
+            - :paramref:`reclaim_min_idle`
+            - :paramref:`reclaim_interval`
+            - :paramref:`reclaim_count`
 
         .. warning:: Providing an ``identifier`` in ``stream_parameters`` has a different
            meaning for a group consumer. If the value is any valid identifier other than ``>``
@@ -261,6 +553,20 @@ class GroupConsumer(Consumer[AnyStr]):
         self.auto_create = auto_create
         self.auto_acknowledge = auto_acknowledge
         self.start_from_backlog = start_from_backlog
+        #: Batches acknowledgements made through :meth:`ack`
+        self.acknowledgements: AcknowledgementBatcher[AnyStr] = AcknowledgementBatcher(
+            client, group, ack_batch_size, ack_interval
+        )
+        self.reclaim_min_idle = reclaim_min_idle
+        self.reclaim_interval = reclaim_interval
+        self.reclaim_count = reclaim_count
+        self.reclaimed: Dict[AnyStr, Deque[StreamEntry]] = EncodingInsensitiveDict({})
+        self._reclaimer: Optional[asyncio.Task[None]] = None
+        self._reclaim_error: Optional[BaseException] = None
+        self._reclaim_turn = False
+        # entries delivered to this consumer that haven't been acknowledged
+        # through :meth:`ack` (only tracked when reclaiming)
+        self._unacknowledged: Set[Tuple[bytes, bytes]] = set()
 
     async def initialize(self, partial: bool = False) -> "GroupConsumer[AnyStr]":
         if not self._initialized or partial:
@@ -309,6 +615,8 @@ class GroupConsumer(Consumer[AnyStr]):
                 self.state[stream].setdefault("identifier", ">")
 
             self._initialized = True
+        if self.reclaim_min_idle is not None and not self._reclaimer:
+            self._reclaimer = asyncio.ensure_future(self._reclaim())
         return self
 
     @versionadded(version="4.12.0")
@@ -326,6 +634,49 @@ class GroupConsumer(Consumer[AnyStr]):
         """
         return await super().add_stream(stream, identifier)
 
+    async def ack(self, stream: KeyT, entry: Union[StreamEntry, StringT]) -> None:
+        """
+        Acknowledges that :paramref:`entry` (or its identifier) from
+        :paramref:`stream` has been processed. Acknowledgements are batched
+        and sent to redis with ``XACK`` once
+        :paramref:`GroupConsumer.ack_batch_size` entries have been collected,
+        after :paramref:`GroupConsumer.ack_interval` seconds or when
+        :meth:`flush_acks` or :meth:`close` is called.
+
+        This is a no-op if :paramref:`GroupConsumer.auto_acknowledge` is ``True``.
+
+        .. versionadded:: 4.15.0
+        """
+        if not self.auto_acknowledge:
+            identifier = entry.identifier if isinstance(entry, StreamEntry) else entry
+            await self.acknowledgements.add(stream, identifier)
+            self._unacknowledged.discard((b(stream), b(identifier)))
+
+    async def flush_acks(self) -> int:
+        """
+        Immediately sends all pending acknowledgements made through :meth:`ack`
+
+        :return: the number of entries acknowledged by the server
+
+        .. versionadded:: 4.15.0
+        """
+        return await self.acknowledgements.flush()
+
+    async def close(self) -> None:
+        """
+        Stops reclaiming entries, cancels any reads that are still waiting for
+        entries and sends any pending acknowledgements. The
+        consumer should be closed when it is no longer needed to avoid
+        acknowledged entries remaining in the :term:`PEL`.
+
+        .. versionadded:: 4.15.0
+        """
+        if self._reclaimer:
+            self._reclaimer.cancel()
+            self._reclaimer = None
+        await super().close()
+        await self.acknowledgements.close()
+
     def __await__(self) -> Generator[Any, None, GroupConsumer[AnyStr]]:
         return self.initialize().__await__()
 
@@ -335,53 +686,682 @@ class GroupConsumer(Consumer[AnyStr]):
         """
         return self
 
-    async def get_entry(self) -> Tuple[Optional[AnyStr], Optional[StreamEntry]]:
-        """
-        Fetches the next available entry from the streams specified in
-        :paramref:`GroupConsumer.streams`. If there were any entries
-        previously fetched and buffered, they will be returned before
-        making a new request to the server.
-        """
-        await self.initialize()
+    async def _read(
+        self, streams: Dict[ValueT, StringT]
+    ) -> Optional[Dict[AnyStr, Tuple[StreamEntry, ...]]]:
+        response = await self.client.xreadgroup(
+            self.group,
+            self.consumer,
+            count=self.buffer_size + 1,
+            block=self.timeout if (self.timeout and self.timeout > 0) else None,
+            noack=self.auto_acknowledge,
+            streams=streams,
+        )
+        if response and self.reclaim_min_idle is not None and not self.auto_acknowledge:
+            self._unacknowledged.update(
+                (b(stream), b(entry.identifier))
+                for stream, entries in response.items()
+                for entry in entries
+            )
+        return response
 
-        cur = None
-        cur_stream = None
-        for stream, buffer_entries in list(self.buffer.items()):
-            if buffer_entries:
-                cur_stream, cur = stream, self.buffer[stream].pop(0)
-                break
-        else:
-            consumed_entries: Dict[AnyStr, Tuple[StreamEntry, ...]] = {}
-            for chunk in self.chunk_streams():
-                consumed_entries.update(
-                    await self.client.xreadgroup(
+    async def _fetch(self) -> None:
+        if self._reclaim_error:
+            error, self._reclaim_error = self._reclaim_error, None
+            raise error
+        # alternate between reclaimed entries and new entries so that neither
+        # can starve the other
+        if self._reclaim_turn and self._merge_reclaimed():
+            self._reclaim_turn = False
+            return
+        await super()._fetch()
+        self._reclaim_turn = True
+        if not any(self.buffer.values()):
+            self._merge_reclaimed()
+
+    def _merge_reclaimed(self) -> bool:
+        remaining = self.reclaim_count
+        for stream, entries in self.reclaimed.items():
+            if entries and remaining > 0:
+                buffer_entries = self.buffer.setdefault(stream, deque())
+                while entries and remaining > 0:
+                    buffer_entries.append(entries.popleft())
+                    remaining -= 1
+        return remaining < self.reclaim_count
+
+    async def _reclaim(self) -> None:
+        assert self.reclaim_min_idle is not None
+        cursors: Dict[KeyT, ValueT] = {}
+        try:
+            while True:
+                for stream in list(self.streams):
+                    if (
+                        sum(len(entries) for entries in self.reclaimed.values())
+                        >= self.reclaim_count
+                    ):
+                        break
+                    response = await self.client.xautoclaim(
+                        stream,
                         self.group,
                         self.consumer,
-                        count=self.buffer_size + 1,
-                        block=self.timeout
-                        if (self.timeout and self.timeout > 0)
-                        else None,
-                        noack=self.auto_acknowledge,
-                        streams=chunk,
+                        self.reclaim_min_idle,
+                        cursors.get(stream, "0-0"),
+                        count=self.reclaim_count,
                     )
-                    or {}
+                    cursors[stream] = response[0]
+                    # entries this consumer already holds (buffered, handed out or
+                    # waiting for their acknowledgement to be flushed) can be
+                    # claimed again if they become idle
+                    entries = [
+                        entry
+                        for entry in cast(Tuple[StreamEntry, ...], response[1])
+                        if (b(stream), b(entry.identifier)) not in self._unacknowledged
+                        and not self.acknowledgements.is_pending(
+                            stream, entry.identifier
+                        )
+                    ]
+                    if entries:
+                        self._unacknowledged.update(
+                            (b(stream), b(entry.identifier)) for entry in entries
+                        )
+                        self.reclaimed.setdefault(cast(AnyStr, stream), deque()).extend(
+                            entries
+                        )
+                await asyncio.sleep(self.reclaim_interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            self._reclaim_error = error
+
+    def _refetch(self, consumed_entries: Dict[AnyStr, Tuple[StreamEntry, ...]]) -> bool:
+        backlog_drained = False
+        for stream, entries in consumed_entries.items():
+            if not self.state[stream].get("pending"):
+                continue
+            if entries:
+                self.state[stream]["identifier"] = entries[-1].identifier
+            else:
+                self.state[stream].pop("identifier", None)
+                self.state[stream].pop("pending", None)
+                backlog_drained = True
+        return backlog_drained
+
+    def _advance(self, stream: AnyStr, entry: StreamEntry) -> None:
+        # the position of a group consumer is tracked by the server (or
+        # by :meth:`_fetch` when reading from the backlog)
+        pass
+
+
+class StreamProcessor(Generic[AnyStr]):
+    """
+    Processes the entries fetched by a :class:`Consumer` (or
+    :class:`GroupConsumer`) concurrently while only checkpointing entries once
+    every entry before them in the same stream has been processed::
+
+        consumer = await GroupConsumer(client, ["orders"], "group-a", "consumer-1")
+        processor = StreamProcessor(consumer, handle_order, concurrency=16)
+        await processor.run()
+
+    The :paramref:`handler` is either a coroutine function or a regular function
+    that is invoked with the stream and the entry. Regular functions can be run
+    in a :class:`concurrent.futures.ThreadPoolExecutor` or
+    :class:`concurrent.futures.ProcessPoolExecutor` (in which case the handler
+    needs to be picklable) by providing :paramref:`executor`.
+
+    Checkpointing an entry means acknowledging it through :meth:`GroupConsumer.ack`
+    for group consumers and recording its identifier in :attr:`checkpoints`
+    (which can be used as the starting ``identifier`` of a new
+    :class:`Consumer`) for all consumers. If a handler raises an exception the
+    entry (and any entry after it in the same stream) is never checkpointed,
+    processing stops and the exception is raised by :meth:`run` once the
+    entries being processed have completed.
+
+    .. versionadded:: 4.15.0
+    """
+
+    def __init__(
+        self,
+        consumer: Consumer[AnyStr],
+        handler: Callable[[AnyStr, StreamEntry], Any],
+        concurrency: int = 4,
+        executor: Optional[Executor] = None,
+        batch_size: int = 100,
+    ):
+        """
+        :param consumer: The consumer to fetch entries from
+        :param handler: Called with the stream and the entry for every entry
+        :param concurrency: Maximum number of entries processed concurrently
+        :param executor: If provided :paramref:`handler` is run in the executor
+        :param batch_size: Maximum number of entries to fetch from the consumer at
+         a time
+        """
+        self.consumer: Consumer[AnyStr] = consumer
+        self.handler: Callable[[AnyStr, StreamEntry], Any] = handler
+        self.concurrency = concurrency
+        self.executor = executor
+        self.batch_size = batch_size
+        #: The identifier of the last entry checkpointed per stream
+        self.checkpoints: Dict[AnyStr, StringT] = EncodingInsensitiveDict({})
+        #: Number of entries processed successfully
+        self.processed = 0
+        self._in_progress: Dict[AnyStr, OrderedDict[StringT, bool]] = {}
+        self._tasks: Set[asyncio.Task[None]] = set()
+        self._error: Optional[BaseException] = None
+        self._running = False
+
+    async def run(self, drain: bool = False) -> None:
+        """
+        Fetches and processes entries until :meth:`stop` is called or a handler
+        fails
+
+        :param drain: If ``True`` return as soon as the consumer has no more
+         entries available. Otherwise the consumer should be configured with a
+         blocking ``timeout`` to avoid repeatedly polling for new entries.
+        """
+        slots = asyncio.Semaphore(self.concurrency)
+        self._running = True
+        try:
+            while self._running and not self._error:
+                batch = await self.consumer.get_entries(self.batch_size)
+                if not batch:
+                    if drain:
+                        break
+                    continue
+                for stream, entry in batch:
+                    await slots.acquire()
+                    if self._error:
+                        slots.release()
+                        break
+                    self._in_progress.setdefault(stream, OrderedDict())[
+                        entry.identifier
+                    ] = False
+                    task = asyncio.ensure_future(self._process(stream, entry))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                    task.add_done_callback(lambda _: slots.release())
+        finally:
+            self._running = False
+            if self._tasks:
+                await asyncio.wait(set(self._tasks))
+            if isinstance(self.consumer, GroupConsumer):
+                await self.consumer.flush_acks()
+        if self._error:
+            error, self._error = self._error, None
+            raise error
+
+    def stop(self) -> None:
+        """
+        Stops fetching new entries. :meth:`run` returns once the entries already
+        fetched have been processed.
+        """
+        self._running = False
+
+    async def _process(self, stream: AnyStr, entry: StreamEntry) -> None:
+        try:
+            if self.executor:
+                await asyncio.get_running_loop().run_in_executor(
+                    self.executor, self.handler, stream, entry
                 )
-            for stream, entries in consumed_entries.items():
-                if entries:
-                    if not cur:
-                        cur = entries[0]
-                        cur_stream = stream
-                        if entries[1:]:
-                            self.buffer.setdefault(stream, []).extend(entries[1:])
+            else:
+                response = self.handler(stream, entry)
+                if inspect.isawaitable(response):
+                    await response
+            self.processed += 1
+            await self._complete(stream, entry.identifier)
+        except Exception as error:
+            if not self._error:
+                self._error = error
+
+    async def _complete(self, stream: AnyStr, identifier: StringT) -> None:
+        in_progress = self._in_progress[stream]
+        in_progress[identifier] = True
+        completed: List[StringT] = []
+        while in_progress:
+            identifier, done = next(iter(in_progress.items()))
+            if not done:
+                break
+            in_progress.popitem(last=False)
+            completed.append(identifier)
+        if not completed:
+            return
+        self.checkpoints[stream] = completed[-1]
+        if isinstance(self.consumer, GroupConsumer):
+            for identifier in completed:
+                await self.consumer.ack(stream, identifier)
+
+
+class Producer(Generic[AnyStr]):
+    """
+    Buffers entries added to one or more streams and writes them with pipelined
+    ``XADD`` commands (grouped per node when used with a cluster client) once
+    :paramref:`max_batch_size` entries or :paramref:`max_batch_bytes` bytes have
+    been buffered or :paramref:`linger` seconds have passed since the first entry
+    was buffered (whichever comes first)::
+
+        producer = Producer(client, trim_strategy=PureToken.MAXLEN, threshold=10000)
+        future = await producer.add("events", {"type": "click"})
+        ...
+        identifier = await future
+        await producer.close()
+
+    Each call to :meth:`add` returns a future that resolves to the identifier
+    assigned to the entry (or to the error returned by the server). When
+    :paramref:`max_buffered` entries are waiting to be written :meth:`add` waits
+    for the pending writes to complete before buffering more entries.
+
+    If a :paramref:`trim_strategy` is provided each stream written to is trimmed
+    once per flush (instead of once per entry) with ``XTRIM``.
+
+    .. versionadded:: 4.15.0
+    """
+
+    def __init__(
+        self,
+        client: Client[AnyStr],
+        max_batch_size: int = 100,
+        max_batch_bytes: int = 1024 * 1024,
+        linger: Optional[float] = 0.005,
+        max_buffered: int = 10000,
+        trim_strategy: Optional[Literal[PureToken.MAXLEN, PureToken.MINID]] = None,
+        threshold: Optional[int] = None,
+        approximate: bool = True,
+        limit: Optional[int] = None,
+    ):
+        """
+        :param client: The redis client to use
+        :param max_batch_size: Number of buffered entries that triggers a flush
+        :param max_batch_bytes: Size (sum of the lengths of the field names and
+         values) of the buffered entries that triggers a flush
+        :param linger: Maximum number of seconds an entry waits before it is
+         flushed. If ``None`` entries are only flushed once a size threshold is
+         reached or :meth:`flush` is called.
+        :param max_buffered: Maximum number of entries that can be buffered or
+         in flight before :meth:`add` waits for writes to complete
+        :param trim_strategy: The trimming strategy (``MAXLEN`` or ``MINID``) to
+         apply to the streams written to
+        :param threshold: The threshold for :paramref:`trim_strategy`
+        :param approximate: Whether to trim approximately (``~``) which is
+         significantly more efficient than exact trimming
+        :param limit: Maximum number of entries evicted per trim (only applies to
+         approximate trimming)
+        """
+        if trim_strategy and threshold is None:
+            raise ValueError("threshold is required when trim_strategy is provided")
+        self.client: Client[AnyStr] = client
+        self.max_batch_size = max_batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.linger = linger
+        self.max_buffered = max_buffered
+        self.trim_strategy = trim_strategy
+        self.threshold = threshold
+        self.approximate = approximate
+        self.limit = limit
+        self._buffer: Dict[
+            KeyT,
+            List[
+                Tuple[
+                    Mapping[StringT, ValueT], Optional[ValueT], asyncio.Future[AnyStr]
+                ]
+            ],
+        ] = {}
+        self._buffered = 0
+        self._buffered_bytes = 0
+        self._outstanding = 0
+        self._writable: Optional[asyncio.Event] = None
+        self._timer: Optional[asyncio.Task[None]] = None
+        self._writes: Set[asyncio.Task[None]] = set()
+
+    @property
+    def buffered(self) -> int:
+        """
+        Number of entries that have not been written yet (including entries
+        currently being written)
+        """
+        return self._outstanding
+
+    async def add(
+        self,
+        stream: KeyT,
+        field_values: Mapping[StringT, ValueT],
+        identifier: Optional[ValueT] = None,
+    ) -> asyncio.Future[AnyStr]:
+        """
+        Buffers an entry to be added to :paramref:`stream`
+
+        :param identifier: The identifier for the entry. If not provided the
+         server generates one.
+        :return: a future that resolves to the identifier of the entry once it
+         has been written
+        """
+        while self._outstanding >= self.max_buffered:
+            if not self._writable:
+                self._writable = asyncio.Event()
+            self._writable.clear()
+            self._write()
+            await self._writable.wait()
+        future: asyncio.Future[AnyStr] = asyncio.get_running_loop().create_future()
+        self._buffer.setdefault(stream, []).append((field_values, identifier, future))
+        self._buffered += 1
+        self._outstanding += 1
+        self._buffered_bytes += sum(
+            len(b(field)) + len(b(value)) for field, value in field_values.items()
+        )
+        if (
+            self._buffered >= self.max_batch_size
+            or self._buffered_bytes >= self.max_batch_bytes
+        ):
+            self._write()
+        elif self.linger is not None and not self._timer:
+            self._timer = asyncio.ensure_future(self._write_later(self.linger))
+        return future
+
+    async def flush(self) -> None:
+        """
+        Writes all buffered entries and waits for all pending writes to complete
+        """
+        self._write()
+        if self._writes:
+            await asyncio.wait(set(self._writes))
+
+    async def close(self) -> None:
+        """
+        Flushes any buffered entries
+        """
+        await self.flush()
 
+    def _write(self) -> None:
+        if self._timer and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+        if not self._buffer:
+            return
+        buffer, self._buffer = self._buffer, {}
+        self._buffered = self._buffered_bytes = 0
+        task = asyncio.ensure_future(self._send(buffer))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._write()
+
+    async def _send(
+        self,
+        buffer: Dict[
+            KeyT,
+            List[
+                Tuple[
+                    Mapping[StringT, ValueT], Optional[ValueT], asyncio.Future[AnyStr]
+                ]
+            ],
+        ],
+    ) -> None:
+        futures = [future for entries in buffer.values() for *_, future in entries]
+        try:
+            assert isinstance(self.client, (Redis, RedisCluster))
+            pipeline = await self.client.pipeline(transaction=False)
+            for stream, entries in buffer.items():
+                for field_values, identifier, _ in entries:
+                    await pipeline.xadd(stream, field_values, identifier=identifier)
+                if self.trim_strategy:
+                    await pipeline.xtrim(
+                        stream,
+                        self.trim_strategy,
+                        cast(int, self.threshold),
+                        trim_operator=PureToken.APPROXIMATELY
+                        if self.approximate
+                        else None,
+                        limit=self.limit if self.approximate else None,
+                    )
+            results = iter(await pipeline.execute(raise_on_error=False))
+            for entries in buffer.values():
+                for *_, future in entries:
+                    result = next(results)
+                    if future.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
                     else:
-                        self.buffer.setdefault(stream, []).extend(entries)
-                    if self.state[stream].get("pending"):
-                        self.state[stream]["identifier"] = entries[-1].identifier
-                else:
-                    if self.state[stream].get("pending"):
-                        self.state[stream].pop("identifier", None)
-                        self.state[stream].pop("pending", None)
-                        if not cur:
-                            return await self.get_entry()
-        return cur_stream, cur
+                        future.set_result(cast(AnyStr, result))
+                if self.trim_strategy:
+                    next(results)
+        except BaseException as error:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            if not isinstance(error, Exception):
+                raise
+        finally:
+            self._outstanding -= len(futures)
+            if self._writable:
+                self._writable.set()
+
+
+class StreamExporter(Generic[AnyStr]):
+    """
+    Exports the entries of streams to newline delimited json (NDJSON) files
+    (one entry per line) that can be replayed with :class:`StreamImporter`::
+
+        exporter = StreamExporter(client, page_size=10000)
+        await exporter.export_streams({"orders": "orders.ndjson", "events": "events.ndjson"})
+
+    Entries are fetched with ``XRANGE`` one page at a time and the next page is
+    fetched while the current one is being written so memory usage is bounded by
+    :paramref:`page_size` regardless of the length of the stream.
+
+    Each line is a json object with the name of the ``stream``, the ``id`` of the
+    entry and the ``fields`` of the entry as a list of ``[field, value]`` pairs.
+    Fields and values are written as (utf-8 decoded) strings unless
+    :paramref:`binary` is ``True`` in which case they are base64 encoded (and the
+    object has an ``encoding`` member set to ``base64``).
+
+    .. versionadded:: 4.15.0
+    """
+
+    def __init__(
+        self,
+        client: Client[AnyStr],
+        page_size: int = 10000,
+        concurrency: int = 4,
+        binary: bool = False,
+    ):
+        """
+        :param client: The redis client to use
+        :param page_size: Number of entries fetched per ``XRANGE``
+        :param concurrency: Maximum number of streams exported in parallel by
+         :meth:`export_streams`
+        :param binary: Whether to base64 encode fields and values (required if the
+         entries contain values that are not valid utf-8)
+        """
+        self.client: Client[AnyStr] = client
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.binary = binary
+
+    async def export(
+        self,
+        stream: KeyT,
+        path: Union[str, Path],
+        start: Optional[ValueT] = None,
+        end: Optional[ValueT] = None,
+    ) -> int:
+        """
+        Writes the entries of :paramref:`stream` between :paramref:`start` and
+        :paramref:`end` (inclusive) to :paramref:`path`
+
+        :return: the number of entries exported
+        """
+        loop = asyncio.get_running_loop()
+        end = end or "+"
+        exported = 0
+        with open(path, "wb") as file:
+            page: Optional[
+                asyncio.Future[Tuple[StreamEntry, ...]]
+            ] = asyncio.ensure_future(
+                self.client.xrange(stream, start or "-", end, self.page_size)
+            )
+            try:
+                while page:
+                    entries = await page
+                    page = None
+                    if len(entries) == self.page_size:
+                        page = asyncio.ensure_future(
+                            self.client.xrange(
+                                stream,
+                                _next_identifier(entries[-1].identifier),
+                                end,
+                                self.page_size,
+                            )
+                        )
+                    if entries:
+                        lines = [self._serialize(stream, entry) for entry in entries]
+                        await loop.run_in_executor(None, file.writelines, lines)
+                        exported += len(entries)
+            finally:
+                if page:
+                    page.cancel()
+        return exported
+
+    async def export_streams(
+        self, streams: Mapping[KeyT, Union[str, Path]]
+    ) -> Dict[KeyT, int]:
+        """
+        Exports multiple streams in parallel (up to :paramref:`concurrency` at a
+        time)
+
+        :param streams: mapping of stream to the path to export it to
+        :return: mapping of stream to the number of entries exported
+        """
+        slots = asyncio.Semaphore(self.concurrency)
+        counts = await asyncio.gather(
+            *(
+                self._export_limited(slots, stream, path)
+                for stream, path in streams.items()
+            )
+        )
+        return dict(zip(streams, counts))
+
+    async def _export_limited(
+        self, slots: asyncio.Semaphore, stream: KeyT, path: Union[str, Path]
+    ) -> int:
+        async with slots:
+            return await self.export(stream, path)
+
+    def _serialize(self, stream: KeyT, entry: StreamEntry) -> bytes:
+        record: Dict[str, Any] = {
+            "stream": nativestr(stream),
+            "id": nativestr(entry.identifier),
+            "fields": [
+                [self._encode(field), self._encode(value)]
+                for field, value in entry.field_values.items()
+            ],
+        }
+        if self.binary:
+            record["encoding"] = "base64"
+        return b(json.dumps(record)) + b"\n"
+
+    def _encode(self, value: StringT) -> str:
+        if self.binary:
+            return base64.b64encode(b(value)).decode("ascii")
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+class StreamImporter(Generic[AnyStr]):
+    """
+    Replays files written by :class:`StreamExporter` with pipelined ``XADD``
+    commands::
+
+        importer = StreamImporter(client, rate=5000)
+        await importer.replay("orders.ndjson", stream="orders-replay")
+
+    The file is read :paramref:`batch_size` lines at a time (the next batch is
+    read while the current one is being written) so memory usage is bounded by
+    :paramref:`batch_size` regardless of the size of the file.
+
+    .. versionadded:: 4.15.0
+    """
+
+    def __init__(
+        self,
+        client: Client[AnyStr],
+        batch_size: int = 1000,
+        rate: Optional[float] = None,
+        preserve_identifiers: bool = False,
+    ):
+        """
+        :param client: The redis client to use
+        :param batch_size: Number of entries added per pipeline
+        :param rate: Maximum number of entries to add per second. If ``None``
+         entries are added as fast as the server accepts them.
+        :param preserve_identifiers: Whether to add entries with the identifiers
+         they were exported with instead of letting the server generate new ones
+         (the target stream must not contain entries with greater identifiers)
+        """
+        self.client: Client[AnyStr] = client
+        self.batch_size = batch_size
+        self.rate = rate
+        self.preserve_identifiers = preserve_identifiers
+
+    async def replay(
+        self, path: Union[str, Path], stream: Optional[KeyT] = None
+    ) -> int:
+        """
+        Adds the entries in :paramref:`path` to the streams they were exported from
+        (or to :paramref:`stream` if provided)
+
+        :return: the number of entries added
+        """
+        assert isinstance(self.client, (Redis, RedisCluster))
+        loop = asyncio.get_running_loop()
+        imported = 0
+        start = time.perf_counter()
+        with open(path, "rb") as file:
+            lines = await loop.run_in_executor(None, self._read, file)
+            while lines:
+                pipeline = await self.client.pipeline(transaction=False)
+                for line in lines:
+                    record = json.loads(line)
+                    await pipeline.xadd(
+                        stream or record["stream"],
+                        self._decode(record),
+                        identifier=record["id"] if self.preserve_identifiers else None,
+                    )
+                next_lines = loop.run_in_executor(None, self._read, file)
+                try:
+                    await pipeline.execute()
+                except BaseException:
+                    await next_lines
+                    raise
+                imported += len(lines)
+                if self.rate:
+                    delay = imported / self.rate - (time.perf_counter() - start)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                lines = await next_lines
+        return imported
+
+    def _read(self, file: IO[bytes]) -> List[bytes]:
+        lines: List[bytes] = []
+        while len(lines) < self.batch_size:
+            line = file.readline()
+            if not line:
+                break
+            if line.strip():
+                lines.append(line)
+        return lines
+
+    @staticmethod
+    def _decode(record: Dict[str, Any]) -> Dict[StringT, ValueT]:
+        if record.get("encoding") == "base64":
+            return {
+                base64.b64decode(field): base64.b64decode(value)
+                for field, value in record["fields"]
+            }
+        return {field: value for field, value in record["fields"]}
+
+
+def _next_identifier(identifier: StringT) -> str:
+    milliseconds, sequence = (int(part) for part in nativestr(identifier).split("-"))
+    if sequence == 2**64 - 1:
+        return f"{milliseconds + 1}-0"
+    return f"{milliseconds}-{sequence + 1}"
@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import click
+
+import coredis
+from coredis._utils import hash_slots, make_hashable
+from coredis.cache import LRUCache, ResponseCache
+from coredis.connection import ClusterConnection
+from coredis.pool.nodemanager import HASH_SLOTS, ManagedNode
+from coredis.stream import GroupConsumer, StreamProcessor
+
+
+class SimulatedClusterConnection(ClusterConnection):
+    """
+    Cluster connection that never touches the network and instead
+    responds to every request after the latency configured for
+    the port it was created for.
+    """
+
+    latencies: dict[int, float] = {}
+    connected: bool = False
+
+    async def connect(self) -> None:
+        # tcp handshake followed by the HELLO/AUTH handshake
+        await asyncio.sleep(2 * self.latencies[self.port])
+        self.connected = True
+        self.needs_handshake = False
+
+    @property
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def _respond(self, replies: list) -> list[asyncio.Future]:
+        loop = asyncio.get_running_loop()
+        futures = []
+        for reply in replies:
+            future = loop.create_future()
+            loop.call_later(self.latencies[self.port], future.set_result, reply)
+            futures.append(future)
+        return futures
+
+    @staticmethod
+    def _reply(command: bytes, args) -> object:
+        if command == b"MGET":
+            return [b"value"] * len(args)
+        return b"OK"
+
+    async def create_request(self, command, *args, **kwargs):
+        if not self.is_connected:
+            await self.connect()
+        return self._respond([self._reply(command, args)])[0]
+
+    async def create_requests(self, commands, raise_exceptions=True, timeout=None):
+        if not self.is_connected:
+            await self.connect()
+        return self._respond([self._reply(cmd.command, cmd.args) for cmd in commands])
+
+
+def simulated_cluster(latencies: list[float]) -> coredis.RedisCluster:
+    """
+    Returns a cluster client whose topology consists of one primary
+    per entry in :paramref:`latencies` with the slots evenly distributed
+    """
+    client = coredis.RedisCluster(
+        "127.0.0.1",
+        7000,
+        connection_pool_cls=coredis.ClusterConnectionPool,
+        connection_class=SimulatedClusterConnection,
+        max_connections=len(latencies) * 2,
+    )
+    nodes = client.connection_pool.nodes
+    shard_size = HASH_SLOTS // len(latencies) + 1
+    for idx, latency in enumerate(latencies):
+        node = ManagedNode("127.0.0.1", 7000 + idx, "primary", f"node-{idx}")
+        SimulatedClusterConnection.latencies[node.port] = latency
+        nodes.nodes[node.name] = node
+        for slot in range(idx * shard_size, min((idx + 1) * shard_size, HASH_SLOTS)):
+            nodes.slots[slot] = [node]
+    client.connection_pool.initialized = True
+    return client
+
+
+def cpu_bound_handler(stream, entry, iterations: int = 20000) -> int:
+    """
+    Stream entry handler that burns cpu (module level so that it can be used
+    with a process pool)
+    """
+    return sum(i * i for i in range(iterations))
+
+
+@click.group()
+def benchmarks():
+    pass
+
+
+@benchmarks.command()
+@click.option("--shards", "-s", multiple=True, type=int, default=[6, 12, 18, 24, 30])
+@click.option("--commands", default=1000, help="Number of commands per pipeline")
+@click.option("--min-latency", default=0.001, help="Fastest node latency (seconds)")
+@click.option("--max-latency", default=0.005, help="Typical node latency (seconds)")
+@click.option(
+    "--slow-latency", default=0.05, help="Latency of the slowest node (seconds)"
+)
+@click.option("--rounds", default=5)
+def cluster_pipeline(
+    shards: list[int],
+    commands: int,
+    min_latency: float,
+    max_latency: float,
+    slow_latency: float,
+    rounds: int,
+):
+    """
+    Wall time of a cluster pipeline spread across all shards of a
+    simulated cluster where one node is much slower than the rest.
+    """
+
+    async def run():
+        click.echo(
+            f"{'shards':>8} {'slowest(ms)':>12} {'sum(ms)':>10} "
+            f"{'cold(ms)':>10} {'warm(ms)':>10}"
+        )
+        for count in shards:
+            latencies = [
+                random.uniform(min_latency, max_latency) for _ in range(count - 1)
+            ] + [slow_latency]
+            client = simulated_cluster(latencies)
+            elapsed = []
+            for _ in range(rounds + 1):
+                pipeline = await client.pipeline()
+                for i in range(commands):
+                    await pipeline.set(f"key:{i}", i)
+                start = time.perf_counter()
+                await pipeline.execute()
+                elapsed.append(time.perf_counter() - start)
+            click.echo(
+                f"{count:>8} {1000 * max(latencies):>12.2f} "
+                f"{1000 * sum(latencies):>10.2f} "
+                f"{1000 * elapsed[0]:>10.2f} "
+                f"{1000 * min(elapsed[1:]):>10.2f}"
+            )
+
+    asyncio.run(run())
+
+
+@benchmarks.command()
+@click.option("--keys", "-k", multiple=True, type=int, default=[1000, 10000, 100000])
+@click.option("--shards", default=6, help="Number of primaries")
+@click.option("--latency", default=0.001, help="Node latency (seconds)")
+@click.option("--rounds", default=5)
+def cross_slot_mget(keys: list[int], shards: int, latency: float, rounds: int):
+    """
+    Wall time of a cross slot ``MGET`` that is split across the slots and
+    nodes of a simulated cluster and reassembled in the order of the keys.
+    """
+
+    async def run():
+        client = simulated_cluster([latency] * shards)
+        click.echo(f"{'keys':>8} {'slots':>6} {'best(ms)':>10} {'keys/s':>12}")
+        for count in keys:
+            names = [f"key:{i}" for i in range(count)]
+            elapsed = []
+            for _ in range(rounds + 1):
+                start = time.perf_counter()
+                values = await client.mget(names)
+                elapsed.append(time.perf_counter() - start)
+                assert len(values) == count
+            best = min(elapsed[1:])
+            click.echo(
+                f"{count:>8} {len(set(hash_slots(names))):>6} "
+                f"{1000 * best:>10.2f} {count / best:>12.0f}"
+            )
+
+    asyncio.run(run())
+
+
+@benchmarks.command()
+@click.option("--host", default="127.0.0.1")
+@click.option("--port", default=7000)
+@click.option("--channels", default=10000, help="Number of shard channels")
+@click.option("--messages", default=5, help="Messages published per channel")
+@click.option("--buffer", default=1024, help="Size of the fan-in buffer")
+def sharded_pubsub(host: str, port: int, channels: int, messages: int, buffer: int):
+    """
+    Throughput of a sharded pubsub subscriber listening to many channels
+    spread across all the shards of a (redis >= 7) cluster, along with the
+    peak fan-in buffer depth and per shard lag observed while consuming.
+    """
+
+    async def run():
+        client = coredis.RedisCluster(host, port)
+        pubsub = client.sharded_pubsub(max_buffered_messages=buffer)
+        names = [f"channel:{i}" for i in range(channels)]
+        await pubsub.subscribe(*names)
+        for _ in range(channels):
+            if not await pubsub.get_message(timeout=5):
+                raise click.ClickException("Timed out waiting for subscriptions")
+        click.echo(f"{channels} channels across {len(pubsub.shard_connections)} shards")
+
+        async def publish():
+            for i in range(messages):
+                pipeline = await client.pipeline(transaction=False)
+                for name in names:
+                    await pipeline.spublish(name, str(i))
+                await pipeline.execute()
+
+        publisher = asyncio.create_task(publish())
+        expected, received, peak_depth, peak_lag = channels * messages, 0, 0, 0.0
+        start = time.perf_counter()
+        while received < expected:
+            if not await pubsub.get_message(timeout=5):
+                break
+            received += 1
+            if received % 1000 == 0:
+                metrics = pubsub.metrics
+                peak_depth = max(peak_depth, metrics.queue_depth)
+                peak_lag = max(
+                    [peak_lag, *(shard.lag for shard in metrics.shards.values())]
+                )
+        elapsed = time.perf_counter() - start
+        await publisher
+        click.echo(
+            f"received {received}/{expected} messages in {1000 * elapsed:.2f} ms "
+            f"({received / elapsed:.0f} msgs/s), peak buffer depth: {peak_depth}, "
+            f"peak shard lag: {1000 * peak_lag:.2f} ms"
+        )
+        pubsub.close()
+
+    asyncio.run(run())
+
+
+@benchmarks.command()
+@click.option("--host", default="127.0.0.1")
+@click.option("--port", default=6379)
+@click.option("--workers", "-w", multiple=True, type=int, default=[1, 4, 16])
+@click.option("--entries", default=5000, help="Number of entries to process")
+@click.option(
+    "--mode",
+    type=click.Choice(["io", "cpu"]),
+    default="io",
+    help="io: async handler that sleeps, cpu: cpu bound handler in a process pool",
+)
+@click.option("--latency", default=0.005, help="Handler latency in io mode (seconds)")
+def stream_processor(
+    host: str, port: int, workers: list[int], entries: int, mode: str, latency: float
+):
+    """
+    Throughput of a :class:`~coredis.stream.StreamProcessor` draining a stream
+    through a consumer group with different levels of concurrency.
+    """
+
+    async def io_bound_handler(stream, entry):
+        await asyncio.sleep(latency)
+
+    async def run():
+        client = coredis.Redis(host, port)
+        click.echo(f"{'workers':>8} {'elapsed(ms)':>12} {'entries/s':>12}")
+        for count in workers:
+            stream = f"benchmark:stream-processor:{count}"
+            await client.delete([stream])
+            consumer = await GroupConsumer(
+                client, [stream], "benchmark", "consumer", buffer_size=count * 10
+            )
+            for start in range(0, entries, 1000):
+                pipeline = await client.pipeline(transaction=False)
+                for i in range(start, min(start + 1000, entries)):
+                    await pipeline.xadd(stream, {"id": i})
+                await pipeline.execute()
+            executor = ProcessPoolExecutor(count) if mode == "cpu" else None
+            processor = StreamProcessor(
+                consumer,
+                cpu_bound_handler if executor else io_bound_handler,
+                concurrency=count,
+                executor=executor,
+                batch_size=count * 10,
+            )
+            start = time.perf_counter()
+            await processor.run(drain=True)
+            elapsed = time.perf_counter() - start
+            if executor:
+                executor.shutdown()
+            await consumer.close()
+            await client.delete([stream])
+            assert processor.processed == entries
+            click.echo(
+                f"{count:>8} {1000 * elapsed:>12.2f} {processor.processed / elapsed:>12.0f}"
+            )
+
+    asyncio.run(run())
+
+
+class NestedResponseCache:
+    """
+    The ``key -> command -> arguments`` layout of nested :class:`LRUCache`
+    instances previously used by the tracking caches (for comparison with
+    :class:`ResponseCache`)
+    """
+
+    def __init__(self, max_keys: int, max_bytes: int):
+        self.cache = LRUCache(max_keys, max_bytes)
+
+    def get(self, key, command, args):
+        return self.cache.get(key).get(command).get(make_hashable(*args))
+
+    def put(self, key, command, args, value):
+        self.cache.setdefault(key, LRUCache()).setdefault(command, LRUCache()).insert(
+            make_hashable(*args), value
+        )
+
+    def invalidate(self, key):
+        self.cache.remove(key)
+
+
+@benchmarks.command()
+@click.option("--keys", default=10000, help="Number of distinct keys")
+@click.option("--operations", default=100000, help="Number of operations per phase")
+@click.option("--value-size", default=100, help="Size of cached values (bytes)")
+@click.option("--max-bytes", default=64 * 1024 * 1024, help="Cache size limit")
+def tracking_cache(keys: int, operations: int, value_size: int, max_bytes: int):
+    """
+    Cost of the get, put and invalidate operations performed by the
+    tracking caches on the flat :class:`~coredis.cache.ResponseCache`
+    compared to nested :class:`~coredis.cache.LRUCache` instances.
+    """
+    value = b"x" * value_size
+    names = [f"key:{i}".encode() for i in range(keys)]
+    commands = [b"GET", b"STRLEN", b"GETRANGE"]
+    lookups = [
+        (random.choice(names), random.choice(commands)) for _ in range(operations)
+    ]
+
+    click.echo(
+        f"{'cache':>10} {'put(ops/s)':>12} {'get(ops/s)':>12} {'invalidate(ops/s)':>18}"
+    )
+    for name, cache in [
+        ("nested", NestedResponseCache(keys, max_bytes)),
+        ("flat", ResponseCache(keys, max_bytes)),
+    ]:
+        rates = []
+        start = time.perf_counter()
+        for key, command in lookups:
+            cache.put(key, command, (key, 0, -1), value)
+        rates.append(operations / (time.perf_counter() - start))
+        start = time.perf_counter()
+        for key, command in lookups:
+            try:
+                cache.get(key, command, (key, 0, -1))
+            except KeyError:
+                pass
+        rates.append(operations / (time.perf_counter() - start))
+        start = time.perf_counter()
+        for key, _ in lookups:
+            cache.invalidate(key)
+        rates.append(operations / (time.perf_counter() - start))
+        click.echo(f"{name:>10} {rates[0]:>12.0f} {rates[1]:>12.0f} {rates[2]:>18.0f}")
+
+
+if __name__ == "__main__":
+    benchmarks()
@@ -9,10 +9,16 @@ import pytest
 
 from coredis import Redis
 from coredis.connection import ClusterConnection, Connection, UnixDomainSocketConnection
-from coredis.exceptions import ConnectionError, RedisClusterException
+from coredis.exceptions import CircuitOpenError, ConnectionError, RedisClusterException
 from coredis.parser import Parser
 from coredis.pool import ClusterConnectionPool, ConnectionPool
 from coredis.pool.nodemanager import ManagedNode
+from coredis.pool.selection import (
+    LeastPendingSelector,
+    LowestLatencySelector,
+    ZoneAffinitySelector,
+)
+from coredis.retry import CircuitBreaker, CircuitState
 from tests.conftest import targets
 
 
@@ -300,6 +306,24 @@ class TestConnectionPool:
             "Only 'pubsub' commands can use get_connection()"
         )
 
+    async def test_get_connection_circuit_open(self):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.1)
+        pool = await self.get_pool(connection_kwargs={"circuit_breaker": breaker})
+        node = ManagedNode(host="127.0.0.1", port=7000)
+        breaker.record_failure(node.name, ConnectionError())
+        pool.release(await pool.get_connection_by_node(node))
+        breaker.record_failure(node.name, ConnectionError())
+        with pytest.raises(CircuitOpenError):
+            await pool.get_connection_by_node(node)
+        pool.release(
+            await pool.get_connection_by_node(ManagedNode(host="127.0.0.1", port=7001))
+        )
+        await asyncio.sleep(0.1)
+        pool.release(await pool.get_connection_by_node(node))
+        assert breaker.state(node.name) == CircuitState.HALF_OPEN
+        breaker.record_success(node.name)
+        assert breaker.state(node.name) == CircuitState.CLOSED
+
     async def test_master_node_by_slot(self):
         pool = await self.get_pool(connection_kwargs={})
         node = pool.get_primary_node_by_slot(0)
@@ -376,6 +400,21 @@ class TestReadOnlyConnectionPool:
         assert f"ClusterConnection<host={host_ip},port=7001>" in repr(pool)
         assert f"ClusterConnection<host={host_ip},port=7000>" in repr(pool)
 
+    async def test_replica_selector(self):
+        selector = LowestLatencySelector(exploration=0)
+        pool = await self.get_pool(connection_kwargs={"replica_selector": selector})
+        primary, replica, *others = pool.nodes.slots[0]
+        selector.request_finished(primary, 0.01)
+        selector.request_finished(replica, 0.001)
+        for other in others:
+            selector.request_finished(other, 0.02)
+        assert pool.get_node_by_slot(0, b"GET") == replica
+        assert pool.get_node_by_slot(0, b"SET") == primary
+        for _ in range(10):
+            selector.request_finished(replica, 0.1)
+        assert pool.get_node_by_slot(0, b"GET") == primary
+        assert pool.get_replica_node_by_slots([0], replica_only=True) != primary
+
     async def test_max_connections(self):
         pool = await self.get_pool(max_connections=6)
         for port in range(7000, 7006):
@@ -388,6 +427,58 @@ class TestReadOnlyConnectionPool:
             )
 
 
+class TestReplicaSelectors:
+    nodes = [
+        ManagedNode("10.0.0.1", 7000, "primary"),
+        ManagedNode("10.0.0.2", 7001, "replica"),
+        ManagedNode("10.0.0.3", 7002, "replica"),
+    ]
+
+    def test_lowest_latency(self):
+        selector = LowestLatencySelector(alpha=0.5, exploration=0)
+        for node, latency in zip(self.nodes[:2], [0.004, 0.002]):
+            selector.request_finished(node, latency)
+        assert selector.select(self.nodes) == self.nodes[2]
+        selector.request_finished(self.nodes[2], 0.003)
+        assert selector.select(self.nodes) == self.nodes[1]
+        selector.request_finished(self.nodes[1], 0.006)
+        selector.request_finished(self.nodes[1], None)
+        assert selector.latency(self.nodes[1]) == pytest.approx(0.004)
+        assert selector.select(self.nodes) == self.nodes[2]
+        with pytest.raises(ValueError):
+            LowestLatencySelector(alpha=0)
+
+    def test_least_pending(self):
+        selector = LeastPendingSelector()
+        busy = self.nodes[:2]
+        for node in busy:
+            selector.request_started(node)
+            selector.request_started(node)
+        assert all(
+            selector.select([self.nodes[0], self.nodes[2]]) == self.nodes[2]
+            for _ in range(10)
+        )
+        selector.request_finished(self.nodes[0], 0.1)
+        selector.request_finished(self.nodes[0], None)
+        assert selector.pending(self.nodes[0]) == 0
+        assert selector.pending(self.nodes[1]) == 2
+
+    def test_zone_affinity(self):
+        selector = ZoneAffinitySelector(
+            "a", {"10.0.0.2": "a", "10.0.0.3:7002": "a", "10.0.0.1": "b"}
+        )
+        assert all(selector.select(self.nodes) in self.nodes[1:] for _ in range(30))
+        assert selector.select(self.nodes[:1]) == self.nodes[0]
+        fallback = LowestLatencySelector(exploration=0)
+        selector = ZoneAffinitySelector(
+            "b", lambda node: "b" if node.port > 7000 else "a", fallback
+        )
+        selector.request_finished(self.nodes[1], 0.002)
+        selector.request_finished(self.nodes[2], 0.001)
+        assert selector.select(self.nodes) == self.nodes[2]
+        assert fallback.latency(self.nodes[2]) == 0.001
+
+
 class TestConnectionPoolURLParsing:
     def test_defaults(self):
         pool = ConnectionPool.from_url("redis://localhost")
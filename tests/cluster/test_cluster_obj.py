@@ -10,11 +10,20 @@ import pytest
 
 import coredis
 from coredis import RedisCluster
+from coredis._utils import hash_slot
 
 # rediscluster imports
-from coredis.exceptions import ClusterDownError
+from coredis.exceptions import (
+    CircuitOpenError,
+    ClusterDownError,
+    ConnectionError,
+    RedisClusterException,
+)
 from coredis.pool import ClusterConnectionPool
-from coredis.pool.nodemanager import ManagedNode
+from coredis.pool.nodemanager import HASH_SLOTS, ManagedNode
+from coredis.pool.selection import LeastPendingSelector, LowestLatencySelector
+from coredis.pool.topology import FileTopologyStore
+from coredis.retry import CircuitBreaker, CircuitState
 
 pytestmark = [pytest.mark.asyncio]
 
@@ -56,6 +65,174 @@ async def test_single_node_cluster_down_retry(mocker):
     assert e.call_count == 3
 
 
+async def test_circuit_breaker_fail_fast(mocker):
+    state_changes = []
+    rc = RedisCluster(
+        host="127.0.0.1",
+        port=7000,
+        decode_responses=True,
+        circuit_breaker=CircuitBreaker(
+            failure_threshold=2,
+            on_state_change=lambda *a: state_changes.append(a),
+        ),
+    )
+    await rc.set("fubar{a}", 1)
+    node = rc.connection_pool.get_primary_node_by_slot(
+        rc._determine_slots(b"GET", "fubar{a}").pop()
+    )
+    e = mocker.patch.object(coredis.pool.cluster.ClusterConnection, "create_request")
+
+    async def raise_connection_error(*a, **k):
+        raise ConnectionError("dead")
+
+    e.side_effect = raise_connection_error
+
+    with pytest.raises(CircuitOpenError):
+        await rc.get("fubar{a}")
+    assert e.call_count == 2
+    assert state_changes == [(node.name, CircuitState.CLOSED, CircuitState.OPEN)]
+
+
+async def test_circuit_breaker_open_no_reset(mocker):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+    rc = RedisCluster(
+        host="127.0.0.1", port=7000, decode_responses=True, circuit_breaker=breaker
+    )
+    await rc.set("fubar{a}", 1)
+    node = rc.connection_pool.get_primary_node_by_slot(
+        rc._determine_slots(b"GET", "fubar{a}").pop()
+    )
+    breaker.record_failure(node.name, ConnectionError("dead"))
+    disconnect = mocker.spy(rc.connection_pool, "disconnect")
+    initialize = mocker.spy(rc.connection_pool.nodes, "initialize")
+    for _ in range(5):
+        with pytest.raises(CircuitOpenError):
+            await rc.get("fubar{a}")
+    assert disconnect.call_count == 0
+    assert initialize.call_count == 0
+
+
+def delay_nodes(client, delays):
+    execute = client._execute_command_on_single_node
+    active = []
+    peak = []
+
+    async def delayed(command, *args, node=None, **kwargs):
+        active.append(node)
+        peak.append(len(active))
+        try:
+            await asyncio.sleep(delays.get(node.name, 0) if node else 0)
+            return await execute(command, *args, node=node, **kwargs)
+        finally:
+            active.remove(node)
+
+    client._execute_command_on_single_node = delayed
+    return peak
+
+
+async def test_fan_out_node_timeout(redis_cluster):
+    await redis_cluster.set("fubar{a}", 1)
+    await redis_cluster.set("fubar{b}", 1)
+    slow = redis_cluster.connection_pool.get_primary_node_by_slot(
+        redis_cluster._determine_slots(b"GET", "fubar{a}").pop()
+    )
+    peak = delay_nodes(redis_cluster, {slow.name: 0.5})
+    with redis_cluster.fan_out(node_timeout=0.1) as fan_out:
+        assert await redis_cluster.keys("fubar*") == {"fubar{b}"}
+        assert await redis_cluster.exists(["fubar{a}", "fubar{b}"]) == 1
+    assert fan_out.timed_out == {slow.name}
+    assert max(peak) > 1
+    assert await redis_cluster.keys("fubar*") == {"fubar{a}", "fubar{b}"}
+
+
+async def test_fan_out_concurrency(redis_cluster):
+    peak = delay_nodes(redis_cluster, {})
+    with redis_cluster.fan_out(concurrency=1) as fan_out:
+        await redis_cluster.flushdb()
+        assert await redis_cluster.exists(["fubar{a}", "fubar{b}"]) == 0
+    assert max(peak) == 1
+    assert not fan_out.timed_out
+
+
+async def test_fan_out_iter(redis_cluster):
+    keys = {f"fubar{{{i}}}" for i in range(100)}
+    await asyncio.gather(*(redis_cluster.set(key, 1) for key in keys))
+    streamed = [key async for key in redis_cluster.fan_out_iter(redis_cluster.keys)]
+    assert len(streamed) == len(set(streamed))
+    assert set(streamed) == keys
+    slow = redis_cluster.connection_pool.get_primary_node_by_slot(
+        redis_cluster._determine_slots(b"GET", "fubar{1}").pop()
+    )
+    delay_nodes(redis_cluster, {slow.name: 0.5})
+    with redis_cluster.fan_out(node_timeout=0.1) as fan_out:
+        streamed = [
+            key async for key in redis_cluster.fan_out_iter(redis_cluster.keys, "*")
+        ]
+    assert "fubar{1}" not in streamed
+    assert fan_out.timed_out == {slow.name}
+    with pytest.raises(RedisClusterException, match="can not be streamed"):
+        async for _ in redis_cluster.fan_out_iter(
+            redis_cluster.exists, ["fubar{a}", "fubar{b}"]
+        ):
+            pass
+
+
+async def test_replica_selector_feedback():
+    selector = LowestLatencySelector()
+    pending = LeastPendingSelector()
+    rc = RedisCluster(
+        host="127.0.0.1",
+        port=7000,
+        decode_responses=True,
+        read_from_replicas=True,
+        replica_selector=selector,
+    )
+    await rc.set("fubar{a}", 1)
+    for _ in range(10):
+        await rc.get("fubar{a}")
+    slot = rc._determine_slots(b"GET", "fubar{a}").pop()
+    nodes = rc.connection_pool.nodes.slots[slot]
+    assert all(selector.latency(node) is not None for node in nodes)
+    assert selector.latency(nodes[0]) > 0
+
+    rc = RedisCluster(
+        host="127.0.0.1",
+        port=7000,
+        decode_responses=True,
+        read_from_replicas=True,
+        replica_selector=pending,
+    )
+    await asyncio.gather(*(rc.get("fubar{a}") for _ in range(10)))
+    assert all(pending.pending(node) == 0 for node in nodes)
+
+
+async def test_topology_store(redis_cluster, tmp_path):
+    store = FileTopologyStore(tmp_path / "topology.json")
+    rc = RedisCluster(host="127.0.0.1", port=7000, topology_store=store)
+    await rc.set("fubar", 1)
+    assert await store.load() == rc.connection_pool.nodes.snapshot()
+
+    # The startup node is unreachable but the client can route with the
+    # topology restored from the store
+    warm = RedisCluster(
+        host="6.6.6.6", port=1234, decode_responses=True, topology_store=store
+    )
+    assert await warm.get("fubar") == "1"
+    await warm.connection_pool.nodes._verification
+
+
+async def test_moved_redirection_after_topology_restore(redis_cluster):
+    rc = RedisCluster(host="127.0.0.1", port=7000, decode_responses=True)
+    await rc.set("foo", "bar")
+    nodes = rc.connection_pool.nodes
+    stale = nodes.snapshot()
+    stale["slots"] = [[0, HASH_SLOTS - 1, ["127.0.0.1:7000"]]]
+    assert nodes.restore(stale)
+    assert await rc.get("foo") == "bar"
+    assert nodes.node_from_slot(hash_slot(b"foo")).port == 7002
+    assert nodes.node_from_slot(0).port == 7000
+
+
 async def test_moved_redirection():
     """
     Test that the client handles MOVED response.
@@ -11,7 +11,9 @@ import pytest
 # rediscluster imports
 from coredis.client import Redis
 from coredis.exceptions import ConnectionError, RedisClusterException, RedisError
+from coredis.pool import ClusterConnectionPool
 from coredis.pool.nodemanager import HASH_SLOTS, ManagedNode, NodeManager
+from coredis.pool.topology import FileTopologyStore
 
 
 @pytest.mark.min_python("3.8")
@@ -377,3 +379,79 @@ async def test_init_with_down_node(redis_cluster):
 async def test_cluster_initialization_fail(redis_cluster_auth, cloner):
     with pytest.raises(RedisClusterException, match="invalid username-password pair"):
         await cloner(redis_cluster_auth, password="wrong")
+
+
+async def test_topology_snapshot_restore(redis_cluster):
+    n = NodeManager(startup_nodes=[{"host": "127.0.0.1", "port": 7000}])
+    await n.initialize()
+    restored = NodeManager(startup_nodes=[])
+    assert restored.restore(n.snapshot())
+    assert restored.nodes == n.nodes
+    assert restored.slots == n.slots
+    assert restored.replicas_per_shard == n.replicas_per_shard
+
+
+def test_topology_snapshot_restore_invalid():
+    n = NodeManager(startup_nodes=[])
+    assert not n.restore({})
+    assert not n.restore({"nodes": [], "slots": [[0, 10, ["127.0.0.1:7000"]]]})
+    assert not n.restore(
+        {
+            "nodes": [{"host": "127.0.0.1", "port": 7000, "server_type": "primary"}],
+            "slots": [[0, 10, ["127.0.0.1:7000"]]],
+        }
+    )
+    assert not n.nodes
+
+
+async def test_topology_store(redis_cluster, tmp_path):
+    store = FileTopologyStore(tmp_path / "topology.json")
+    n = NodeManager(
+        startup_nodes=[{"host": "127.0.0.1", "port": 7000}], topology_store=store
+    )
+    await n.initialize()
+    assert await store.load() == n.snapshot()
+
+    unreachable = NodeManager(
+        startup_nodes=[{"host": "6.6.6.6", "port": 1234}], topology_store=store
+    )
+    with patch.object(NodeManager, "get_redis_link") as get_redis_link:
+        get_redis_link.side_effect = RedisError("foobar")
+        await unreachable.initialize()
+        assert unreachable.slots == n.slots
+        assert unreachable.startup_nodes[-1].name == "6.6.6.6:1234"
+        with pytest.warns(UserWarning, match="Unable to verify"):
+            await unreachable._verification
+    assert unreachable.slots == n.slots
+
+
+async def test_topology_store_verification(redis_cluster, tmp_path):
+    store = FileTopologyStore(tmp_path / "topology.json")
+    n = NodeManager(
+        startup_nodes=[{"host": "127.0.0.1", "port": 7000}], topology_store=store
+    )
+    await n.initialize()
+    stale = n.snapshot()
+    stale["slots"] = [[0, HASH_SLOTS - 1, [stale["nodes"][0]["host"] + ":7000"]]]
+    await store.save(stale)
+
+    restored = NodeManager(startup_nodes=[], topology_store=store)
+    await restored.initialize()
+    assert len({nodes[0].name for nodes in restored.slots.values()}) == 1
+    await restored._verification
+    assert restored.slots == n.slots
+    assert await store.load() == n.snapshot()
+
+
+async def test_topology_store_verification_cancelled(redis_cluster, tmp_path):
+    store = FileTopologyStore(tmp_path / "topology.json")
+    n = NodeManager(
+        startup_nodes=[{"host": "127.0.0.1", "port": 7000}], topology_store=store
+    )
+    await n.initialize()
+    pool = ClusterConnectionPool(startup_nodes=[], topology_store=store)
+    await pool.initialize()
+    verification = pool.nodes._verification
+    pool.disconnect()
+    with pytest.raises(asyncio.CancelledError):
+        await verification
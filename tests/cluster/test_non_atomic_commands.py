@@ -39,6 +39,19 @@ class TestCommandSplit:
         assert await client.unlink(cross_slot_keys) == 18
         assert not await client.keys("*")
 
+    async def test_mget(self, client, cross_slot_keys, _s):
+        keys = sorted(cross_slot_keys)
+        assert await client.mget(keys) == tuple(
+            _s(1) if key[0] in "abc" else None for key in keys
+        )
+
+    async def test_mset(self, client, cross_slot_keys, _s):
+        keys = sorted(cross_slot_keys)
+        assert await client.mset({key: key for key in keys})
+        assert await client.mget(reversed(keys)) == tuple(
+            _s(key) for key in reversed(keys)
+        )
+
 
 @pytest.mark.parametrize("client_arguments", [({"non_atomic_cross_slot": False})])
 @targets(
@@ -61,3 +74,11 @@ class TestCommandSplitDisabled:
     async def test_unlink(self, client, cross_slot_keys, client_arguments):
         with pytest.raises(RedisClusterException):
             await client.unlink(cross_slot_keys)
+
+    async def test_mget(self, client, cross_slot_keys, client_arguments):
+        with pytest.raises(RedisClusterException):
+            await client.mget(cross_slot_keys)
+
+    async def test_mset(self, client, cross_slot_keys, client_arguments):
+        with pytest.raises(RedisClusterException):
+            await client.mset({key: 1 for key in cross_slot_keys})
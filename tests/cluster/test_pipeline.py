@@ -4,6 +4,7 @@ import asyncio
 
 import pytest
 
+from coredis._utils import hash_slot
 from coredis.exceptions import (
     AuthorizationError,
     ClusterCrossSlotError,
@@ -254,6 +255,43 @@ class TestPipeline:
 
             assert (True, _s("1")) == await pipe.execute()
 
+    @pytest.mark.parametrize(
+        "cluster_remap_keyslots", [("a{fu}", "b{fu}", "c{bar}", "d{bar}")]
+    )
+    async def test_moved_errors_repipelined(
+        self, client, cluster_remap_keyslots, mocker, _s
+    ):
+        execute_command = mocker.spy(client, "execute_command")
+        async with await client.pipeline() as pipe:
+            for key in ["a{fu}", "b{fu}", "c{bar}", "d{bar}"]:
+                await pipe.set(key, 1)
+                await pipe.get(key)
+            assert (True, _s("1")) * 4 == await pipe.execute()
+        execute_command.assert_not_called()
+
+    async def test_ask_errors_repipelined(self, client, mocker, _s):
+        slot = hash_slot(b"a{fu}")
+        nodes = client.connection_pool.nodes
+        source = nodes.node_from_slot(slot)
+        destination = [n for n in nodes.all_primaries() if n.name != source.name][0]
+        source_client = nodes.get_redis_link(source.host, source.port)
+        destination_client = nodes.get_redis_link(destination.host, destination.port)
+        await destination_client.cluster_setslot(slot, importing=source.node_id)
+        await source_client.cluster_setslot(slot, migrating=destination.node_id)
+        execute_command = mocker.spy(client, "execute_command")
+        try:
+            async with await client.pipeline() as pipe:
+                await pipe.set("a{fu}", 1)
+                await pipe.set("b{fu}", 2)
+                await pipe.set("c{bar}", 3)
+                assert (True, True, True) == await pipe.execute()
+            execute_command.assert_not_called()
+            assert await destination_client.execute_command(b"DBSIZE") == 2
+        finally:
+            await source_client.cluster_setslot(slot, stable=True)
+            await destination_client.cluster_setslot(slot, stable=True)
+            await destination_client.flushdb()
+
     @pytest.mark.parametrize(
         "function, args, kwargs",
         [
@@ -389,6 +389,35 @@ class TestPubSubMessages:
         # Cleanup pubsub connections
         p.close()
 
+    @pytest.mark.min_server_version("7.0")
+    async def test_sharded_channel_ordering_and_metrics(self, redis_cluster):
+        shards = ["a", "b", "c"]
+        p = redis_cluster.sharded_pubsub(
+            ignore_subscribe_messages=True, max_buffered_messages=8
+        )
+        for shard in shards:
+            await p.subscribe(f"foo{{{shard}}}")
+        assert not await wait_for_message(p)
+        for i in range(10):
+            for shard in shards:
+                await redis_cluster.spublish(f"foo{{{shard}}}", str(i))
+        await asyncio.sleep(0.1)
+        metrics = p.metrics
+        assert metrics.queue_depth == 8
+        assert sum(shard.pending for shard in metrics.shards.values()) > 8
+        assert max(shard.lag for shard in metrics.shards.values()) > 0
+
+        received = {f"foo{{{shard}}}": [] for shard in shards}
+        for _ in range(30):
+            message = await wait_for_message(p)
+            received[message["channel"]].append(message["data"])
+        assert all(data == [str(i) for i in range(10)] for data in received.values())
+        metrics = p.metrics
+        assert metrics.queue_depth == 0
+        assert all(shard.pending == 0 for shard in metrics.shards.values())
+        assert sum(shard.received for shard in metrics.shards.values()) == 33
+        p.close()
+
     async def test_published_message_to_pattern(self, redis_cluster):
         p = redis_cluster.pubsub(ignore_subscribe_messages=True)
         try:
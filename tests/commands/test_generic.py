@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import time
 
@@ -621,3 +622,34 @@ class TestGeneric:
         assert keys == {_s("a"), _s("b"), _s("c")}
         async for key in client.scan_iter(match="a"):
             assert key == _s("a")
+
+    async def test_scan_iter_multiple_pages(self, client, _s):
+        await asyncio.gather(
+            *(client.set(f"key{{{i % 10}}}:{i}", i) for i in range(500))
+        )
+        keys = [key async for key in client.scan_iter(count=10)]
+        assert len(keys) == len(set(keys)) == 500
+        scan = client.scan_iter(match="key*", count=10)
+        first = []
+        async for key in scan:
+            first.append(key)
+            if len(first) == 15:
+                break
+        await scan.aclose()
+        assert len(set(first)) == 15
+        assert await client.get(_s("key{0}:0")) == _s("0")
+
+    @pytest.mark.clusteronly
+    async def test_scan_iter_concurrent(self, client, _s):
+        await asyncio.gather(
+            *(client.set(f"key{{{i % 10}}}:{i}", i) for i in range(500))
+        )
+        keys = [key async for key in client.scan_iter(count=10, concurrency=3)]
+        assert len(keys) == len(set(keys)) == 500
+        keys = [key async for key in client.scan_iter(match="key{1}*", concurrency=8)]
+        assert set(keys) == {_s(f"key{{1}}:{i}") for i in range(1, 500, 10)}
+        scan = client.scan_iter(count=10, concurrency=3)
+        async for key in scan:
+            break
+        await scan.aclose()
+        assert await client.get(_s("key{0}:0")) == _s("0")
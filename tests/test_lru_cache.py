@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
-from coredis.cache import LRUCache
+from coredis.cache import (
+    LRUCache,
+    NodeTrackingCache,
+    PrefixTrie,
+    ResponseCache,
+    estimate_size,
+)
 
 
 class TestLRUCache:
@@ -13,7 +21,6 @@ class TestLRUCache:
         with pytest.raises(KeyError):
             cache.get("a")
 
-    @pytest.mark.nopypy
     def test_max_bytes(self):
         cache = LRUCache(max_bytes=500)
         cache.insert("a", bytearray(400))
@@ -22,3 +29,223 @@ class TestLRUCache:
         cache.get("b")
         with pytest.raises(KeyError):
             cache.get("a")
+
+    def test_max_bytes_enforced_on_insert(self):
+        cache = LRUCache(max_bytes=1000)
+        for i in range(100):
+            cache.insert(i, bytearray(100))
+        assert cache.size <= 1000
+        cache.get(99)
+        with pytest.raises(KeyError):
+            cache.get(0)
+
+    def test_size_accounting(self):
+        cache = LRUCache()
+        empty = cache.size
+        cache.insert("a", b"x" * 100)
+        size = cache.size
+        assert size > empty + 100
+        cache.insert("a", b"x" * 10)
+        assert cache.size == size - 90
+        cache.remove("a")
+        assert cache.size == empty
+        cache.insert("b", [b"x" * 100, {b"y": b"z" * 100}])
+        assert cache.size > empty + estimate_size([b"x" * 100, {b"y": b"z" * 100}])
+        cache.clear()
+        assert cache.size == empty
+
+    def test_nested_size_accounting(self):
+        cache = LRUCache(max_bytes=2000)
+        empty = cache.size
+        cache.setdefault("a", LRUCache()).setdefault("b", LRUCache()).insert(
+            "c", b"x" * 100
+        )
+        cache.setdefault("d", LRUCache()).insert("e", b"x" * 100)
+        size, nested_size = cache.size, cache.get("a").get("b").size
+        assert size > empty + 200
+        cache.get("a").get("b").remove("c")
+        assert cache.get("a").get("b").size < nested_size - 100
+        assert cache.size == size - (nested_size - cache.get("a").get("b").size)
+        for i in range(100):
+            cache.get("d").insert(i, b"x" * 100)
+        assert cache.size <= 2000
+        with pytest.raises(KeyError):
+            cache.get("a")
+        cache.get("d").get(99)
+        cache.remove("d")
+        assert cache.size == empty
+
+
+class TestResponseCache:
+    def test_get_put(self):
+        cache = ResponseCache()
+        cache.put(b"a", b"GET", ("a",), b"1")
+        cache.put(b"a", b"HGET", ("a", "f"), b"2")
+        cache.put(b"b", b"SMISMEMBER", ("b", ["x", "y"]), (True, False))
+        assert cache.get(b"a", b"GET", ("a",)) == b"1"
+        assert cache.get(b"a", b"HGET", ("a", "f")) == b"2"
+        assert cache.get(b"b", b"SMISMEMBER", ("b", ["x", "y"])) == (True, False)
+        with pytest.raises(KeyError):
+            cache.get(b"a", b"HGET", ("a", "g"))
+
+    def test_invalidate(self):
+        cache = ResponseCache()
+        cache.put(b"a", b"GET", ("a",), b"1")
+        cache.put(b"a", b"STRLEN", ("a",), 1)
+        cache.put(b"b", b"GET", ("b",), b"2")
+        cache.invalidate(b"a")
+        cache.invalidate(b"c")
+        with pytest.raises(KeyError):
+            cache.get(b"a", b"GET", ("a",))
+        with pytest.raises(KeyError):
+            cache.get(b"a", b"STRLEN", ("a",))
+        assert cache.get(b"b", b"GET", ("b",)) == b"2"
+        cache.invalidate(b"b")
+        assert cache.size == 0
+
+    def test_max_keys(self):
+        cache = ResponseCache(max_keys=2)
+        cache.put(b"a", b"GET", ("a",), b"1")
+        cache.put(b"a", b"STRLEN", ("a",), 1)
+        cache.put(b"b", b"GET", ("b",), b"2")
+        cache.get(b"a", b"GET", ("a",))
+        cache.put(b"c", b"GET", ("c",), b"3")
+        with pytest.raises(KeyError):
+            cache.get(b"b", b"GET", ("b",))
+        assert cache.get(b"a", b"GET", ("a",)) == b"1"
+        assert cache.get(b"a", b"STRLEN", ("a",)) == 1
+        cache.put(b"d", b"GET", ("d",), b"4")
+        with pytest.raises(KeyError):
+            cache.get(b"c", b"GET", ("c",))
+        assert cache.get(b"d", b"GET", ("d",)) == b"4"
+
+    def test_lru_cache_deprecated(self):
+        with pytest.warns(DeprecationWarning):
+            cache = NodeTrackingCache(cache=LRUCache(max_items=1, max_bytes=1000))
+        cache.put(b"GET", b"a", value=b"1")
+        cache.put(b"GET", b"b", value=b"2")
+        with pytest.raises(KeyError):
+            cache.get(b"GET", b"a")
+        assert cache.get(b"GET", b"b") == b"2"
+
+    def test_max_bytes(self):
+        cache = ResponseCache(max_bytes=1000)
+        for i in range(100):
+            cache.put(b"a", b"HGET", ("a", i), bytearray(100))
+        assert 0 < cache.size <= 1000
+        cache.get(b"a", b"HGET", ("a", 99))
+        with pytest.raises(KeyError):
+            cache.get(b"a", b"HGET", ("a", 0))
+        cache.put(b"b", b"GET", ("b",), bytearray(2000))
+        with pytest.raises(KeyError):
+            cache.get(b"b", b"GET", ("b",))
+
+    async def test_clear_in_flight(self):
+        cache = ResponseCache()
+        fetched = asyncio.Event()
+
+        async def fetch():
+            fetched.set()
+            await asyncio.sleep(0.01)
+            return b"1"
+
+        request = asyncio.ensure_future(cache.coalesce(b"a", b"GET", ("a",), fetch))
+        await fetched.wait()
+        cache.clear()
+        assert await request == b"1"
+        with pytest.raises(KeyError):
+            cache.get(b"a", b"GET", ("a",))
+
+        async def clearing_fetch():
+            cache.clear()
+            return b"2"
+
+        assert await cache.coalesce(b"a", b"GET", ("a",), clearing_fetch) == b"2"
+        assert cache.get(b"a", b"GET", ("a",)) == b"2"
+
+    async def test_reset_in_flight(self):
+        cache = NodeTrackingCache()
+        fetched = asyncio.Event()
+
+        async def fetch():
+            fetched.set()
+            await asyncio.sleep(0.01)
+            return b"1"
+
+        request = asyncio.ensure_future(cache.coalesce(b"GET", b"a", fetch=fetch))
+        await fetched.wait()
+        cache.reset()
+        assert await request == b"1"
+        with pytest.raises(KeyError):
+            cache.get(b"GET", b"a")
+
+    async def test_coalesce(self):
+        cache = ResponseCache()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return b"1"
+
+        responses = await asyncio.gather(
+            *(cache.coalesce(b"a", b"GET", ("a",), fetch) for _ in range(10))
+        )
+        assert responses == [b"1"] * 10
+        assert len(calls) == 1
+        assert cache.get(b"a", b"GET", ("a",)) == b"1"
+
+    async def test_coalesce_invalidated_in_flight(self):
+        cache = ResponseCache()
+        values = iter([b"stale", b"fresh"])
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return next(values)
+
+        first = asyncio.ensure_future(cache.coalesce(b"a", b"GET", ("a",), fetch))
+        await asyncio.sleep(0)
+        cache.invalidate(b"a")
+        second = asyncio.ensure_future(cache.coalesce(b"a", b"GET", ("a",), fetch))
+        assert await first == b"stale"
+        assert await second == b"fresh"
+        assert cache.get(b"a", b"GET", ("a",)) == b"fresh"
+
+    async def test_coalesce_failure(self):
+        cache = ResponseCache()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("failed")
+
+        responses = await asyncio.gather(
+            *(cache.coalesce(b"a", b"GET", ("a",), fetch) for _ in range(2)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(response, ValueError) for response in responses)
+        with pytest.raises(KeyError):
+            cache.get(b"a", b"GET", ("a",))
+
+
+class TestPrefixTrie:
+    def test_matches(self):
+        trie = PrefixTrie([b"user:", b"session:"])
+        assert trie.prefixes == (b"user:", b"session:")
+        assert trie.matches(b"user:1")
+        assert trie.matches(b"user:")
+        assert trie.matches(b"session:1:data")
+        assert not trie.matches(b"user")
+        assert not trie.matches(b"users:1")
+        assert not trie.matches(b"")
+
+    def test_empty_prefix(self):
+        trie = PrefixTrie([b""])
+        assert trie.matches(b"")
+        assert trie.matches(b"anything")
+
+    @pytest.mark.parametrize(
+        "prefixes", [[b"user:", b"user:1"], [b"user:1", b"user:"], [b"a", b"a"]]
+    )
+    def test_overlapping_prefixes(self, prefixes):
+        with pytest.raises(ValueError, match="overlaps"):
+            PrefixTrie(prefixes)
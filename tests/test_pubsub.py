@@ -7,6 +7,7 @@ import time
 import pytest
 
 import coredis
+from coredis.commands.pubsub import PatternIndex
 from coredis.exceptions import ConnectionError, PubSubError
 from tests.conftest import targets
 
@@ -264,6 +265,61 @@ class TestPubSubSubscribeUnsubscribe:
         assert p.subscribed is False
 
 
+@pytest.mark.parametrize(
+    "pattern, channel, matches",
+    [
+        ("foo", "foo", True),
+        ("foo", "foobar", False),
+        ("foo.*", "foo.bar", True),
+        ("foo.*", "fooxbar", False),
+        ("*", "", True),
+        ("h?llo", "hello", True),
+        ("h?llo", "hllo", False),
+        ("h*llo", "heeeello", True),
+        ("h[ae]llo", "hallo", True),
+        ("h[ae]llo", "hillo", False),
+        ("h[^e]llo", "hallo", True),
+        ("h[^e]llo", "hello", False),
+        ("h[a-b]llo", "hbllo", True),
+        ("h[b-a]llo", "hallo", True),
+        ("h[a-b]llo", "hcllo", False),
+        ("h\\*llo", "h*llo", True),
+        ("h\\*llo", "hello", False),
+        ("h[\\]]llo", "h]llo", True),
+    ],
+)
+@pytest.mark.parametrize("encode", [False, True])
+def test_pattern_index_glob(pattern, channel, matches, encode):
+    if encode:
+        pattern, channel = pattern.encode(), channel.encode()
+    index = PatternIndex()
+    index.add(pattern, 1)
+    assert index.match(channel) == ([(pattern, 1)] if matches else [])
+
+
+def test_pattern_index():
+    index = PatternIndex()
+    patterns = ["*", "a*", "ab*", "abc", "abc*", "b?c", "[ab]bc"]
+    for idx, pattern in enumerate(patterns):
+        index.add(pattern, idx)
+    assert len(index) == len(patterns)
+    assert sorted(index.match("abc")) == [
+        ("*", 0),
+        ("[ab]bc", 6),
+        ("a*", 1),
+        ("ab*", 2),
+        ("abc", 3),
+        ("abc*", 4),
+    ]
+    assert sorted(index.match("bbc")) == [("*", 0), ("[ab]bc", 6), ("b?c", 5)]
+    for pattern in patterns[1:]:
+        index.remove(pattern)
+    index.remove("missing")
+    assert list(index) == ["*"]
+    assert index.match("abc") == [("*", 0)]
+    assert not index._root.children
+
+
 @targets("redis_basic", "redis_basic_raw", "redis_basic_resp2", "redis_basic_raw_resp2")
 class TestPubSubMessages:
     def setup_method(self, method):
@@ -402,6 +458,218 @@ class TestPubSubMessages:
         await p.unsubscribe(channel)
         await p.punsubscribe(pattern)
 
+    async def test_get_messages(self, client, _s):
+        p = client.pubsub(ignore_subscribe_messages=True)
+        await p.subscribe("foo")
+        assert await p.get_messages(timeout=0.1) == []
+        for i in range(10):
+            await client.publish("foo", str(i))
+        await asyncio.sleep(0.1)
+        messages = await p.get_messages(max_count=6, timeout=1)
+        assert messages == [
+            make_message("message", _s("foo"), _s(str(i))) for i in range(6)
+        ]
+        messages = await p.get_messages(timeout=1)
+        assert [message["data"] for message in messages] == [
+            _s(str(i)) for i in range(6, 10)
+        ]
+        await p.unsubscribe()
+
+    async def test_get_messages_handlers(self, client, _s):
+        received = []
+
+        async def async_handler(message):
+            received.append(message["data"])
+
+        p = client.pubsub(ignore_subscribe_messages=True)
+        await p.subscribe("bar", foo=lambda message: received.append(message["data"]))
+        await p.psubscribe(**{"b*": async_handler})
+        for channel in ["foo", "bar", "foo"]:
+            await client.publish(channel, channel)
+        await asyncio.sleep(0.1)
+        messages = await p.get_messages(timeout=1)
+        assert messages == [make_message("message", _s("bar"), _s("bar"))]
+        assert received == [_s("foo"), _s("bar"), _s("foo")]
+        await p.unsubscribe()
+        await p.punsubscribe()
+
+    async def test_batches(self, client, _s):
+        p = client.pubsub(ignore_subscribe_messages=True)
+        await p.subscribe("foo")
+        for i in range(10):
+            await client.publish("foo", str(i))
+        received = []
+        async for batch in p.batches(max_count=4, timeout=1):
+            assert 0 < len(batch) <= 4
+            received.extend(message["data"] for message in batch)
+            if len(received) == 10:
+                await p.unsubscribe()
+        assert received == [_s(str(i)) for i in range(10)]
+
+    async def test_local_handlers(self, client, _s):
+        received = []
+
+        async def async_handler(message):
+            received.append(("news", message["data"]))
+
+        p = client.pubsub(ignore_subscribe_messages=True)
+        await p.psubscribe("*")
+        await p.add_local_handlers(
+            **{
+                "news.*": async_handler,
+                "*.sports": lambda message: received.append(
+                    ("sports", message["data"])
+                ),
+            }
+        )
+        for channel in ["news.tech", "news.sports", "weather"]:
+            await client.publish(channel, channel)
+        await asyncio.sleep(0.1)
+        messages = await p.get_messages(timeout=1)
+        assert messages == [
+            make_message("pmessage", _s("weather"), _s("weather"), pattern=_s("*"))
+        ]
+        assert sorted(received) == [
+            ("news", _s("news.sports")),
+            ("news", _s("news.tech")),
+            ("sports", _s("news.sports")),
+        ]
+        await p.remove_local_handlers("news.*")
+        await client.publish("news.tech", "news.tech")
+        message = await wait_for_message(p)
+        assert message["channel"] == _s("news.tech")
+        await p.punsubscribe()
+
+    async def test_subscription_hub(self, client, _s):
+        hub = client.subscription_hub(connections=2)
+        first, second = hub.subscriber(), hub.subscriber()
+        await first.subscribe("foo", "bar")
+        await second.subscribe("foo")
+        await second.psubscribe("b*")
+        assert sorted(hub.channels) == [_s("bar"), _s("foo")]
+        assert await client.pubsub_numsub("foo", "bar") == {_s("foo"): 1, _s("bar"): 1}
+        assert await first.get_message() == make_message("subscribe", _s("foo"), 1)
+        assert await first.get_message() == make_message("subscribe", _s("bar"), 2)
+        await client.publish("foo", "1")
+        await client.publish("bar", "2")
+        messages = await first.get_messages(timeout=1)
+        while len(messages) < 2:
+            messages.extend(await first.get_messages(timeout=1))
+        assert messages == [
+            make_message("message", _s("foo"), _s("1")),
+            make_message("message", _s("bar"), _s("2")),
+        ]
+        messages = await second.get_messages(timeout=1, ignore_subscribe_messages=True)
+        while len(messages) < 2:
+            messages.extend(await second.get_messages(timeout=1))
+        assert messages == [
+            make_message("message", _s("foo"), _s("1")),
+            make_message("pmessage", _s("bar"), _s("2"), pattern=_s("b*")),
+        ]
+        await first.unsubscribe("foo")
+        assert await client.pubsub_numsub("foo") == {_s("foo"): 1}
+        await second.unsubscribe()
+        await second.punsubscribe()
+        assert hub.channels == [_s("bar")]
+        assert await first.get_message() == make_message("unsubscribe", _s("foo"), 1)
+        first.close()
+        await asyncio.sleep(0.1)
+        assert hub.channels == hub.patterns == []
+        assert await client.pubsub_numsub("foo", "bar") == {_s("foo"): 0, _s("bar"): 0}
+        hub.close()
+
+    @pytest.mark.parametrize(
+        "overflow, expected",
+        [("drop_oldest", ["3", "4"]), ("drop_newest", ["0", "1"])],
+    )
+    async def test_subscription_hub_overflow(self, client, _s, overflow, expected):
+        hub = client.subscription_hub(max_buffered_messages=2, overflow=overflow)
+        slow = hub.subscriber(ignore_subscribe_messages=True)
+        fast = hub.subscriber(ignore_subscribe_messages=True, max_buffered_messages=10)
+        received = []
+        await slow.subscribe("foo")
+        await fast.subscribe(foo=lambda message: received.append(message["data"]))
+        for i in range(5):
+            await client.publish("foo", str(i))
+        await asyncio.sleep(0.1)
+        assert await fast.get_messages(timeout=1) == []
+        assert received == [_s(str(i)) for i in range(5)]
+        assert slow.dropped == 3
+        messages = await slow.get_messages(timeout=1)
+        assert [message["data"] for message in messages] == [_s(i) for i in expected]
+        hub.close()
+
+    async def test_subscription_hub_overflow_raise(self, client, _s):
+        hub = client.subscription_hub()
+        subscriber = hub.subscriber(
+            ignore_subscribe_messages=True, max_buffered_messages=1, overflow="raise"
+        )
+        await subscriber.subscribe("foo")
+        await client.publish("foo", "0")
+        await client.publish("foo", "1")
+        await asyncio.sleep(0.1)
+        with pytest.raises(PubSubError, match="overflowed"):
+            await subscriber.get_message(timeout=1)
+        message = await subscriber.get_message(timeout=1)
+        assert message["data"] == _s("0")
+        assert await subscriber.get_message(timeout=0.1) is None
+        hub.close()
+
+    async def test_subscription_hub_read_failure(self, client, _s, mocker):
+        hub = client.subscription_hub()
+        subscriber = hub.subscriber(ignore_subscribe_messages=True)
+        await subscriber.subscribe("foo")
+        await subscriber.psubscribe("b*")
+        mocker.patch.object(
+            hub.pubsubs[0], "get_messages", side_effect=ConnectionError("dead")
+        )
+        with pytest.raises(ConnectionError, match="dead"):
+            await subscriber.get_message(timeout=1)
+        await asyncio.sleep(0.1)
+        assert await client.pubsub_numsub("foo") == {_s("foo"): 1}
+        await client.publish("foo", "1")
+        await client.publish("bar", "2")
+        messages = await subscriber.get_messages(timeout=1)
+        while len(messages) < 2:
+            messages.extend(await subscriber.get_messages(timeout=1))
+        assert messages == [
+            make_message("message", _s("foo"), _s("1")),
+            make_message("pmessage", _s("bar"), _s("2"), pattern=_s("b*")),
+        ]
+        hub.close()
+
+    async def test_subscription_hub_resubscribe_failure(self, client, _s, mocker):
+        hub = client.subscription_hub()
+        subscriber = hub.subscriber(ignore_subscribe_messages=True)
+        await subscriber.subscribe("foo")
+        mocker.patch.object(
+            hub.pubsubs[0], "get_messages", side_effect=ConnectionError("dead")
+        )
+        factory = hub.pubsub_factory
+
+        def unreachable():
+            pubsub = factory()
+            mocker.patch.object(
+                pubsub, "subscribe", side_effect=ConnectionError("unreachable")
+            )
+            return pubsub
+
+        hub.pubsub_factory = unreachable
+        with pytest.raises(ConnectionError, match="dead"):
+            await subscriber.get_message(timeout=1)
+        await asyncio.sleep(0.1)
+        assert hub.channels == []
+        assert not subscriber.subscribed
+        for _ in range(2):
+            with pytest.raises(ConnectionError, match="unreachable"):
+                await subscriber.get_message(timeout=1)
+        hub.pubsub_factory = factory
+        await subscriber.subscribe("foo")
+        await client.publish("foo", "1")
+        message = await subscriber.get_message(timeout=1)
+        assert message == make_message("message", _s("foo"), _s("1"))
+        hub.close()
+
     async def test_pubsub_worker_thread_no_handler(self, client, _s):
         p = client.pubsub()
         await p.subscribe("fubar")
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import sys
 import unittest.mock
 
 import pytest
 
+from coredis.exceptions import CircuitOpenError, ConnectionError, TimeoutError
 from coredis.retry import (
+    CircuitBreaker,
+    CircuitState,
     CompositeRetryPolicy,
     ConstantRetryPolicy,
     ExponentialBackoffRetryPolicy,
@@ -117,3 +121,74 @@ class TestRetryPolicies:
 
         assert failure1.await_count == 2
         assert failure2.await_count == 1
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+        breaker.acquire("a")
+        breaker.record_failure("a", ConnectionError())
+        breaker.acquire("a")
+        breaker.record_failure("a", TimeoutError())
+        assert breaker.state("a") == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire("a")
+        breaker.acquire("b")
+
+    def test_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure("a", ConnectionError())
+        breaker.record_success("a")
+        breaker.record_failure("a", ConnectionError())
+        assert breaker.state("a") == CircuitState.CLOSED
+
+    def test_untracked_exception(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure("a", ZeroDivisionError())
+        breaker.record_failure("a", CircuitOpenError("a"))
+        assert breaker.state("a") == CircuitState.CLOSED
+
+    async def test_half_open_probe(self):
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=0.1, half_open_max_calls=1
+        )
+        breaker.record_failure("a", ConnectionError())
+        await asyncio.sleep(0.1)
+        assert breaker.state("a") == CircuitState.HALF_OPEN
+        breaker.acquire("a")
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire("a")
+        breaker.record_failure("a", ConnectionError())
+        assert breaker.state("a") == CircuitState.OPEN
+        await asyncio.sleep(0.1)
+        breaker.acquire("a")
+        breaker.record_success("a")
+        assert breaker.state("a") == CircuitState.CLOSED
+        breaker.acquire("a")
+        breaker.acquire("a")
+
+    async def test_half_open_unreported_requests(self):
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=0.1, half_open_max_calls=1
+        )
+        breaker.record_failure("a", ConnectionError())
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire("a", probe=False)
+        await asyncio.sleep(0.1)
+        breaker.acquire("a", probe=False)
+        breaker.acquire("a", probe=False)
+        breaker.acquire("a")
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire("a")
+        breaker.release("a")
+        breaker.acquire("a")
+        assert breaker.state("a") == CircuitState.HALF_OPEN
+
+    def test_state_change_callback(self):
+        callback = unittest.mock.Mock()
+        breaker = CircuitBreaker(failure_threshold=1, on_state_change=callback)
+        breaker.record_failure("a", ConnectionError())
+        callback.assert_called_once_with("a", CircuitState.CLOSED, CircuitState.OPEN)
+        breaker.reset()
+        callback.assert_called_with("a", CircuitState.OPEN, CircuitState.CLOSED)
+        assert breaker.state("a") == CircuitState.CLOSED
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import coredis
+from coredis.runner import BackgroundRunner
+
+
+@pytest.fixture
+def runner(redis_basic_server):
+    runner = BackgroundRunner(
+        lambda: coredis.Redis(*redis_basic_server, decode_responses=True)
+    )
+    with runner:
+        yield runner
+
+
+class TestBackgroundRunner:
+    def test_run(self, runner):
+        assert runner.run(runner.client.set, "runner", 1)
+        assert runner.run(runner.client.get, "runner") == "1"
+        with pytest.raises(coredis.exceptions.WrongTypeError):
+            runner.run(runner.client.lpush, "runner", [1])
+
+    def test_submit_from_threads(self, runner):
+        def work(i):
+            runner.submit(runner.client.set, f"runner:{i}", i).result()
+            return runner.submit(runner.client.get, f"runner:{i}").result()
+
+        with ThreadPoolExecutor(8) as executor:
+            assert list(executor.map(work, range(100))) == [str(i) for i in range(100)]
+
+    def test_subscribe(self, runner):
+        received, done = [], threading.Event()
+
+        def callback(message):
+            received.append((threading.current_thread().name, message["data"]))
+            if len(received) == 3:
+                done.set()
+
+        subscription = runner.subscribe(callback, "runner:a", patterns=["runner:b*"])
+        for channel in ["runner:a", "runner:b1", "runner:a"]:
+            runner.run(runner.client.publish, channel, channel)
+        assert done.wait(1)
+        assert received == [
+            ("coredis-runner", "runner:a"),
+            ("coredis-runner", "runner:b1"),
+            ("coredis-runner", "runner:a"),
+        ]
+        start = time.perf_counter()
+        subscription.stop()
+        assert time.perf_counter() - start < 0.5
+        assert not subscription.running
+        assert runner.run(runner.client.pubsub_numsub, "runner:a") == {"runner:a": 0}
+
+    def test_subscribe_executor(self, redis_basic_server):
+        received, done = [], threading.Event()
+
+        def callback(message):
+            received.append(threading.current_thread().name)
+            done.set()
+
+        with ThreadPoolExecutor(1, thread_name_prefix="callbacks") as executor:
+            with BackgroundRunner(
+                coredis.Redis(*redis_basic_server), executor=executor
+            ) as runner:
+                subscription = runner.subscribe(callback, "runner:a")
+                runner.run(runner.client.publish, "runner:a", 1)
+                assert done.wait(1)
+                assert received[0].startswith("callbacks")
+            assert not subscription.running
+            assert not runner.running
+
+    @pytest.mark.min_server_version("6.2.0")
+    def test_monitor(self, runner):
+        commands, done = [], threading.Event()
+
+        def callback(command):
+            commands.append(command.command)
+            done.set()
+
+        monitor = runner.monitor(callback)
+        runner.run(runner.client.get, "runner")
+        assert done.wait(1)
+        monitor.stop()
+        assert "GET" in commands
@@ -2,12 +2,23 @@ from __future__ import annotations
 
 import asyncio
 import threading
+import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from coredis.exceptions import StreamConsumerInitializationError
-from coredis.stream import Consumer, GroupConsumer
+from coredis._utils import nativestr
+from coredis.exceptions import ResponseError, StreamConsumerInitializationError
+from coredis.stream import (
+    Consumer,
+    GroupConsumer,
+    Producer,
+    StreamExporter,
+    StreamImporter,
+    StreamProcessor,
+)
+from coredis.tokens import PureToken
 from tests.conftest import targets
 
 
@@ -251,6 +262,331 @@ class TestStreamConsumers:
                 consumed.add(int(entry[1].field_values[_s("id")]))
         assert set(expected) == consumed
 
+    async def test_single_consumer_get_entries(self, client, _s):
+        consumer = await Consumer(client, ["{a}1", "{a}2"], buffer_size=9)
+        [await client.xadd("{a}1", {"id": i}) for i in range(15)]
+        [await client.xadd("{a}2", {"id": i}) for i in range(5)]
+        entries = await consumer.get_entries(12)
+        assert len(entries) == 12
+        entries.extend(await consumer.get_entries())
+        consumed = {}
+        for stream, entry in entries:
+            consumed.setdefault(stream, []).append(int(entry.field_values[_s("id")]))
+        assert consumed == {_s("{a}1"): list(range(10)), _s("{a}2"): list(range(5))}
+        entries = await consumer.get_entries()
+        assert [int(entry.field_values[_s("id")]) for _, entry in entries] == list(
+            range(10, 15)
+        )
+        assert await consumer.get_entries() == []
+
+    async def test_consumer_get_entries_across_slots(self, client, _s):
+        consumer = await Consumer(client, ["a", "b"], buffer_size=9)
+        [await client.xadd("a", {"id": i}) for i in range(15)]
+        [await client.xadd("b", {"id": i}) for i in range(5)]
+        entries = await consumer.get_entries(3)
+        assert len(entries) == 3
+        while True:
+            batch = await consumer.get_entries()
+            if not batch:
+                break
+            assert len(batch) <= 20
+            entries.extend(batch)
+        consumed = {}
+        for stream, entry in entries:
+            consumed.setdefault(stream, []).append(int(entry.field_values[_s("id")]))
+        assert consumed == {_s("a"): list(range(15)), _s("b"): list(range(5))}
+        assert await consumer.get_entries() == []
+
+    async def test_non_blocking_consumer_reads_new_entries(self, client, _s):
+        consumer = await Consumer(client, ["a", "b"])
+        read = consumer._read
+
+        async def delayed_read(streams):
+            if "b" in streams:
+                await asyncio.sleep(0.05)
+            return await read(streams)
+
+        consumer._read = delayed_read
+        await client.xadd("a", {"id": 1})
+        stream, entry = await consumer.get_entry()
+        assert stream == _s("a")
+        assert entry.field_values == {_s("id"): _s(1)}
+        await asyncio.sleep(0.1)
+        await client.xadd("b", {"id": 2})
+        stream, entry = await consumer.get_entry()
+        assert stream == _s("b")
+        assert entry.field_values == {_s("id"): _s(2)}
+        assert await consumer.get_entry() == (None, None)
+
+    async def test_group_consumer_batches(self, client, _s):
+        consumer = await GroupConsumer(
+            client, ["a", "b"], "group-a", "consumer-a", buffer_size=4
+        )
+        [await client.xadd("a", {"id": i}) for i in range(10)]
+        [await client.xadd("b", {"id": i}) for i in range(10)]
+        consumed = {}
+        async for batch in consumer.batches(max_count=3):
+            assert 0 < len(batch) <= 3
+            for stream, entry in batch:
+                consumed.setdefault(stream, []).append(
+                    int(entry.field_values[_s("id")])
+                )
+        assert consumed == {_s("a"): list(range(10)), _s("b"): list(range(10))}
+        assert (None, None) == await consumer.get_entry()
+
+    async def test_group_consumer_ack(self, client, _s):
+        consumer = await GroupConsumer(
+            client, ["a", "b"], "group-a", "consumer-a", ack_batch_size=15
+        )
+        [await client.xadd("a", {"id": i}) for i in range(10)]
+        [await client.xadd("b", {"id": i}) for i in range(10)]
+        async for stream, entry in consumer:
+            await consumer.ack(stream, entry)
+        assert consumer.acknowledgements.metrics.flushes == 1
+        assert consumer.acknowledgements.metrics.pending == 5
+        assert (await client.xpending("a", "group-a")).pending + (
+            await client.xpending("b", "group-a")
+        ).pending == 5
+        await consumer.close()
+        metrics = consumer.acknowledgements.metrics
+        assert metrics.pending == 0
+        assert metrics.acknowledged == 20
+        assert 0 < metrics.last_flush_latency <= metrics.max_flush_latency
+        assert (await client.xpending("a", "group-a")).pending == 0
+        assert (await client.xpending("b", "group-a")).pending == 0
+
+    async def test_group_consumer_ack_interval(self, client, _s):
+        consumer = await GroupConsumer(
+            client, ["a"], "group-a", "consumer-a", ack_interval=0.1
+        )
+        [await client.xadd("a", {"id": i}) for i in range(3)]
+        async for stream, entry in consumer:
+            await consumer.ack(stream, entry.identifier)
+        assert (await client.xpending("a", "group-a")).pending == 3
+        await asyncio.sleep(0.2)
+        assert (await client.xpending("a", "group-a")).pending == 0
+        assert consumer.acknowledgements.metrics.flushes == 1
+        assert await consumer.flush_acks() == 0
+
+    @pytest.mark.min_server_version("6.2.0")
+    async def test_group_consumer_reclaim(self, client, _s):
+        crashed = await GroupConsumer(
+            client, ["a"], "group-a", "consumer-a", buffer_size=9
+        )
+        [await client.xadd("a", {"id": i}) for i in range(10)]
+        assert len(await crashed.get_entries()) == 10
+        consumer = await GroupConsumer(
+            client,
+            ["a"],
+            "group-a",
+            "consumer-b",
+            buffer_size=9,
+            reclaim_min_idle=50,
+            reclaim_interval=0.01,
+            reclaim_count=4,
+            ack_batch_size=1,
+        )
+        [await client.xadd("a", {"id": i}) for i in range(10, 13)]
+        await asyncio.sleep(0.2)
+        batches = []
+        async for batch in consumer.batches():
+            batches.append([int(entry.field_values[_s("id")]) for _, entry in batch])
+            for stream, entry in batch:
+                await consumer.ack(stream, entry)
+            await asyncio.sleep(0.05)
+        await consumer.close()
+        assert batches[:3] == [[10, 11, 12], [0, 1, 2, 3], [4, 5, 6, 7]]
+        assert sorted(sum(batches, [])) == list(range(13))
+        assert (await client.xpending("a", "group-a")).pending == 0
+
+    @pytest.mark.min_server_version("6.2.0")
+    async def test_group_consumer_reclaim_same_identifiers(self, client, _s):
+        crashed = await GroupConsumer(
+            client, ["a", "b"], "group-a", "consumer-a", buffer_size=9
+        )
+        for i in range(1, 4):
+            await client.xadd("a", {"id": i}, identifier=f"{i}-0")
+            await client.xadd("b", {"id": i}, identifier=f"{i}-0")
+        read = []
+        while len(read) < 6:
+            read.extend(await crashed.get_entries())
+        consumer = await GroupConsumer(
+            client,
+            ["a", "b"],
+            "group-a",
+            "consumer-b",
+            buffer_size=9,
+            reclaim_min_idle=0,
+            reclaim_interval=0.01,
+            reclaim_count=10,
+        )
+        while sum(len(entries) for entries in consumer.reclaimed.values()) < 6:
+            await asyncio.sleep(0.01)
+        consumed = []
+        async for stream, entry in consumer:
+            consumed.append((nativestr(stream), nativestr(entry.identifier)))
+            # let reclaim passes run while the entry is held and while its
+            # acknowledgement is waiting to be flushed
+            await asyncio.sleep(0.02)
+            await consumer.ack(stream, entry)
+            await asyncio.sleep(0.02)
+        await consumer.close()
+        assert sorted(consumed) == [
+            (stream, f"{i}-0") for stream in ["a", "b"] for i in range(1, 4)
+        ]
+        assert (await client.xpending("a", "group-a")).pending == 0
+        assert (await client.xpending("b", "group-a")).pending == 0
+
+    @pytest.mark.min_server_version("6.2.0")
+    async def test_group_consumer_reclaim_unacknowledged(self, client, _s):
+        consumer = await GroupConsumer(
+            client,
+            ["a"],
+            "group-a",
+            "consumer-a",
+            buffer_size=2,
+            reclaim_min_idle=0,
+            reclaim_interval=0.01,
+            ack_interval=None,
+        )
+        [await client.xadd("a", {"id": i}) for i in range(4)]
+        stream, entry = await consumer.get_entry()
+        await asyncio.sleep(0.05)
+        assert not any(consumer.reclaimed.values())
+        await consumer.ack(stream, entry)
+        await asyncio.sleep(0.05)
+        assert not any(consumer.reclaimed.values())
+        consumed = [int(entry.field_values[_s("id")])]
+        async for stream, entry in consumer:
+            consumed.append(int(entry.field_values[_s("id")]))
+            await consumer.ack(stream, entry)
+        await consumer.close()
+        assert consumed == [0, 1, 2, 3]
+        assert (await client.xpending("a", "group-a")).pending == 0
+
+    async def test_stream_processor_ordered_checkpoints(self, client, _s):
+        consumer = await GroupConsumer(
+            client, ["a", "b"], "group-a", "consumer-a", buffer_size=9
+        )
+        ids = [await client.xadd("a", {"id": i}) for i in range(10)]
+        [await client.xadd("b", {"id": i}) for i in range(10)]
+        first_done = asyncio.Event()
+        processed = []
+
+        async def handler(stream, entry):
+            if stream == _s("a") and entry.identifier == ids[0]:
+                await first_done.wait()
+            processed.append((stream, int(entry.field_values[_s("id")])))
+
+        processor = StreamProcessor(consumer, handler, concurrency=8)
+        run = asyncio.ensure_future(processor.run(drain=True))
+        while len(processed) < 19:
+            await asyncio.sleep(0.01)
+        await consumer.flush_acks()
+        assert _s("a") not in processor.checkpoints
+        assert (await client.xpending("a", "group-a")).pending == 10
+        assert (await client.xpending("b", "group-a")).pending == 0
+        first_done.set()
+        await run
+        assert processor.processed == 20
+        assert processor.checkpoints[_s("a")] == ids[-1]
+        assert (await client.xpending("a", "group-a")).pending == 0
+
+    async def test_stream_processor_failure(self, client, _s):
+        consumer = await Consumer(client, ["a"], buffer_size=9)
+        ids = [await client.xadd("a", {"id": i}) for i in range(10)]
+
+        def handler(stream, entry):
+            if entry.field_values[_s("id")] == _s(3):
+                raise ValueError("failed")
+
+        with ThreadPoolExecutor(1) as executor:
+            processor = StreamProcessor(
+                consumer, handler, concurrency=1, executor=executor
+            )
+            with pytest.raises(ValueError, match="failed"):
+                await processor.run()
+        assert processor.processed == 3
+        assert processor.checkpoints[_s("a")] == ids[2]
+
+    async def test_stream_processor_ack_failure(self, client, _s):
+        consumer = await GroupConsumer(
+            client, ["a"], "group-a", "consumer-a", buffer_size=9
+        )
+        [await client.xadd("a", {"id": i}) for i in range(10)]
+
+        async def ack(stream, *identifiers):
+            raise ResponseError("ack failed")
+
+        consumer.ack = ack
+        processor = StreamProcessor(consumer, lambda stream, entry: None)
+        with pytest.raises(ResponseError, match="ack failed"):
+            await processor.run()
+
+    async def test_producer(self, client, _s):
+        producer = Producer(
+            client,
+            max_batch_size=5,
+            linger=None,
+            trim_strategy=PureToken.MAXLEN,
+            threshold=4,
+            approximate=False,
+        )
+        futures = [await producer.add("a", {"id": i}) for i in range(4)]
+        futures.append(await producer.add("b", {"id": 4}))
+        ids = await asyncio.gather(*futures)
+        assert ids == [entry.identifier for entry in await client.xrange("a")] + [
+            entry.identifier for entry in await client.xrange("b")
+        ]
+        futures = [await producer.add("a", {"id": i}) for i in range(5, 8)]
+        assert producer.buffered == 3
+        await producer.close()
+        assert producer.buffered == 0
+        assert [f.result() for f in futures] == [
+            entry.identifier for entry in await client.xrange("a")
+        ][-3:]
+        assert await client.xlen("a") == 4
+
+    async def test_producer_linger_and_backpressure(self, client, _s):
+        producer = Producer(client, max_batch_size=100, linger=0.01, max_buffered=2)
+        first = await producer.add("a", {"id": 1}, identifier="2-0")
+        second = await producer.add("a", {"id": 2}, identifier="1-0")
+        third = await producer.add("a", {"id": 3})
+        assert first.done() and second.done()
+        assert await first == _s("2-0")
+        with pytest.raises(ResponseError):
+            await second
+        identifier = await third
+        assert [entry.identifier for entry in await client.xrange("a")] == [
+            _s("2-0"),
+            identifier,
+        ]
+
+    async def test_export_and_replay(self, client, _s, tmp_path):
+        [await client.xadd("a", {"id": i, "value": "é"}) for i in range(10)]
+        [await client.xadd("b", {"id": i}) for i in range(5)]
+        exporter = StreamExporter(client, page_size=3, concurrency=2)
+        assert await exporter.export_streams(
+            {"a": tmp_path / "a.ndjson", "b": tmp_path / "b.ndjson"}
+        ) == {"a": 10, "b": 5}
+        assert len((tmp_path / "a.ndjson").read_text().splitlines()) == 10
+        importer = StreamImporter(client, batch_size=4, preserve_identifiers=True)
+        assert await importer.replay(tmp_path / "a.ndjson", stream="c") == 10
+        assert await client.xrange("c") == await client.xrange("a")
+        with pytest.raises(ResponseError):
+            await importer.replay(tmp_path / "a.ndjson", stream="c")
+
+    async def test_export_binary(self, client, _s, tmp_path):
+        ids = [await client.xadd("a", {"id": i}) for i in range(5)]
+        exporter = StreamExporter(client, page_size=2, binary=True)
+        assert await exporter.export("a", tmp_path / "a.ndjson", start=ids[1]) == 4
+        assert await StreamImporter(client, rate=100).replay(tmp_path / "a.ndjson") == 4
+        entries = await client.xrange("a")
+        assert len(entries) == 9
+        assert [e.field_values for e in entries[5:]] == [
+            e.field_values for e in entries[1:5]
+        ]
+
     async def test_single_blocking_consumer(self, client, cloner, _s):
         consumer = await Consumer(client, ["a"], timeout=1000)
         clone = await cloner(client)
@@ -268,6 +604,26 @@ class TestStreamConsumers:
         th.join()
         assert entry.field_values[_s("id")] == _s(1)
 
+    async def test_blocking_consumer_multiple_streams(self, client, cloner, _s):
+        consumer = await Consumer(client, ["a", "b", "c", "{d}1", "{d}2"], timeout=1000)
+        assert len(consumer.chunk_streams()) <= 4
+        clone = await cloner(client)
+
+        async def _inner():
+            await asyncio.sleep(0.2)
+            await clone.xadd("{d}2", {"id": 1})
+
+        start = time.perf_counter()
+        (stream, entry), _ = await asyncio.gather(consumer.get_entry(), _inner())
+        assert time.perf_counter() - start < 1
+        assert stream == _s("{d}2")
+        assert entry.field_values[_s("id")] == _s(1)
+        await client.xadd("a", {"id": 2})
+        stream, entry = await consumer.get_entry()
+        assert stream == _s("a")
+        assert entry.field_values[_s("id")] == _s(2)
+        await consumer.close()
+
     async def test_group_blocking_consumer(self, client, cloner, _s):
         consumer = await GroupConsumer(
             client, ["a"], "group-a", "consumer-a", auto_create=True, timeout=1000
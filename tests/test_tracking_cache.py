@@ -35,11 +35,6 @@ class CommonExamples:
         assert _s(1) == await cached.get("fubar")
         assert _s(1) == await cached.get("fubar")
 
-    @pytest.mark.pypyonly
-    async def test_max_size_skipped(self, client, cloner, _s):
-        with pytest.raises(RuntimeError):
-            self.cache(max_keys=1, max_size_bytes=1)
-
     async def test_eviction(self, client, cloner, _s):
         cache = self.cache(max_keys=1, max_size_bytes=-1)
         cached = await cloner(client, cache=cache)
@@ -127,6 +122,35 @@ class CommonExamples:
         assert set([await clone.get("fubar") for clone in clones]) == set([_s("test")])
         assert all(spy.call_count == 0 for spy in spies)
 
+    async def test_coalesced_misses(self, client, cloner, mocker, _s):
+        cache = self.cache(max_size_bytes=-1)
+        cached = await cloner(client, cache=cache)
+        await client.set("fubar", "test")
+        await cached.get("barbar")
+        spy = mocker.spy(cached, "execute_command")
+        assert set(await asyncio.gather(*(cached.get("fubar") for _ in range(10)))) == {
+            _s("test")
+        }
+        assert spy.call_count == 1
+        assert await cached.get("fubar") == _s("test")
+        assert spy.call_count == 1
+
+    async def test_broadcast_tracking(self, client, cloner, mocker, _s):
+        cache = self.cache(max_size_bytes=-1, prefixes=["tracked:"])
+        assert cache.tracking_prefixes == (b"tracked:",)
+        cached = await cloner(client, cache=cache)
+        await client.set("tracked:fubar", 1)
+        await client.set("fubar", 1)
+        assert await cached.get("tracked:fubar") == _s(1)
+        assert await cached.get("fubar") == _s(1)
+        spy = mocker.spy(cached, "execute_command")
+        assert await cached.get("tracked:fubar") == _s(1)
+        assert await cached.get("fubar") == _s(1)
+        assert spy.call_count == 1
+        await client.incr("tracked:fubar")
+        await asyncio.sleep(0.2)
+        assert await cached.get("tracked:fubar") == _s(2)
+
     async def test_stats(self, client, cloner, mocker, _s):
         cache = self.cache(confidence=0, max_size_bytes=-1)
         cached = await cloner(client, cache=cache)
@@ -193,6 +217,14 @@ class TestProxyInvalidatingCache(CommonExamples):
         _ = await cloner(client, cache=cache)
         assert cache.get_client_id(await client.connection_pool.get_connection()) > 0
 
+    async def test_broadcast_tracking_mode(self, client, cloner, _s):
+        cache = self.cache(max_size_bytes=-1, prefixes=["a:", "b:"])
+        cached = await cloner(client, cache=cache)
+        await cached.get("a:fubar")
+        info = await cached.client_trackinginfo()
+        assert _s("bcast") in info[_s("flags")]
+        assert set(info[_s("prefixes")]) == {_s("a:"), _s("b:")}
+
     async def test_single_entry_cache_tracker_disconnected(self, client, cloner, _s):
         cache = self.cache(max_keys=1, max_size_bytes=-1)
         cached = await cloner(client, cache=cache)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from coredis._utils import EncodingInsensitiveDict
+from coredis._utils import EncodingInsensitiveDict, group_by_slot, hash_slot, hash_slots
 
 
 class TestEncodingInsensitiveDict:
@@ -29,3 +29,27 @@ class TestEncodingInsensitiveDict:
         data[b"a"] = 3
         assert data[b"a"] == data["a"] == 3
         assert len(data) == 2
+
+
+class TestHashSlots:
+    def test_hash_slots(self):
+        keys = [b"fubar", "fubar", "{fu}bar", "fu{}bar", "ü", 1, 2.5]
+        assert hash_slots(keys) == [
+            hash_slot(b"fubar"),
+            hash_slot(b"fubar"),
+            hash_slot(b"fu"),
+            hash_slot(b"fu{}bar"),
+            hash_slot("ü".encode()),
+            hash_slot(b"1"),
+            hash_slot(b"2.5"),
+        ]
+        assert hash_slots(iter([])) == []
+
+    def test_group_by_slot(self):
+        keys = ["{a}1", b"b", "{a}2", "b", 3]
+        assert group_by_slot(keys) == {
+            hash_slot(b"a"): ["{a}1", "{a}2"],
+            hash_slot(b"b"): [b"b", "b"],
+            hash_slot(b"3"): [3],
+        }
+        assert group_by_slot(()) == {}